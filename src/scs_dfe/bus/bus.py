@@ -0,0 +1,96 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The pluggable bus layer: drivers use the scs_host I2C buses and SPI by default, but alternative backends - such as the
+simulator in scs_dfe.sim - may be installed for off-device testing and benchmarking.
+
+I2C backends replace I2C.Sensors, I2C.Utilities and I2C.EEPROM. SPI backends are given as a factory with the
+signature of the scs_host SPI constructor - drivers obtain their SPI instances through Bus.spi(..). Likewise, serial
+backends are given as a factory with the signature of the scs_host HostSerial constructor, and obtained through
+Bus.serial(..).
+"""
+
+from scs_host.bus.i2c import I2C
+from scs_host.bus.spi import SPI
+from scs_host.sys.host_serial import HostSerial
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Bus(object):
+    """
+    classdocs
+    """
+
+    I2C_BUSES = ('Sensors', 'Utilities', 'EEPROM')
+
+    __spi_factory = SPI                                     # callable(dev_path, mode, max_speed)
+    __serial_factory = HostSerial                           # callable(device_identifier, baud_rate)
+    __saved = None                                          # dict of name: backend
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def spi(cls, dev_path, mode, max_speed):
+        return cls.__spi_factory(dev_path, mode, max_speed)
+
+
+    @classmethod
+    def spi_factory(cls):
+        return cls.__spi_factory
+
+
+    @classmethod
+    def serial(cls, device_identifier, baud_rate):
+        return cls.__serial_factory(device_identifier, baud_rate)
+
+
+    @classmethod
+    def serial_factory(cls):
+        return cls.__serial_factory
+
+
+    @classmethod
+    def install(cls, sensors=None, utilities=None, eeprom=None, spi_factory=None, serial_factory=None):
+        """
+        replace any of the default backends - any backend not given is left unchanged
+        """
+        if cls.__saved is None:
+            cls.__saved = {name: getattr(I2C, name, None) for name in cls.I2C_BUSES}
+            cls.__saved['spi'] = cls.__spi_factory
+            cls.__saved['serial'] = cls.__serial_factory
+
+        for name, backend in zip(cls.I2C_BUSES, (sensors, utilities, eeprom)):
+            if backend is not None:
+                setattr(I2C, name, backend)
+
+        if spi_factory is not None:
+            cls.__spi_factory = spi_factory
+
+        if serial_factory is not None:
+            cls.__serial_factory = serial_factory
+
+
+    @classmethod
+    def restore(cls):
+        if cls.__saved is None:
+            return
+
+        for name in cls.I2C_BUSES:
+            setattr(I2C, name, cls.__saved[name])
+
+        cls.__spi_factory = cls.__saved['spi']
+        cls.__serial_factory = cls.__saved['serial']
+        cls.__saved = None
+
+
+    @classmethod
+    def is_installed(cls):
+        return cls.__saved is not None
+
+
+    @classmethod
+    def i2c(cls, name):
+        return getattr(I2C, name, None)
@@ -0,0 +1,148 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A bus profile: BusProfileEntry accumulators, by device and operation, over a period of wall time. The duty of a device
+is the proportion of the period spent waiting for its locks, on the bus, or in its deliberate sleeps.
+
+Devices are named by the innermost lock held at the time of the operation - typically the driver - or by bus and
+address where no lock is held.
+
+example JSON:
+{"elapsed": 60.02, "devices": {"SHT31-0x44": {"duty": 0.0141, "total": {"count": 24, ...},
+"operations": {"lock": {"count": 6, ...}, "read_cmd16": {"count": 6, ...}, "sleep": {"count": 6, ...}}}}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONReport
+
+from scs_dfe.bus.bus_profile_entry import BusProfileEntry
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BusProfile(JSONReport):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return cls()
+
+        entries = OrderedDict()
+
+        for device, device_jdict in jdict.get('devices', {}).items():
+            entries[device] = OrderedDict((operation, BusProfileEntry.construct_from_jdict(entry_jdict))
+                                          for operation, entry_jdict in device_jdict.get('operations', {}).items())
+
+        return cls(entries=entries, elapsed=jdict.get('elapsed', 0.0))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, entries=None, elapsed=0.0):
+        """
+        Constructor
+        """
+        self.__entries = OrderedDict() if entries is None else entries     # dict of device: dict of op: entry
+        self.__elapsed = elapsed                                            # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def entry(self, device, operation):
+        """
+        the entry for the device and operation, created if necessary
+        """
+        if device not in self.__entries:
+            self.__entries[device] = OrderedDict()
+
+        if operation not in self.__entries[device]:
+            self.__entries[device][operation] = BusProfileEntry()
+
+        return self.__entries[device][operation]
+
+
+    def entries(self, device=None, operation=None):
+        """
+        (device, operation, entry) for every entry matching the given device and / or operation
+        """
+        for entry_device, operations in self.__entries.items():
+            if device is not None and entry_device != device:
+                continue
+
+            for entry_operation, entry in operations.items():
+                if operation is not None and entry_operation != operation:
+                    continue
+
+                yield entry_device, entry_operation, entry
+
+
+    def total(self, device=None, operation=None):
+        total = BusProfileEntry()
+
+        for _, _, entry in self.entries(device=device, operation=operation):
+            total.add(entry)
+
+        return total
+
+
+    def duty(self, device):
+        return self.total(device=device).total_time / self.__elapsed if self.__elapsed > 0 else None
+
+
+    def ranking(self):
+        """
+        devices, in descending order of total time
+        """
+        return sorted(self.devices, key=lambda device: self.total(device=device).total_time, reverse=True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['elapsed'] = round(self.elapsed, 3)
+        jdict['devices'] = OrderedDict()
+
+        for device in self.ranking():
+            duty = self.duty(device)
+
+            device_jdict = OrderedDict()
+            device_jdict['duty'] = None if duty is None else round(duty, 4)
+            device_jdict['total'] = self.total(device=device)
+            device_jdict['operations'] = self.__entries[device]
+
+            jdict['devices'][device] = device_jdict
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def devices(self):
+        return list(self.__entries.keys())
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    @elapsed.setter
+    def elapsed(self, elapsed):
+        self.__elapsed = elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BusProfile:{elapsed:%s, devices:%s}" % (self.elapsed, self.devices)
@@ -0,0 +1,144 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Accumulated cost of one operation on one device: calls, lock wait, bus time, deliberate sleep, retries, errors and
+bytes transferred. Times are in seconds.
+
+example JSON:
+{"count": 120, "lock-wait": 0.0021, "bus": 0.0913, "sleep": 1.2, "retries": 0, "errors": 0, "bytes": 720}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BusProfileEntry(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return cls()
+
+        return cls(count=jdict.get('count'), lock_wait=jdict.get('lock-wait'), bus_time=jdict.get('bus'),
+                   sleep_time=jdict.get('sleep'), retries=jdict.get('retries'), errors=jdict.get('errors'),
+                   byte_count=jdict.get('bytes'))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, count=0, lock_wait=0.0, bus_time=0.0, sleep_time=0.0, retries=0, errors=0, byte_count=0):
+        """
+        Constructor
+        """
+        self.__count = count                                # int
+        self.__lock_wait = lock_wait                        # float seconds
+        self.__bus_time = bus_time                          # float seconds
+        self.__sleep_time = sleep_time                      # float seconds
+        self.__retries = retries                            # int
+        self.__errors = errors                              # int
+        self.__byte_count = byte_count                      # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record(self, lock_wait=0.0, bus_time=0.0, sleep_time=0.0, byte_count=0, error=False):
+        self.__count += 1
+
+        self.__lock_wait += lock_wait
+        self.__bus_time += bus_time
+        self.__sleep_time += sleep_time
+        self.__byte_count += byte_count
+
+        if error:
+            self.__errors += 1
+
+
+    def record_retry(self):
+        self.__retries += 1
+
+
+    def add(self, other):
+        self.__count += other.count
+        self.__lock_wait += other.lock_wait
+        self.__bus_time += other.bus_time
+        self.__sleep_time += other.sleep_time
+        self.__retries += other.retries
+        self.__errors += other.errors
+        self.__byte_count += other.byte_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['count'] = self.count
+        jdict['lock-wait'] = round(self.lock_wait, 6)
+        jdict['bus'] = round(self.bus_time, 6)
+        jdict['sleep'] = round(self.sleep_time, 6)
+        jdict['retries'] = self.retries
+        jdict['errors'] = self.errors
+        jdict['bytes'] = self.byte_count
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def lock_wait(self):
+        return self.__lock_wait
+
+
+    @property
+    def bus_time(self):
+        return self.__bus_time
+
+
+    @property
+    def sleep_time(self):
+        return self.__sleep_time
+
+
+    @property
+    def retries(self):
+        return self.__retries
+
+
+    @property
+    def errors(self):
+        return self.__errors
+
+
+    @property
+    def byte_count(self):
+        return self.__byte_count
+
+
+    @property
+    def total_time(self):
+        return self.__lock_wait + self.__bus_time + self.__sleep_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BusProfileEntry:{count:%s, lock_wait:%s, bus_time:%s, sleep_time:%s, retries:%s, errors:%s, " \
+               "byte_count:%s}" % \
+               (self.count, self.lock_wait, self.bus_time, self.sleep_time, self.retries, self.errors,
+                self.byte_count)
@@ -0,0 +1,328 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Opt-in bus instrumentation: while enabled, the installed I2C and SPI backends are wrapped, and Lock.acquire,
+Lock.release and time.sleep are interposed, so that lock wait, bus time, deliberate sleep, retries, errors and bytes
+transferred are accumulated in a BusProfile, by device and operation.
+
+Sleeps within a bus operation (such as the wait of read_cmd) are recorded as sleep, not bus time. Sleeps within
+Lock.acquire are part of the lock wait.
+
+Drivers may report their own retries with BusProfiler.retry(..) - this does nothing unless the profiler is enabled.
+
+If a filename is given, the profile is saved as JSON at most once every flush_interval seconds, and on disable().
+
+Note that the interposition is process-wide, and should not be left enabled in production.
+"""
+
+import json
+import threading
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.bus.bus import Bus
+from scs_dfe.bus.bus_profile import BusProfile
+from scs_dfe.bus.profiled_i2c import ProfiledI2C
+from scs_dfe.bus.profiled_spi import ProfiledSPI
+
+from scs_host.lock.lock import Lock
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BusProfiler(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_FLUSH_INTERVAL =    60.0                # seconds
+
+    UNATTRIBUTED =              'host'
+
+    __active = None                                 # BusProfiler
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def enable(cls, filename=None, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        if cls.__active is None:
+            profiler = cls(filename, flush_interval)
+            profiler.__install()
+
+            cls.__active = profiler
+
+        return cls.__active
+
+
+    @classmethod
+    def disable(cls):
+        """
+        the final profile, or None if the profiler was not enabled
+        """
+        profiler = cls.__active
+
+        if profiler is None:
+            return None
+
+        cls.__active = None
+        profiler.__uninstall()
+        profiler.flush()
+
+        return profiler.report()
+
+
+    @classmethod
+    def active(cls):
+        return cls.__active
+
+
+    @classmethod
+    def retry(cls, device, operation):
+        if cls.__active is not None:
+            cls.__active.record_retry(device, operation)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, flush_interval):
+        """
+        Constructor
+        """
+        self.__filename = filename                          # string
+        self.__flush_interval = flush_interval              # float seconds
+
+        self.__profile = BusProfile()                       # BusProfile
+        self.__mutex = threading.RLock()                    # RLock
+        self.__local = threading.local()                    # per-thread locks held and operation sleep
+
+        self.__start_time = time.monotonic()                # float seconds
+        self.__flush_time = self.__start_time               # float seconds
+
+        self.__saved = None                                 # dict of name: original
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def call(self, bus_device, operation, byte_count, func, *args, **kwargs):
+        """
+        called by the backend wrappers - time func(..), net of any sleep within it
+        """
+        local = self.__state()
+
+        outer_sleep = local.op_sleep
+        outer_in_op = local.in_op
+
+        local.op_sleep = 0.0
+        local.in_op = True
+
+        start_time = time.monotonic()
+        error = False
+
+        try:
+            return func(*args, **kwargs)
+
+        except Exception:
+            error = True
+            raise
+
+        finally:
+            elapsed = time.monotonic() - start_time
+            bus_time = max(0.0, elapsed - local.op_sleep)
+
+            local.op_sleep = outer_sleep + local.op_sleep
+            local.in_op = outer_in_op
+
+            self.__record(self.__device(bus_device), operation, bus_time=bus_time, byte_count=byte_count,
+                          error=error)
+
+
+    def begin_tx(self, bus_device):
+        self.__state().tx = bus_device
+
+
+    def end_tx(self):
+        self.__state().tx = None
+
+
+    def record_retry(self, device, operation):
+        with self.__mutex:
+            self.__profile.entry(device, operation).record_retry()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def report(self):
+        """
+        a snapshot of the profile
+        """
+        with self.__mutex:
+            self.__profile.elapsed = time.monotonic() - self.__start_time
+
+            return BusProfile.construct_from_jdict(json.loads(JSONify.dumps(self.__profile)))
+
+
+    def flush(self):
+        if self.__filename is None:
+            return
+
+        report = self.report()
+        report.save(self.__filename)
+
+        self.__flush_time = time.monotonic()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __install(self):
+        saved = {'installed': Bus.is_installed(), 'spi': Bus.spi_factory(),
+                 'acquire': Lock.__dict__['acquire'], 'release': Lock.__dict__['release'], 'sleep': time.sleep}
+
+        for name in Bus.I2C_BUSES:
+            saved[name] = Bus.i2c(name)
+
+        self.__saved = saved
+
+        # buses...
+        backends = {name.lower(): ProfiledI2C(saved[name], name, self)
+                    for name in Bus.I2C_BUSES if saved[name] is not None}
+
+        spi_factory = saved['spi']
+
+        def profiled_spi(dev_path, mode, max_speed):
+            return ProfiledSPI(spi_factory(dev_path, mode, max_speed), dev_path, self)
+
+        Bus.install(spi_factory=profiled_spi, **backends)
+
+        # locks and sleep...
+        acquire = Lock.acquire
+        release = Lock.release
+        sleep = saved['sleep']
+
+        def profiled_acquire(name, *args, **kwargs):
+            self.__acquire(acquire, name, *args, **kwargs)
+
+        def profiled_release(name, *args, **kwargs):
+            self.__release(release, name, *args, **kwargs)
+
+        def profiled_sleep(seconds):
+            self.__sleep(sleep, seconds)
+
+        Lock.acquire = staticmethod(profiled_acquire)
+        Lock.release = staticmethod(profiled_release)
+        time.sleep = profiled_sleep
+
+
+    def __uninstall(self):
+        saved = self.__saved
+
+        time.sleep = saved['sleep']
+        Lock.acquire = saved['acquire']
+        Lock.release = saved['release']
+
+        if saved['installed']:
+            Bus.install(spi_factory=saved['spi'], **{name.lower(): saved[name] for name in Bus.I2C_BUSES})
+        else:
+            Bus.restore()
+
+        self.__saved = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __acquire(self, acquire, name, *args, **kwargs):
+        local = self.__state()
+        local.in_lock += 1
+
+        start_time = time.monotonic()
+        error = False
+
+        try:
+            acquire(name, *args, **kwargs)
+            local.locks.append(name)
+
+        except Exception:
+            error = True
+            raise
+
+        finally:
+            local.in_lock -= 1
+            self.__record(name, 'lock', lock_wait=time.monotonic() - start_time, error=error)
+
+
+    def __release(self, release, name, *args, **kwargs):
+        local = self.__state()
+
+        if name in local.locks:
+            del local.locks[len(local.locks) - 1 - local.locks[::-1].index(name)]
+
+        release(name, *args, **kwargs)
+
+
+    def __sleep(self, sleep, seconds):
+        local = self.__state()
+
+        start_time = time.monotonic()
+        sleep(seconds)
+        elapsed = time.monotonic() - start_time
+
+        if local.in_lock:
+            return                                          # part of the lock wait
+
+        if local.in_op:
+            local.op_sleep += elapsed
+
+        self.__record(self.__device(local.tx), 'sleep', sleep_time=elapsed)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __record(self, device, operation, **kwargs):
+        with self.__mutex:
+            self.__profile.entry(device, operation).record(**kwargs)
+
+        if self.__filename is not None and time.monotonic() - self.__flush_time >= self.__flush_interval:
+            self.flush()
+
+
+    def __device(self, bus_device):
+        local = self.__state()
+
+        if local.locks:
+            return local.locks[-1]
+
+        return self.UNATTRIBUTED if bus_device is None else bus_device
+
+
+    def __state(self):
+        local = self.__local
+
+        if not hasattr(local, 'locks'):
+            local.locks = []                                # array of string lock names
+            local.in_lock = 0                               # int
+            local.in_op = False                             # bool
+            local.op_sleep = 0.0                            # float seconds
+            local.tx = None                                 # string bus device
+
+        return local
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def flush_interval(self):
+        return self.__flush_interval
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BusProfiler:{filename:%s, flush_interval:%s, profile:%s}" % \
+               (self.filename, self.flush_interval, self.__profile)
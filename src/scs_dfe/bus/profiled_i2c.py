@@ -0,0 +1,114 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An I2C backend wrapper that reports the time and byte count of every operation to a BusProfiler, then delegates to the
+wrapped backend.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ProfiledI2C(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, backend, name, profiler):
+        """
+        Constructor
+        """
+        self.__backend = backend                            # I2C backend
+        self.__name = name                                  # string
+        self.__profiler = profiler                          # BusProfiler
+
+        self.__device = name                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # I2C interface...
+
+    def open(self):
+        self.__backend.open()
+
+
+    def close(self):
+        self.__backend.close()
+
+
+    def start_tx(self, addr):
+        self.__device = "%s-0x%02x" % (self.__name, addr)
+        self.__profiler.begin_tx(self.__device)
+
+        return self.__profiler.call(self.__device, 'start_tx', 0, self.__backend.start_tx, addr)
+
+
+    def end_tx(self):
+        try:
+            return self.__profiler.call(self.__device, 'end_tx', 0, self.__backend.end_tx)
+
+        finally:
+            self.__device = self.__name
+            self.__profiler.end_tx()
+
+
+    def read(self, count):
+        return self.__profiler.call(self.__device, 'read', count, self.__backend.read, count)
+
+
+    def read_cmd(self, cmd, count, wait=None):
+        return self.__profiler.call(self.__device, 'read_cmd', 1 + count, self.__backend.read_cmd, cmd, count,
+                                    wait=wait)
+
+
+    def read_cmd16(self, cmd, count, wait=None):
+        return self.__profiler.call(self.__device, 'read_cmd16', 2 + count, self.__backend.read_cmd16, cmd, count,
+                                    wait=wait)
+
+
+    def write(self, *values):
+        return self.__profiler.call(self.__device, 'write', len(values), self.__backend.write, *values)
+
+
+    def write16(self, value):
+        return self.__profiler.call(self.__device, 'write16', 2, self.__backend.write16, value)
+
+
+    def write_addr(self, addr, *values):
+        return self.__profiler.call(self.__device, 'write_addr', 1 + len(values), self.__backend.write_addr, addr,
+                                    *values)
+
+
+    def write_addr16(self, addr, *values):
+        return self.__profiler.call(self.__device, 'write_addr16', 2 + len(values), self.__backend.write_addr16,
+                                    addr, *values)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self.__backend, name)               # bus, and any backend-specific attributes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def backend(self):
+        return self.__backend
+
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ProfiledI2C:{name:%s, backend:%s}" % (self.name, self.backend)
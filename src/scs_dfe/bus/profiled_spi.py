@@ -0,0 +1,72 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An SPI backend wrapper that reports the time and byte count of every transfer to a BusProfiler, then delegates to the
+wrapped backend.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ProfiledSPI(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, backend, dev_path, profiler):
+        """
+        Constructor
+        """
+        self.__backend = backend                            # SPI backend
+        self.__dev_path = dev_path                          # string
+        self.__profiler = profiler                          # BusProfiler
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # SPI interface...
+
+    def open(self):
+        return self.__profiler.call(self.__dev_path, 'open', 0, self.__backend.open)
+
+
+    def close(self):
+        return self.__profiler.call(self.__dev_path, 'close', 0, self.__backend.close)
+
+
+    def xfer(self, values):
+        return self.__profiler.call(self.__dev_path, 'xfer', len(values), self.__backend.xfer, values)
+
+
+    def read_bytes(self, count):
+        return self.__profiler.call(self.__dev_path, 'read_bytes', count, self.__backend.read_bytes, count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self.__backend, name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def backend(self):
+        return self.__backend
+
+
+    @property
+    def dev_path(self):
+        return self.__dev_path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ProfiledSPI:{dev_path:%s, backend:%s}" % (self.dev_path, self.backend)
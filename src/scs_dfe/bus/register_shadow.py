@@ -0,0 +1,143 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A shadow of one or more device registers, in named shared memory, so that every process that drives a device knows
+its last-written state, and can skip writes that would not change it.
+
+The segment is created by the first process to need it, and persists until reboot - when the device is reset anyway.
+A newly-created shadow is invalid: the state of the device is unknown until it is written or read. Callers should
+invalidate the shadow if a bus error leaves the state of the device in doubt.
+
+Updates are not atomic across processes: callers must hold the device's cross-process lock.
+
+layout:
+valid flags (uint8 per register), values (uint32 per register)
+
+https://docs.python.org/3/library/multiprocessing.shared_memory.html
+"""
+
+import struct
+
+from multiprocessing import resource_tracker, shared_memory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RegisterShadow(object):
+    """
+    classdocs
+    """
+
+    __PREFIX =      'scs_dfe_'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, name, size=1):
+        layout = struct.Struct('<%dB%dI' % (size, size))
+        shm_name = cls.__PREFIX + name
+
+        try:
+            shm = cls.__attach(shm_name)
+
+        except FileNotFoundError:
+            try:
+                shm = shared_memory.SharedMemory(name=shm_name, create=True, size=layout.size)
+                cls.__untrack(shm)
+
+            except FileExistsError:
+                shm = cls.__attach(shm_name)                                # created by another process meanwhile
+
+        return cls(shm, name, size)
+
+
+    @classmethod
+    def __attach(cls, shm_name):
+        try:
+            return shared_memory.SharedMemory(name=shm_name, track=False)      # Python 3.13+
+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            cls.__untrack(shm)
+
+            return shm
+
+
+    @staticmethod
+    def __untrack(shm):
+        try:
+            resource_tracker.unregister(shm._name, 'shared_memory')         # the segment outlives this process
+
+        except (AttributeError, KeyError):
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, shm, name, size):
+        """
+        Constructor
+        """
+        self.__shm = shm                                    # SharedMemory
+        self.__name = name                                  # string
+        self.__size = size                                  # int
+
+        self.__values_offset = size                         # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def get(self, index=0):
+        """
+        the last-known value of the register, or None if it is not known
+        """
+        if not self.__shm.buf[index]:
+            return None
+
+        return struct.unpack_from('<I', self.__shm.buf, self.__values_offset + index * 4)[0]
+
+
+    def set(self, value, index=0):
+        struct.pack_into('<I', self.__shm.buf, self.__values_offset + index * 4, value)
+        self.__shm.buf[index] = 1
+
+
+    def invalidate(self, index=None):
+        for i in range(self.__size) if index is None else (index, ):
+            self.__shm.buf[i] = 0
+
+
+    def is_valid(self, index=0):
+        return bool(self.__shm.buf[index])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        self.__shm.close()
+
+
+    def unlink(self):
+        self.__shm.unlink()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        values = [self.get(index) for index in range(self.size)]
+
+        return "RegisterShadow:{name:%s, size:%s, values:%s}" % (self.name, self.size, values)
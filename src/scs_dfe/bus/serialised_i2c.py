@@ -0,0 +1,99 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An I2C backend wrapper that serialises transactions between threads: start_tx(..) waits until no other thread has a
+transaction open on the bus, and end_tx() releases it. Drivers that run concurrently can then share the bus, while
+the waits between their transactions - such as conversion times - overlap.
+
+A transaction should not span a long wait, since it blocks every other device on the bus: drivers that are sampled
+concurrently - such as the SHT31, ICP10101 and DSI drivers - end the transaction that starts a measurement, and start
+another to read it. A driver whose wait is within a single backend call, such as read_cmd(..) with a wait, holds the
+bus for that wait, and is serialised with every other device.
+"""
+
+import threading
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SerialisedI2C(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, backend):
+        """
+        Constructor
+        """
+        self.__backend = backend                            # I2C backend
+
+        self.__mutex = threading.Lock()                     # Lock
+        self.__local = threading.local()                    # per-thread transaction state
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # I2C interface...
+
+    def open(self):
+        self.__backend.open()
+
+
+    def close(self):
+        self.__backend.close()
+
+
+    def start_tx(self, addr):
+        if not self.__owner():
+            self.__mutex.acquire()
+            self.__local.owner = True
+
+        try:
+            self.__backend.start_tx(addr)
+
+        except BaseException:
+            self.__release()
+            raise
+
+
+    def end_tx(self):
+        try:
+            self.__backend.end_tx()
+
+        finally:
+            self.__release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __owner(self):
+        return getattr(self.__local, 'owner', False)
+
+
+    def __release(self):
+        if self.__owner():                                  # a driver may end a transaction it did not start
+            self.__local.owner = False
+            self.__mutex.release()
+
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self.__backend, name)               # read, write and any backend-specific attributes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def backend(self):
+        return self.__backend
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SerialisedI2C:{backend:%s}" % self.backend
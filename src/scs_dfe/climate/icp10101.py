@@ -11,11 +11,12 @@ import time
 
 from scs_core.climate.icp10101_datum import ICP10101Datum
 
-from scs_core.data.crc import crc8
 from scs_core.data.datum import Decode
 
+from scs_dfe.data.crc8 import CRC8
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
+
 from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -72,10 +73,9 @@ class ICP10101(object):
 
 
     @classmethod
-    def __crc_check(cls, chars, *indices):
-        for index in indices:
-            if chars[index] != crc8(chars[index - 2:index]):
-                raise ValueError(['0x%02x' % char for char in chars])
+    def __crc_check(cls, chars):
+        if not CRC8.is_valid(chars):
+            raise ValueError(['0x%02x' % char for char in chars])
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -101,7 +101,7 @@ class ICP10101(object):
             self.__constants = []
             for _ in range(4):
                 chars = I2C.Sensors.read_cmd16(self.__CMD_OTP_READ, 3)
-                self.__crc_check(chars, 2)
+                self.__crc_check(chars)
 
                 self.__constants.append(Decode.int(chars[:2], '>'))
 
@@ -113,13 +113,22 @@ class ICP10101(object):
     def sample(self, altitude=None, include_temp=True):
         try:
             self.obtain_lock()
-            I2C.Sensors.start_tx(self.addr)
 
-            I2C.Sensors.write16(self.__CMD_MEASURE_ULN)
-            time.sleep(self.__CONVERSION_TIME)
+            try:
+                I2C.Sensors.start_tx(self.addr)
+                I2C.Sensors.write16(self.__CMD_MEASURE_ULN)
+            finally:
+                I2C.Sensors.end_tx()
+
+            time.sleep(self.__CONVERSION_TIME)              # the bus is free for other devices
 
-            chars = I2C.Sensors.read(9)
-            self.__crc_check(chars, 2, 5, 8)
+            try:
+                I2C.Sensors.start_tx(self.addr)
+                chars = I2C.Sensors.read(9)
+            finally:
+                I2C.Sensors.end_tx()
+
+            self.__crc_check(chars)
 
             t_count = chars[0] << 8 ^ chars[1]
             temp = round(self.__temperature(t_count), 1)
@@ -130,7 +139,6 @@ class ICP10101(object):
             return ICP10101Datum.construct(actual_press, temp, altitude, include_temp=include_temp)
 
         finally:
-            I2C.Sensors.end_tx()
             self.release_lock()
 
 
@@ -140,7 +148,7 @@ class ICP10101(object):
             I2C.Sensors.start_tx(self.addr)
 
             chars = I2C.Sensors.read_cmd16(self.__CMD_READ_ID, 3)
-            self.__crc_check(chars, 2)
+            self.__crc_check(chars)
 
             return chars[1] & 0x3f
 
@@ -170,11 +178,11 @@ class ICP10101(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def obtain_lock(self):
-        Lock.acquire(self.__class__.__name__, self.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(self.__class__.__name__, self.__LOCK_TIMEOUT)
 
 
     def release_lock(self):
-        Lock.release(self.__class__.__name__)
+        HierarchicalLock.release(self.__class__.__name__)
 
 
     # ----------------------------------------------------------------------------------------------------------------
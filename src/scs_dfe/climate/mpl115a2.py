@@ -19,8 +19,7 @@ import time
 from scs_core.climate.mpl115a2_datum import MPL115A2Datum
 
 from scs_dfe.climate.mpl115a2_reg import MPL115A2Reg
-
-from scs_host.lock.lock import Lock
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -115,11 +114,11 @@ class MPL115A2(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def obtain_lock(self):
-        Lock.acquire(self.__class__.__name__, self.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(self.__class__.__name__, self.__LOCK_TIMEOUT)
 
 
     def release_lock(self):
-        Lock.release(self.__class__.__name__)
+        HierarchicalLock.release(self.__class__.__name__)
 
 
     # ----------------------------------------------------------------------------------------------------------------
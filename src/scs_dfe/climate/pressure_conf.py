@@ -5,12 +5,13 @@ Created on 9 Jul 2021
 
 example JSON:
 {"model": "ICP", "altitude": 100}
+
+The sensor classes are registered by name, and imported only when the configured model is used.
 """
 
 from scs_core.climate.pressure_conf import PressureConf as AbstractPressureConf
 
-from scs_dfe.climate.icp10101 import ICP10101
-from scs_dfe.climate.mpl115a2 import MPL115A2
+from scs_dfe.data.class_registry import ClassRegistry
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -20,6 +21,11 @@ class PressureConf(AbstractPressureConf):
     classdocs
     """
 
+    __SENSORS = ClassRegistry({
+        'ICP':  ('scs_dfe.climate.icp10101', 'ICP10101'),
+        'MPL':  ('scs_dfe.climate.mpl115a2', 'MPL115A2')
+    })
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -29,7 +35,7 @@ class PressureConf(AbstractPressureConf):
 
     @classmethod
     def models(cls):
-        return ICP10101.NAME, MPL115A2.NAME
+        return cls.__SENSORS.names()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -44,14 +50,16 @@ class PressureConf(AbstractPressureConf):
     # ----------------------------------------------------------------------------------------------------------------
 
     def sensor(self, mpl_calib):
-        if self.model == ICP10101.NAME:
-            return ICP10101(ICP10101.DEFAULT_ADDR)
+        if self.model not in self.__SENSORS:
+            raise ValueError(self.model)
+
+        sensor_class = self.__SENSORS.resolve(self.model)
 
-        if self.model == MPL115A2.NAME:
+        if self.model == 'MPL':
             c25 = None if mpl_calib is None else mpl_calib.c25
-            return MPL115A2(c25)
+            return sensor_class(c25)
 
-        raise ValueError(self.model)
+        return sensor_class(sensor_class.DEFAULT_ADDR)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -88,17 +88,23 @@ class SHT31(object):
 
         try:
             I2C.Sensors.start_tx(self.__addr)
-            temp_msb, temp_lsb, _, humid_msb, humid_lsb, _ = I2C.Sensors.read_cmd16(self.__CMD_READ_SINGLE_HIGH, 6,
-                                                                                    wait=self.MEASUREMENT_DURATION)
-
-            raw_humid = (humid_msb << 8) | humid_lsb
-            raw_temp = (temp_msb << 8) | temp_lsb
+            I2C.Sensors.write16(self.__CMD_READ_SINGLE_HIGH)
+        finally:
+            I2C.Sensors.end_tx()
 
-            return SHTDatum(self.humid(raw_humid), self.temp(raw_temp))
+        time.sleep(self.MEASUREMENT_DURATION)               # the bus is free for other devices
 
+        try:
+            I2C.Sensors.start_tx(self.__addr)
+            temp_msb, temp_lsb, _, humid_msb, humid_lsb, _ = I2C.Sensors.read(6)
         finally:
             I2C.Sensors.end_tx()
 
+        raw_humid = (humid_msb << 8) | humid_lsb
+        raw_temp = (temp_msb << 8) | temp_lsb
+
+        return SHTDatum(self.humid(raw_humid), self.temp(raw_temp))
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
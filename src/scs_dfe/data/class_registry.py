@@ -0,0 +1,77 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A registry of names to classes, each given by its module and class name. A class's module is imported on the first
+lookup of the class, so that a conf that names one hardware model does not import the drivers of all the others.
+
+example:
+registry = ClassRegistry({'ICP': ('scs_dfe.climate.icp10101', 'ICP10101')})
+icp_class = registry.resolve('ICP')
+"""
+
+import importlib
+import threading
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ClassRegistry(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, entries):
+        """
+        Constructor
+        """
+        self.__entries = OrderedDict(entries)               # OrderedDict of name: (module name, class name)
+        self.__classes = {}                                 # dict of name: class
+
+        self.__guard = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def resolve(self, name):
+        try:
+            return self.__classes[name]
+
+        except KeyError:
+            pass
+
+        if name not in self.__entries:
+            raise ValueError('unknown model: %s' % name)
+
+        module_name, class_name = self.__entries[name]
+
+        with self.__guard:
+            resolved = getattr(importlib.import_module(module_name), class_name)
+            self.__classes[name] = resolved
+
+        return resolved
+
+
+    def is_loaded(self, name):
+        return name in self.__classes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def names(self):
+        return tuple(self.__entries.keys())
+
+
+    def __contains__(self, name):
+        return name in self.__entries
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ClassRegistry:{names:%s, loaded:%s}" % (list(self.names()), sorted(self.__classes.keys()))
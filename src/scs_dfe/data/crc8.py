@@ -0,0 +1,116 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Table-driven CRC-8, polynomial 0x31, initialisation 0xff, as used by Sensirion (SCD30, SPS30) and TDK (ICP-10101)
+devices. Device responses are 16-bit words, each followed by its CRC - a whole response is validated, decoded or
+encoded in a single pass.
+
+https://sensirion.com/media/documents/8DF7E6E5/616E3EB7/Sensirion_Particulate_Matter_AppNotes_SPS30_I2C_CRC.pdf
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CRC8(object):
+    """
+    classdocs
+    """
+
+    POLYNOMIAL =        0x31
+    INIT =              0xff
+
+    WORD_LENGTH =       2
+    GROUP_LENGTH =      3                                   # word + CRC
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __build_table(polynomial):
+        table = []
+
+        for byte in range(256):
+            crc = byte
+
+            for _ in range(8):
+                crc = ((crc << 1) ^ polynomial if crc & 0x80 else (crc << 1)) & 0xff
+
+            table.append(crc)
+
+        return tuple(table)
+
+
+    __TABLE = __build_table.__func__(POLYNOMIAL)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def crc(cls, data):
+        table = cls.__TABLE
+        crc = cls.INIT
+
+        for byte in data:
+            crc = table[crc ^ byte]
+
+        return crc
+
+
+    @classmethod
+    def is_valid(cls, chars):
+        """
+        True if every word in chars is followed by its correct CRC
+        """
+        table = cls.__TABLE
+
+        if len(chars) % cls.GROUP_LENGTH != 0:
+            return False
+
+        for i in range(0, len(chars), cls.GROUP_LENGTH):
+            if table[table[cls.INIT ^ chars[i]] ^ chars[i + 1]] != chars[i + 2]:
+                return False
+
+        return True
+
+
+    @classmethod
+    def decode(cls, chars):
+        """
+        the words of chars, with CRCs removed - raises ValueError on a bad CRC
+        """
+        table = cls.__TABLE
+        decoded = []
+
+        if len(chars) % cls.GROUP_LENGTH != 0:
+            raise ValueError("bad length: %d" % len(chars))
+
+        for i in range(0, len(chars), cls.GROUP_LENGTH):
+            required = table[table[cls.INIT ^ chars[i]] ^ chars[i + 1]]
+
+            if required != chars[i + 2]:
+                raise ValueError("bad checksum: required: 0x%02x actual: 0x%02x" % (required, chars[i + 2]))
+
+            decoded.append(chars[i])
+            decoded.append(chars[i + 1])
+
+        return decoded
+
+
+    @classmethod
+    def encode(cls, chars):
+        """
+        the words of chars, each followed by its CRC
+        """
+        table = cls.__TABLE
+        encoded = []
+
+        if len(chars) % cls.WORD_LENGTH != 0:
+            raise ValueError("bad length: %d" % len(chars))
+
+        for i in range(0, len(chars), cls.WORD_LENGTH):
+            encoded.append(chars[i])
+            encoded.append(chars[i + 1])
+            encoded.append(table[table[cls.INIT ^ chars[i]] ^ chars[i + 1]])
+
+        return encoded
@@ -2,13 +2,22 @@
 Created on 22 Jul 2016
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+In continuous-conversion mode, the comparator is configured as a conversion-ready signal: with the MSB of the high
+threshold set and the MSB of the low threshold clear, ALERT/RDY pulses at the end of each conversion. The pulse lasts
+only ~8 us, so it cannot be polled as a level - the host must latch the falling edge (for example, a GPIO edge event),
+and the ready callable must report and clear that latch. Where the pin is not available to the host, conversions are
+paced by the data rate.
+
+https://www.ti.com/lit/ds/symlink/ads1115.pdf
 """
 
 import struct
 import time
 
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
+
 from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -74,9 +83,16 @@ class ADS1115(object):
     __COMP_QUEUE_0 =    0x0003      # ---- ---- ---- --11    (default)
 
 
+    __RDY_LO_THRESH =   0x0000
+    __RDY_HI_THRESH =   0x8000
+
     __GAIN =            None
     __FULL_SCALE =      None
     __TCONV =           None
+    __SPS =             None
+
+    __RATE_TOLERANCE =  1.1         # the internal oscillator is accurate to +/- 10%
+    __READY_POLL =      0.001       # seconds
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -117,6 +133,17 @@ class ADS1115(object):
                         ADS1115.RATE_860:   0.021
                     }
 
+        cls.__SPS = {
+                        ADS1115.RATE_8:     8,
+                        ADS1115.RATE_16:    16,
+                        ADS1115.RATE_32:    32,
+                        ADS1115.RATE_64:    64,
+                        ADS1115.RATE_128:   128,
+                        ADS1115.RATE_250:   250,
+                        ADS1115.RATE_475:   475,
+                        ADS1115.RATE_860:   860
+                    }
+
 
     @classmethod
     def gain(cls, index):
@@ -203,8 +230,85 @@ class ADS1115(object):
         return v
 
 
+    def stream(self, muxes, gain, per_channel=1, count=None, ready=None):
+        """
+        continuous conversion, visiting each mux in turn for per_channel conversions
+        yields (timestamp, mux, v) - the config is written only when the mux changes
+        count limits the total number of conversions
+        ready is an optional callable that returns True once for each latched ALERT/RDY edge, and clears the latch -
+        it must not sample the pin level, since the pulse is too short to be seen by polling
+        the lock is held until the generator is exhausted or closed
+        """
+        if per_channel < 1:
+            raise ValueError(per_channel)
+
+        self.__gain = gain
+
+        period = self.__RATE_TOLERANCE / ADS1115.__SPS[self.__rate]
+        next_time = None
+        yielded = 0
+
+        self.obtain_lock()
+
+        try:
+            self.__write_register(ADS1115.__REG_LO_THRESH, ADS1115.__RDY_LO_THRESH)
+            self.__write_register(ADS1115.__REG_HI_THRESH, ADS1115.__RDY_HI_THRESH)
+
+            while True:
+                for mux in muxes:
+                    config = ADS1115.__MODE_CONT | mux | gain | self.__rate | ADS1115.__COMP_QUEUE_1
+
+                    if len(muxes) > 1 or next_time is None:
+                        self.__write_config(config)                 # a mux change restarts conversion
+                        next_time = time.time() + period
+
+                        if ready is not None:
+                            ready()                                 # discard an edge from the previous mux
+
+                    for _ in range(per_channel):
+                        if count is not None and yielded >= count:
+                            return
+
+                        self.__wait_for_conversion(next_time, period, ready)
+                        next_time += period
+
+                        yield time.time(), mux, self.__read_conv()
+                        yielded += 1
+
+        finally:
+            try:
+                self.__write_config(self.__config)                  # back to single-shot: powers down
+
+            finally:
+                self.release_lock()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
+    @staticmethod
+    def __wait_for_conversion(next_time, period, ready):
+        if ready is None:
+            time.sleep(max(0.0, next_time - time.time()))
+            return
+
+        timeout_time = next_time + period
+
+        while not ready():                                  # edge-latched: consumes the edge
+            if time.time() > timeout_time:
+                raise TimeoutError("ADS1115:stream: ALERT/RDY not asserted.")
+
+            time.sleep(ADS1115.__READY_POLL)
+
+
+    def __write_register(self, reg, value):
+        try:
+            I2C.Sensors.start_tx(self.__addr)
+            I2C.Sensors.write(reg, value >> 8, value & 0xff)
+
+        finally:
+            I2C.Sensors.end_tx()
+
+
     def __read_config(self):
         try:
             I2C.Sensors.start_tx(self.__addr)
@@ -249,18 +353,23 @@ class ADS1115(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def obtain_lock(self):
-        Lock.acquire(self.__lock_name, ADS1115.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(self.lock_name, ADS1115.__LOCK_TIMEOUT)
 
 
     def release_lock(self):
-        Lock.release(self.__lock_name)
+        HierarchicalLock.release(self.lock_name)
 
 
     @property
-    def __lock_name(self):
+    def lock_name(self):
         return "%s-0x%02x" % (self.__class__.__name__, self.__addr)
 
 
+    @property
+    def lock_timeout(self):
+        return ADS1115.__LOCK_TIMEOUT
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -278,6 +387,11 @@ class ADS1115(object):
         return ADS1115.__TCONV[self.__rate]
 
 
+    @property
+    def sps(self):
+        return ADS1115.__SPS[self.__rate]
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
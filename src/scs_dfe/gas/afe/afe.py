@@ -7,6 +7,27 @@ Analog Front-End (AFE)
 
 Warning: If an Ox sensor is present, the NO2 sensor must have a lower sensor number (SN) than the Ox sensor,
 otherwise the NO2 cross-sensitivity concentration will not be found.
+
+In pipelined mode, sample() acquires all the raw voltages before any datum is constructed: the Pt1000 conversion
+overlaps the first gas conversions, and the next channel's conversion is started on both ADCs immediately after the
+previous channel is read from both, so that the WE and AE conversions overlap, and no time is spent between them. The
+electrochem callbacks then return the acquired voltages.
+
+In either mode, each channel may be oversampled - a higher ADS1115 rate with averaging - using ADS1115 continuous
+conversion, so that there is no config write per reading.
+
+Each conversion is a HierarchicalLock transaction on the ADCs that it uses, so that their file locks are taken once per
+conversion, rather than once per register access, and are free for other processes between conversions.
+
+With a GasChannelFilter, each gas reading is made of the filter's oversampling count of conversions, and is filtered
+before the electrochem callbacks return it. The filter keeps its state per sensor, across cycles, in either mode. The
+filter's oversampling is then the only oversampling - an AFE oversampling greater than 1 is rejected. When
+sample_station() reads the NO2 sensor for the Ox cross-sensitivity, that reading is oversampled but not filtered, so
+that the NO2 filter state advances only when the NO2 sensor itself is sampled.
+
+The Pt1000 is read once per cycle, into an AFETempContext. With temp_tolerance set, back-to-back cycles - for example,
+successive sample_station() calls - reuse the context while it is no older than the tolerance. The freshness of the
+context is found once, at the start of the cycle.
 """
 
 import time
@@ -15,8 +36,11 @@ from scs_core.data.str import Str
 from scs_core.gas.afe.afe_datum import AFEDatum
 
 from scs_dfe.gas.afe.ads1115 import ADS1115
+from scs_dfe.gas.afe.afe_cycle_stats import AFECycleStats
+from scs_dfe.gas.afe.afe_temp_context import AFETempContext
 from scs_dfe.gas.afe.mcp342x import MCP342X
 from scs_dfe.gas.gas_sensor_interface import GasSensorInterface
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -34,7 +58,10 @@ class AFE(GasSensorInterface):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    __RATE = ADS1115.RATE_8
+    DEFAULT_RATE = ADS1115.RATE_8
+    DEFAULT_OVERSAMPLING = 1
+    DEFAULT_TEMP_TOLERANCE = 0.0                        # seconds - a new temperature context for every cycle
+
     __MUX = (ADS1115.MUX_A3_GND, ADS1115.MUX_A2_GND, ADS1115.MUX_A1_GND, ADS1115.MUX_A0_GND)
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -50,20 +77,40 @@ class AFE(GasSensorInterface):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, interface, pt1000, sensors):
+    def __init__(self, interface, pt1000, sensors, pipelined=False, rate=DEFAULT_RATE,
+                 oversampling=DEFAULT_OVERSAMPLING, temp_tolerance=DEFAULT_TEMP_TOLERANCE, channel_filter=None):
         """
         Constructor
         """
+        if oversampling < 1:
+            raise ValueError(oversampling)
+
+        if oversampling > 1 and channel_filter is not None:
+            raise ValueError("oversampling: use the channel filter's oversampling")
+
         self.__pt1000 = pt1000
         self.__sensors = sensors
 
-        self.__wrk_adc = None if not sensors else ADS1115(ADS1115.ADDR_WRK, AFE.__RATE)
-        self.__aux_adc = None if not sensors else ADS1115(ADS1115.ADDR_AUX, AFE.__RATE) if sensors else None
+        self.__pipelined = bool(pipelined)
+        self.__oversampling = int(oversampling)
+        self.__temp_tolerance = float(temp_tolerance)
+        self.__channel_filter = channel_filter          # GasChannelFilter
+
+        self.__wrk_adc = None if not sensors else ADS1115(ADS1115.ADDR_WRK, rate)
+        self.__aux_adc = None if not sensors else ADS1115(ADS1115.ADDR_AUX, rate) if sensors else None
 
         self.__pt1000_adc = None if pt1000 is None else interface.pt1000_adc(MCP342X.GAIN_4, MCP342X.RATE_15)
 
         self.__tconv = None if self.__wrk_adc is None else self.__wrk_adc.tconv
 
+        self.__acquired_wrk_aux = None                  # dict of sensor_index: (we_v, ae_v), during a pipelined cycle
+        self.__acquired_tmp = None                      # float, during a pipelined cycle
+        self.__unfiltered_index = None                  # int, during a cross-sensitivity sample
+
+        self.__temp_context = None                      # AFETempContext
+
+        self.__cycle_stats = AFECycleStats()
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # business methods...
@@ -73,9 +120,29 @@ class AFE(GasSensorInterface):
 
 
     def sample(self, sht_datum=None):
+        start_time = time.time()
+
+        try:
+            temp_context_is_fresh = self.__is_temp_context_fresh()
+
+            if self.__pipelined:
+                self.__acquire(temp_context_is_fresh)
+
+            return self.__sample(sht_datum, temp_context_is_fresh)
+
+        finally:
+            self.__acquired_wrk_aux = None
+            self.__acquired_tmp = None
+
+            self.__cycle_stats.record(time.time() - start_time)
+
+
+    def __sample(self, sht_datum, temp_context_is_fresh):
         # temperature...
-        pt1000_datum = self.sample_pt1000()
-        temp = self.sample_temp(sht_datum)
+        temp_context = self.__acquire_temp_context(temp_context_is_fresh)
+
+        pt1000_datum = temp_context.pt1000_datum
+        temp = temp_context.temp(sht_datum)
 
         # gases...
         samples = []
@@ -101,8 +168,10 @@ class AFE(GasSensorInterface):
 
     def sample_station(self, sn, sht_datum=None):
         # temperature...
-        pt1000_datum = self.sample_pt1000()
-        temp = self.sample_temp(sht_datum)
+        temp_context = self.__acquire_temp_context(self.__is_temp_context_fresh())
+
+        pt1000_datum = temp_context.pt1000_datum
+        temp = temp_context.temp(sht_datum)
 
         # gas...
         index = sn - 1
@@ -115,7 +184,13 @@ class AFE(GasSensorInterface):
         # cross-sensitivity sample...
         if sensor.has_no2_cross_sensitivity():
             no2_index, no2_sensor = self.__no2_sensor()
-            no2_sample = no2_sensor.sample(self, temp, no2_index)
+
+            try:
+                self.__unfiltered_index = no2_index
+                no2_sample = no2_sensor.sample(self, temp, no2_index)
+
+            finally:
+                self.__unfiltered_index = None
         else:
             no2_sample = None
 
@@ -161,52 +236,107 @@ class AFE(GasSensorInterface):
             return self.__pt1000.null_datum()
 
 
+    def __acquire_temp_context(self, temp_context_is_fresh):
+        if not temp_context_is_fresh:
+            self.__temp_context = AFETempContext.construct(self.sample_pt1000())
+
+        return self.__temp_context
+
+
+    def __is_temp_context_fresh(self):
+        return self.__temp_context is not None and self.__temp_context.is_fresh(self.__temp_tolerance)
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # electrochem callbacks...
 
     def sample_raw_wrk_aux(self, sensor_index, gain_index):
-        try:
-            gain = ADS1115.gain(gain_index)
+        if self.__acquired_wrk_aux is not None and sensor_index in self.__acquired_wrk_aux:
+            return self.__acquired_wrk_aux[sensor_index]
 
-            mux = AFE.__MUX[sensor_index]
+        conversions = [self.__convert_wrk_aux(sensor_index, gain_index) for _ in range(self.__filter_oversampling())]
 
-            self.__wrk_adc.start_conversion(mux, gain)
-            self.__aux_adc.start_conversion(mux, gain)
+        return self.__filter(sensor_index, conversions)
 
-            time.sleep(self.__tconv)
 
-            we_v = self.__wrk_adc.read_conversion()
-            ae_v = self.__aux_adc.read_conversion()
+    def sample_raw_wrk(self, sensor_index, gain_index):
+        if self.__acquired_wrk_aux is not None and sensor_index in self.__acquired_wrk_aux:
+            return self.__acquired_wrk_aux[sensor_index][0]
 
-            return we_v, ae_v
+        conversions = [self.__convert_wrk(sensor_index, gain_index) for _ in range(self.__filter_oversampling())]
 
-        finally:
-            self.__wrk_adc.release_lock()
-            self.__aux_adc.release_lock()
+        return self.__filter(sensor_index, conversions)
 
 
-    def sample_raw_wrk(self, sensor_index, gain_index):
-        try:
-            gain = ADS1115.gain(gain_index)
+    def __convert_wrk_aux(self, sensor_index, gain_index):
+        gain = ADS1115.gain(gain_index)
+        mux = AFE.__MUX[sensor_index]
+
+        with self.__conversion(self.__wrk_adc, self.__aux_adc):
+            if self.__oversampling == 1:
+                try:
+                    self.__wrk_adc.start_conversion(mux, gain)
+                    self.__aux_adc.start_conversion(mux, gain)
+
+                    time.sleep(self.__tconv)
+
+                    return self.__wrk_adc.read_conversion(), self.__aux_adc.read_conversion()
+
+                finally:
+                    self.__wrk_adc.release_lock()
+                    self.__aux_adc.release_lock()
+
+            we_total = 0.0
+            ae_total = 0.0
+
+            wrk_stream = self.__wrk_adc.stream((mux, ), gain, count=self.__oversampling)
+            aux_stream = self.__aux_adc.stream((mux, ), gain, count=self.__oversampling)
+
+            try:
+                for (_, _, we_v), (_, _, ae_v) in zip(wrk_stream, aux_stream):
+                    we_total += we_v
+                    ae_total += ae_v
+
+            finally:
+                wrk_stream.close()
+                aux_stream.close()
+
+        return we_total / self.__oversampling, ae_total / self.__oversampling
 
-            mux = AFE.__MUX[sensor_index]
 
-            self.__wrk_adc.start_conversion(mux, gain)
+    def __convert_wrk(self, sensor_index, gain_index):
+        gain = ADS1115.gain(gain_index)
+        mux = AFE.__MUX[sensor_index]
 
-            time.sleep(self.__tconv)
+        if self.__oversampling == 1:
+            try:
+                self.__wrk_adc.start_conversion(mux, gain)
 
-            we_v = self.__wrk_adc.read_conversion()
+                time.sleep(self.__tconv)
 
-            return we_v
+                return self.__wrk_adc.read_conversion()
+
+            finally:
+                self.__wrk_adc.release_lock()
+
+        wrk_stream = self.__wrk_adc.stream((mux, ), gain, count=self.__oversampling)
+
+        try:
+            we_total = sum(we_v for _, _, we_v in wrk_stream)
 
         finally:
-            self.__wrk_adc.release_lock()
+            wrk_stream.close()
+
+        return we_total / self.__oversampling
 
 
     def sample_raw_tmp(self):
         if self.__pt1000_adc is None:
             return None
 
+        if self.__acquired_tmp is not None:
+            return self.__acquired_tmp
+
         try:
             self.__pt1000_adc.start_conversion()
 
@@ -219,6 +349,136 @@ class AFE(GasSensorInterface):
 
 
     # ----------------------------------------------------------------------------------------------------------------
+    # pipelined acquisition...
+
+    def __acquire(self, temp_context_is_fresh):
+        self.__acquired_wrk_aux = {}
+        self.__acquired_tmp = None
+
+        # Pt1000 - overlaps the gas conversions...
+        tmp_ready_time = None
+
+        if self.__pt1000_adc is not None and not temp_context_is_fresh:
+            try:
+                self.__pt1000_adc.start_conversion()
+                tmp_ready_time = time.time() + self.__pt1000_adc.tconv
+
+            except OSError:
+                self.__pt1000_adc.release_lock()
+
+        try:
+            # gases...
+            channels = [(sensor_index, sensor.adc_gain_index) for sensor_index, sensor in enumerate(self.__sensors)
+                        if sensor is not None for _ in range(self.__filter_oversampling())]
+
+            conversions = {sensor_index: [] for sensor_index, _ in channels}
+
+            for sensor_index, we_ae_v in self.__convert_channels(channels):
+                conversions[sensor_index].append(we_ae_v)
+
+                if tmp_ready_time is not None and time.time() >= tmp_ready_time:
+                    tmp_ready_time = None
+                    self.__acquired_tmp = self.__read_tmp()
+
+            for sensor_index, sensor_conversions in conversions.items():
+                self.__acquired_wrk_aux[sensor_index] = self.__filter(sensor_index, sensor_conversions)
+
+            # Pt1000 - if it was not read between gas conversions...
+            if tmp_ready_time is not None:
+                time.sleep(max(0.0, tmp_ready_time - time.time()))
+
+                tmp_ready_time = None
+                self.__acquired_tmp = self.__read_tmp()
+
+        finally:
+            if tmp_ready_time is not None:
+                self.__pt1000_adc.release_lock()
+
+
+    def __convert_channels(self, channels):
+        """
+        yields (sensor_index, (we_v, ae_v)) for each (sensor_index, gain_index) channel in turn - in single-shot mode,
+        each channel's conversion is started on both ADCs as soon as the previous channel is read from both
+        """
+        if self.__oversampling > 1:
+            for sensor_index, gain_index in channels:
+                yield sensor_index, self.__convert_wrk_aux(sensor_index, gain_index)
+            return
+
+        started = False
+        ready_time = None
+
+        try:
+            for i in range(len(channels)):
+                if not started:
+                    self.__start_wrk_aux(*channels[i])
+                    started = True
+                    ready_time = time.time() + self.__tconv
+
+                time.sleep(max(0.0, ready_time - time.time()))
+
+                we_ae_v = self.__wrk_adc.read_conversion(), self.__aux_adc.read_conversion()
+                started = False
+
+                if i + 1 < len(channels):
+                    self.__start_wrk_aux(*channels[i + 1])          # the next mux, before this channel is used
+                    started = True
+                    ready_time = time.time() + self.__tconv
+
+                yield channels[i][0], we_ae_v
+
+        finally:
+            if started:
+                self.__wrk_adc.release_lock()
+                self.__aux_adc.release_lock()
+
+
+    def __start_wrk_aux(self, sensor_index, gain_index):
+        gain = ADS1115.gain(gain_index)
+        mux = AFE.__MUX[sensor_index]
+
+        try:
+            for adc in sorted((self.__wrk_adc, self.__aux_adc), key=lambda adc: adc.lock_name):    # transaction order
+                adc.start_conversion(mux, gain)
+
+        except BaseException:
+            self.__wrk_adc.release_lock()
+            self.__aux_adc.release_lock()
+            raise
+
+
+    def __read_tmp(self):
+        try:
+            return self.__pt1000_adc.read_conversion()
+
+        except OSError:
+            return None                                 # sample_raw_tmp() will convert on demand
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # filtering...
+
+    def __filter_oversampling(self):
+        return 1 if self.__channel_filter is None else self.__channel_filter.oversampling
+
+
+    def __filter(self, sensor_index, conversions):
+        if self.__channel_filter is None:
+            return conversions[0]
+
+        if sensor_index == self.__unfiltered_index:
+            return self.__channel_filter.oversample(conversions)
+
+        return self.__channel_filter.apply(sensor_index, conversions)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __conversion(*adcs):
+        return HierarchicalLock.transaction(*[adc.lock_name for adc in adcs],
+                                            timeout=max(adc.lock_timeout for adc in adcs))
+
 
     def __no2_sensor(self):
         for index in range(len(self.__sensors)):
@@ -235,10 +495,43 @@ class AFE(GasSensorInterface):
         return self.__sensors
 
 
+    @property
+    def pipelined(self):
+        return self.__pipelined
+
+
+    @property
+    def oversampling(self):
+        return self.__oversampling
+
+
+    @property
+    def temp_tolerance(self):
+        return self.__temp_tolerance
+
+
+    @property
+    def channel_filter(self):
+        return self.__channel_filter
+
+
+    @property
+    def temp_context(self):
+        return self.__temp_context
+
+
+    @property
+    def cycle_stats(self):
+        return self.__cycle_stats
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
         sensors = Str.collection(self.__sensors)
 
-        return "AFE:{pt1000:%s, sensors:%s, tconv:%0.3f, wrk_adc:%s, aux_adc:%s, pt1000_adc:%s}" % \
-            (self.__pt1000, sensors, self.__tconv, self.__wrk_adc, self.__aux_adc, self.__pt1000_adc)
+        return "AFE:{pt1000:%s, sensors:%s, pipelined:%s, oversampling:%s, temp_tolerance:%s, channel_filter:%s, " \
+               "tconv:%s, wrk_adc:%s, aux_adc:%s, pt1000_adc:%s, temp_context:%s, cycle_stats:%s}" % \
+            (self.__pt1000, sensors, self.pipelined, self.oversampling, self.temp_tolerance, self.channel_filter,
+             self.__tconv, self.__wrk_adc, self.__aux_adc, self.__pt1000_adc, self.__temp_context,
+             self.__cycle_stats)
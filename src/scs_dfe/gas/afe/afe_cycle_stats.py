@@ -0,0 +1,109 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Running statistics of AFE sample cycle times, using Welford's online algorithm for the variance.
+
+example JSON:
+{"count": 60, "last": 0.312, "mean": 0.309, "var": 0.000021, "min": 0.301, "max": 0.327}
+
+https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Welford's_online_algorithm
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFECycleStats(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__count = 0                                # int
+        self.__last = None                              # float seconds
+        self.__mean = 0.0                               # float seconds
+        self.__m2 = 0.0                                 # float
+        self.__min = None                               # float seconds
+        self.__max = None                               # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record(self, elapsed):
+        self.__count += 1
+        self.__last = elapsed
+
+        delta = elapsed - self.__mean
+        self.__mean += delta / self.__count
+        self.__m2 += delta * (elapsed - self.__mean)
+
+        self.__min = elapsed if self.__min is None else min(self.__min, elapsed)
+        self.__max = elapsed if self.__max is None else max(self.__max, elapsed)
+
+
+    def reset(self):
+        self.__init__()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['count'] = self.count
+        jdict['last'] = None if self.last is None else round(self.last, 3)
+        jdict['mean'] = None if self.mean is None else round(self.mean, 3)
+        jdict['var'] = None if self.variance is None else round(self.variance, 6)
+        jdict['min'] = None if self.min is None else round(self.min, 3)
+        jdict['max'] = None if self.max is None else round(self.max, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def last(self):
+        return self.__last
+
+
+    @property
+    def mean(self):
+        return self.__mean if self.__count > 0 else None
+
+
+    @property
+    def variance(self):
+        return self.__m2 / (self.__count - 1) if self.__count > 1 else None
+
+
+    @property
+    def min(self):
+        return self.__min
+
+
+    @property
+    def max(self):
+        return self.__max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFECycleStats:{count:%s, last:%s, mean:%s, variance:%s, min:%s, max:%s}" % \
+               (self.count, self.last, self.mean, self.variance, self.min, self.max)
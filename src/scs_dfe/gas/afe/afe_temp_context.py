@@ -0,0 +1,70 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The temperature context of an AFE sampling cycle: a single Pt1000 reading, shared by the Pt1000 report and the
+temperature compensation of every sensor. A context may be reused by later cycles while its age is within a given
+tolerance.
+"""
+
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFETempContext(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, pt1000_datum):
+        return cls(pt1000_datum, time.monotonic())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pt1000_datum, acquired):
+        """
+        Constructor
+        """
+        self.__pt1000_datum = pt1000_datum                  # Pt1000Datum or None
+        self.__acquired = acquired                          # float monotonic seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_fresh(self, tolerance):
+        return tolerance > 0 and self.age() <= tolerance
+
+
+    def age(self):
+        return time.monotonic() - self.__acquired
+
+
+    def temp(self, sht_datum=None):
+        if sht_datum is not None:
+            return sht_datum.temp
+
+        return None if self.pt1000_datum is None else self.pt1000_datum.temp
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def pt1000_datum(self):
+        return self.__pt1000_datum
+
+
+    @property
+    def acquired(self):
+        return self.__acquired
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFETempContext:{pt1000_datum:%s, age:%0.3f}" % (self.pt1000_datum, self.age())
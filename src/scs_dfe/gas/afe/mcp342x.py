@@ -7,8 +7,9 @@ Created on 18 May 2017
 import struct
 import time
 
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
+
 from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -169,11 +170,21 @@ class MCP342X(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def obtain_lock(self):
-        Lock.acquire(self.__class__.__name__, MCP342X.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(self.lock_name, MCP342X.__LOCK_TIMEOUT)
 
 
     def release_lock(self):
-        Lock.release(self.__class__.__name__)
+        HierarchicalLock.release(self.lock_name)
+
+
+    @property
+    def lock_name(self):
+        return self.__class__.__name__
+
+
+    @property
+    def lock_timeout(self):
+        return MCP342X.__LOCK_TIMEOUT
 
 
     # ----------------------------------------------------------------------------------------------------------------
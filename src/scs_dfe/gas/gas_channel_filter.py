@@ -0,0 +1,203 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A filtering stage for gas channel raw voltages, between a gas sensor interface's acquisition and sensor.sample(...).
+A reading is a tuple of voltages - (we_v, ae_v) for an electrochemical sensor - or a single voltage for a PID.
+
+The stages, in order:
+* oversampling - the interface makes N conversions per reading, and the stage takes their mean
+* median - the median of the last k readings, rejecting single-reading spikes
+* exponential - y += alpha * (x - y), or boxcar - the mean of the last n readings
+
+The median and boxcar stages keep a window, and the exponential stage its last output, for each sensor index. Until a
+window is full, the stage uses the readings it has. The median of k and a boxcar of n delay a step change by (k - 1) / 2
+and (n - 1) / 2 readings respectively.
+
+A reading that is needed outside the sensor's own sampling - for example, the NO2 cross-sensitivity reading when an Ox
+station is sampled - should be taken with oversample(), which applies the oversampling stage only and leaves the state
+unchanged, so that each sensor's state advances once per cycle.
+"""
+
+from collections import deque
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GasChannelFilter(object):
+    """
+    classdocs
+    """
+
+    MODE_NONE =             'none'
+    MODE_EXPONENTIAL =      'exp'
+    MODE_BOXCAR =           'boxcar'
+
+    __MODES = (MODE_NONE, MODE_EXPONENTIAL, MODE_BOXCAR)
+
+    DEFAULT_ALPHA =         0.5
+    DEFAULT_LENGTH =        4
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __median(values):
+        ordered = sorted(values)
+        middle = len(ordered) // 2
+
+        return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+    @staticmethod
+    def __mean(vectors):
+        return tuple(sum(values) / len(values) for values in zip(*vectors))
+
+
+    @staticmethod
+    def __vectors(conversions):
+        conversions = [conversion for conversion in conversions if conversion is not None]
+
+        if not conversions:
+            return None, None
+
+        scalar = not isinstance(conversions[0], (tuple, list))
+        vectors = [(conversion, ) if scalar else tuple(conversion) for conversion in conversions]
+
+        return scalar, vectors
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, oversampling=1, median=1, mode=MODE_NONE, alpha=DEFAULT_ALPHA, length=DEFAULT_LENGTH):
+        """
+        Constructor
+        """
+        if oversampling < 1:
+            raise ValueError(oversampling)
+
+        if median < 1 or median % 2 == 0:
+            raise ValueError(median)
+
+        if mode not in self.__MODES:
+            raise ValueError(mode)
+
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(alpha)
+
+        if length < 1:
+            raise ValueError(length)
+
+        self.__oversampling = int(oversampling)                 # int conversions per reading
+        self.__median_length = int(median)                      # int readings
+        self.__mode = mode                                      # string
+        self.__alpha = float(alpha)                             # float
+        self.__length = int(length)                             # int readings
+
+        self.__widths = {}                                      # dict of sensor_index: int voltages per reading
+        self.__median_windows = {}                              # dict of sensor_index: deque of tuple
+        self.__exponentials = {}                                # dict of sensor_index: tuple
+        self.__boxcar_windows = {}                              # dict of sensor_index: deque of tuple
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def apply(self, sensor_index, conversions):
+        """
+        returns the filtered reading for the given conversions - None conversions are ignored, and if there are none
+        left, None is returned and the state is unchanged
+        """
+        scalar, vectors = self.__vectors(conversions)
+
+        if not vectors:
+            return None
+
+        if self.__widths.get(sensor_index) != len(vectors[0]):
+            self.reset(sensor_index)
+            self.__widths[sensor_index] = len(vectors[0])
+
+        # oversampling...
+        reading = vectors[0] if len(vectors) == 1 else self.__mean(vectors)
+
+        # median...
+        if self.__median_length > 1:
+            window = self.__median_windows.setdefault(sensor_index, deque(maxlen=self.__median_length))
+            window.append(reading)
+
+            reading = tuple(self.__median(values) for values in zip(*window))
+
+        # exponential...
+        if self.__mode == self.MODE_EXPONENTIAL:
+            previous = self.__exponentials.get(sensor_index)
+
+            if previous is not None:
+                reading = tuple(prev + self.__alpha * (value - prev) for prev, value in zip(previous, reading))
+
+            self.__exponentials[sensor_index] = reading
+
+        # boxcar...
+        elif self.__mode == self.MODE_BOXCAR:
+            window = self.__boxcar_windows.setdefault(sensor_index, deque(maxlen=self.__length))
+            window.append(reading)
+
+            reading = self.__mean(window)
+
+        return reading[0] if scalar else reading
+
+
+    def oversample(self, conversions):
+        """
+        returns the mean of the given conversions, without the median or smoothing stages - the state is unchanged
+        """
+        scalar, vectors = self.__vectors(conversions)
+
+        if not vectors:
+            return None
+
+        reading = vectors[0] if len(vectors) == 1 else self.__mean(vectors)
+
+        return reading[0] if scalar else reading
+
+
+    def reset(self, sensor_index=None):
+        states = (self.__widths, self.__median_windows, self.__exponentials, self.__boxcar_windows)
+
+        for state in states:
+            if sensor_index is None:
+                state.clear()
+            else:
+                state.pop(sensor_index, None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def oversampling(self):
+        return self.__oversampling
+
+
+    @property
+    def median(self):
+        return self.__median_length
+
+
+    @property
+    def mode(self):
+        return self.__mode
+
+
+    @property
+    def alpha(self):
+        return self.__alpha
+
+
+    @property
+    def length(self):
+        return self.__length
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GasChannelFilter:{oversampling:%s, median:%s, mode:%s, alpha:%s, length:%s, sensors:%s}" % \
+               (self.oversampling, self.median, self.mode, self.alpha, self.length, sorted(self.__widths.keys()))
@@ -4,10 +4,27 @@ Created on 27 Jun 2021
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
 an abstract Digital Single Interface (DSI) microcontroller
+
+Each command is made under the DSI's lock. convert_and_read() pipelines a steady sampling loop: under a single lock
+acquisition, it reads the pending conversion and starts the next, so that there is no conversion wait between readings.
+Its result is a conversion started by the previous call, given with its age. The pending conversion is known only to
+this instance - a conversion started by another process is read as if it were this instance's.
+
+The pipelined start command is written without reading its acknowledgement, so that a reading costs three I2C messages,
+rather than the four of a start / read pair.
+
+Each command is written, and its response read, in separate bus transactions, so that the DSI's response time - like
+the conversion wait - is spent without holding the bus, and other devices may use it.
 """
 
+import time
+
 from abc import ABC, abstractmethod
 
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
+
+from scs_host.bus.i2c import I2C
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -16,6 +33,14 @@ class DSI(ABC):
     South Coast Science DSI microcontroller
     """
 
+    CONVERSION_TIME =       None                # seconds
+
+    _RESPONSE_ACK =         1
+    _RESPONSE_NACK =        2
+
+    _SEND_WAIT_TIME =       0.010               # seconds
+    _LOCK_TIMEOUT =         2.0
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, addr):
@@ -24,6 +49,8 @@ class DSI(ABC):
         """
         self.__addr = addr
 
+        self.__conversion_started = None                    # float monotonic seconds, while a conversion is pending
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -32,9 +59,14 @@ class DSI(ABC):
         pass
 
 
-    @abstractmethod
     def start_conversion(self):
-        pass
+        response = self._cmd(ord('s'), 1)
+
+        if response != self._RESPONSE_ACK:
+            self.__conversion_started = None
+            raise RuntimeError("response: %s" % response)
+
+        self.__conversion_started = time.monotonic()
 
 
     @abstractmethod
@@ -42,9 +74,50 @@ class DSI(ABC):
         pass
 
 
-    @abstractmethod
     def read_conversion_voltage(self):
-        pass
+        response = self._cmd(*self._conversion_cmd())
+        self.__conversion_started = None
+
+        return self._conversion_voltage(response)
+
+
+    def convert_and_read(self):
+        """
+        returns the voltage of the pending conversion and its age in seconds since it completed, then starts the next
+        conversion - the voltage and age are None if no conversion was pending
+        """
+        started = self.__conversion_started
+        response = None
+
+        if started is not None:
+            time.sleep(max(0.0, started + self.CONVERSION_TIME - time.monotonic()))    # called too soon
+
+        try:
+            self.obtain_lock()
+
+            if started is not None:
+                cmd, response_size = self._conversion_cmd()
+
+                self.__write(cmd)
+                time.sleep(self._SEND_WAIT_TIME)
+
+                response = self.__read(response_size)
+                time.sleep(self._SEND_WAIT_TIME)
+
+            self.__conversion_started = None
+
+            self.__write(ord('s'))                          # not acknowledged - saves a read message
+            self.__conversion_started = time.monotonic()
+
+        finally:
+            self.release_lock()
+
+        if started is None:
+            return None, None
+
+        age = self.__conversion_started - (started + self.CONVERSION_TIME)
+
+        return self._conversion_voltage(response), round(age, 3)
 
 
     @abstractmethod
@@ -60,15 +133,70 @@ class DSI(ABC):
     # ----------------------------------------------------------------------------------------------------------------
 
     @abstractmethod
-    def obtain_lock(self):
+    def _conversion_cmd(self):
+        """
+        the command char and response size for the conversion voltage
+        """
         pass
 
 
     @abstractmethod
-    def release_lock(self):
+    def _conversion_voltage(self, response):
         pass
 
 
+    def _cmd(self, cmd, response_size):
+        try:
+            self.obtain_lock()
+
+            self.__write(cmd)
+            time.sleep(self._SEND_WAIT_TIME)
+
+            response = self.__read(response_size)
+            time.sleep(self._SEND_WAIT_TIME)
+
+            return response
+
+        finally:
+            self.release_lock()
+
+
+    def __write(self, cmd):
+        try:
+            I2C.Sensors.start_tx(self.addr)
+            I2C.Sensors.write(cmd)
+        finally:
+            I2C.Sensors.end_tx()
+
+
+    def __read(self, response_size):
+        try:
+            I2C.Sensors.start_tx(self.addr)
+            return I2C.Sensors.read(response_size)
+        finally:
+            I2C.Sensors.end_tx()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def obtain_lock(self):
+        HierarchicalLock.acquire(self.lock_name, self._LOCK_TIMEOUT)
+
+
+    def release_lock(self):
+        HierarchicalLock.release(self.lock_name)
+
+
+    @property
+    def lock_name(self):
+        return "%s-0x%02x" % (self.__class__.__name__, self.addr)
+
+
+    @property
+    def lock_timeout(self):
+        return self._LOCK_TIMEOUT
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -76,6 +204,11 @@ class DSI(ABC):
         return self.__addr
 
 
+    @property
+    def conversion_pending(self):
+        return self.__conversion_started is not None
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
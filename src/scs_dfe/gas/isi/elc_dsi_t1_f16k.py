@@ -9,15 +9,10 @@ Compatible with:
 https://github.com/south-coast-science/scs_dsi_t2_f1
 """
 
-import time
-
 from scs_core.data.datum import Decode
 
 from scs_dfe.gas.isi.dsi import DSI
 
-from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
-
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -32,12 +27,6 @@ class ElcDSIt1f16K(DSI):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    __RESPONSE_ACK =        1
-    __RESPONSE_NACK =       2
-
-    __SEND_WAIT_TIME =      0.010               # seconds
-    __LOCK_TIMEOUT =        2.0
-
     __SAMPLE_MAX_VOLTAGE =  3.3
     __SAMPLE_MAX_COUNT =    65535
 
@@ -57,78 +46,49 @@ class ElcDSIt1f16K(DSI):
         pass
 
 
-    def start_conversion(self):
-        response = self.__cmd(ord('s'), 1)
-
-        if response != self.__RESPONSE_ACK:
-            raise RuntimeError("response: %s" % response)
-
-
     def read_conversion_count(self):
-        response = self.__cmd(ord('c'), 4)
-
-        c_aux = Decode.unsigned_int(response[0:2], '<')     # CS0
-        c_wrk = Decode.unsigned_int(response[2:4], '<')     # CS1
-
-        return c_wrk, c_aux
-
-
-    def read_conversion_voltage(self):
-        c_wrk, c_aux = self.read_conversion_count()
-
-        v_wrk = self.__voltage_conversion(c_wrk)
-        v_aux = self.__voltage_conversion(c_aux)
-
-        return round(v_wrk, 5), round(v_aux, 5)
+        return self.__conversion_count(self._cmd(ord('c'), 4))
 
 
     def version_ident(self):
-        response = self.__cmd(ord('i'), 40)
+        response = self._cmd(ord('i'), 40)
 
         return ''.join([chr(byte) for byte in response]).strip()
 
 
     def version_tag(self):
-        response = self.__cmd(ord('t'), 11)
+        response = self._cmd(ord('t'), 11)
 
         return ''.join([chr(byte) for byte in response]).strip()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __voltage_conversion(self, count):
-        return self.__SAMPLE_MAX_VOLTAGE * count / self.__SAMPLE_MAX_COUNT
-
+    def _conversion_cmd(self):
+        return ord('c'), 4
 
-    def __cmd(self, cmd, response_size):
-        try:
-            self.obtain_lock()
-            I2C.Sensors.start_tx(self.addr)
 
-            response = I2C.Sensors.read_cmd(cmd, response_size, self.__SEND_WAIT_TIME)
+    def _conversion_voltage(self, response):
+        c_wrk, c_aux = self.__conversion_count(response)
 
-            time.sleep(self.__SEND_WAIT_TIME)
-
-            return response
+        v_wrk = self.__voltage_conversion(c_wrk)
+        v_aux = self.__voltage_conversion(c_aux)
 
-        finally:
-            I2C.Sensors.end_tx()
-            self.release_lock()
+        return round(v_wrk, 5), round(v_aux, 5)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def obtain_lock(self):
-        Lock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
-
+    @staticmethod
+    def __conversion_count(response):
+        c_aux = Decode.unsigned_int(response[0:2], '<')     # CS0
+        c_wrk = Decode.unsigned_int(response[2:4], '<')     # CS1
 
-    def release_lock(self):
-        Lock.release(self.__lock_name)
+        return c_wrk, c_aux
 
 
-    @property
-    def __lock_name(self):
-        return "%s-0x%02x" % (self.__class__.__name__, self.addr)
+    def __voltage_conversion(self, count):
+        return self.__SAMPLE_MAX_VOLTAGE * count / self.__SAMPLE_MAX_COUNT
 
 
     # ----------------------------------------------------------------------------------------------------------------
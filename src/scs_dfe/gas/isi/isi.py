@@ -7,6 +7,15 @@ Integrated Sensor Interface (ISI)
 
 Warning: If an Ox sensor is present, the NO2 sensor must have a lower sensor number (SN) than the Ox sensor,
 otherwise the NO2 cross-sensitivity concentration will not be found.
+
+Each sensor slot has its own DSI, by default at the DSI type's default address plus the sensor index. A sampling cycle
+starts a conversion on every DSI, waits for the longest conversion time once, then reads every DSI - the electrochem
+callbacks then return the acquired voltages. The cycle is a single HierarchicalLock transaction over all the DSIs.
+
+With a GasChannelFilter, the cycle's conversions are repeated for the filter's oversampling count, and each sensor's
+reading is filtered before the electrochem callbacks return it. The filter keeps its state per sensor, across cycles.
+When sample_station() reads the NO2 sensor for the Ox cross-sensitivity, that reading is oversampled but not filtered,
+so that the NO2 filter state advances only when the NO2 sensor itself is sampled.
 """
 
 import time
@@ -17,9 +26,9 @@ from scs_core.gas.isi.isi_datum import ISIDatum
 from scs_dfe.gas.gas_sensor_interface import GasSensorInterface
 from scs_dfe.gas.isi.elc_dsi_t1_f16k import ElcDSIt1f16K
 from scs_dfe.gas.isi.pid_dsi_t1 import PIDDSIt1
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
 
-# TODO: ISI requires multiple DSI instances to support multiple sensors
 # --------------------------------------------------------------------------------------------------------------------
 
 class ISI(GasSensorInterface):
@@ -36,13 +45,13 @@ class ISI(GasSensorInterface):
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
-    def __dsi(cls, sensor):
+    def __dsi_class(cls, sensor):
         class_name = sensor.__class__.__name__
 
         if class_name == 'PID':
-            return PIDDSIt1(PIDDSIt1.DEFAULT_ADDR)
+            return PIDDSIt1
 
-        return ElcDSIt1f16K(ElcDSIt1f16K.DEFAULT_ADDR)
+        return ElcDSIt1f16K
 
 
     @classmethod
@@ -56,22 +65,49 @@ class ISI(GasSensorInterface):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, sensors):
+    def __init__(self, sensors, addrs=None, channel_filter=None):
         """
         Constructor
         """
         self.__sensors = sensors                                        # array of Sensor
-        self.__adc = self.__dsi(self.__sensors[0])                      # DSI
+
+        self.__adcs = {}                                                # dict of sensor_index: DSI
+
+        for sensor_index in range(len(sensors)):
+            sensor = sensors[sensor_index]
+
+            if sensor is None:
+                continue
+
+            dsi_class = self.__dsi_class(sensor)
+            addr = dsi_class.DEFAULT_ADDR + sensor_index if addrs is None else addrs[sensor_index]
+
+            self.__adcs[sensor_index] = dsi_class(addr)
+
+        self.__channel_filter = channel_filter                          # GasChannelFilter
+
+        self.__acquired = None                                          # dict of sensor_index: voltage, in a cycle
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # business methods...
 
     def adc_versions(self):
-        return tuple(self.__adc.version_ident(), )
+        return tuple(adc.version_ident() for adc in self.__adcs.values())
 
 
     def sample(self, sht_datum):
+        try:
+            with HierarchicalLock.transaction(*self.__lock_names(), timeout=self.__lock_timeout()):
+                self.__acquire(self.__adcs.keys())
+
+                return self.__sample(sht_datum)
+
+        finally:
+            self.__acquired = None
+
+
+    def __sample(self, sht_datum):
         # gases...
         samples = []
         no2_sample = None
@@ -95,7 +131,6 @@ class ISI(GasSensorInterface):
 
 
     def sample_station(self, sn, sht_datum):
-        # gas...
         index = sn - 1
 
         sensor = self.__sensors[index]
@@ -103,9 +138,23 @@ class ISI(GasSensorInterface):
         if sensor is None:
             return ISIDatum()
 
+        no2 = self.__no2_sensor() if sensor.has_no2_cross_sensitivity() else None
+        indices = [index] if no2 is None else [no2[0], index]
+
+        try:
+            with HierarchicalLock.transaction(*self.__lock_names(indices), timeout=self.__lock_timeout(indices)):
+                self.__acquire(indices, unfiltered_indices=() if no2 is None else (no2[0], ))
+
+                return self.__sample_station(index, sensor, no2, sht_datum)
+
+        finally:
+            self.__acquired = None
+
+
+    def __sample_station(self, index, sensor, no2, sht_datum):
         # cross-sensitivity sample...
-        if sensor.has_no2_cross_sensitivity():
-            no2_index, no2_sensor = self.__no2_sensor()
+        if no2 is not None:
+            no2_index, no2_sensor = no2
             no2_sample = no2_sensor.sample(self, sht_datum.temp, no2_index)
         else:
             no2_sample = None
@@ -134,38 +183,107 @@ class ISI(GasSensorInterface):
     # electrochem callbacks...
 
     def sample_raw_wrk_aux(self, sensor_index, gain_index):
-        if sensor_index > 0:
-            raise KeyError(sensor_index)            # TODO: fix this for multiple DSIs
+        if self.__acquired is not None and sensor_index in self.__acquired:
+            return self.__acquired[sensor_index]
+
+        adc = self.__adcs[sensor_index]
+        conversions = []
+
+        with HierarchicalLock.transaction(adc.lock_name, timeout=adc.lock_timeout):
+            for _ in range(self.__filter_oversampling()):
+                adc.start_conversion()
+                time.sleep(adc.CONVERSION_TIME)
 
-        self.__adc.start_conversion()
-        time.sleep(self.__adc.CONVERSION_TIME)
+                conversions.append(adc.read_conversion_voltage())
 
-        return self.__adc.read_conversion_voltage()
+        return self.__filter(sensor_index, conversions)
 
 
     def sample_raw_wrk(self, sensor_index, gain_index):
-        if sensor_index > 0:
-            raise KeyError(sensor_index)            # TODO: fix this for multiple DSIs
+        voltage = self.sample_raw_wrk_aux(sensor_index, gain_index)
 
-        self.__adc.start_conversion()
-        time.sleep(self.__adc.CONVERSION_TIME)
+        return voltage[0] if isinstance(voltage, tuple) else voltage
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # concurrent acquisition...
 
-        return self.__adc.read_conversion_voltage()
+    def __acquire(self, sensor_indices, unfiltered_indices=()):
+        adcs = [(sensor_index, self.__adcs[sensor_index]) for sensor_index in sensor_indices]
+
+        if not adcs:
+            self.__acquired = {}
+            return
+
+        conversion_time = max(adc.CONVERSION_TIME for _, adc in adcs)
+        conversions = {sensor_index: [] for sensor_index, _ in adcs}
+
+        for _ in range(self.__filter_oversampling()):
+            for _, adc in adcs:
+                adc.start_conversion()
+
+            time.sleep(conversion_time)
+
+            for sensor_index, adc in adcs:
+                conversions[sensor_index].append(adc.read_conversion_voltage())
+
+        self.__acquired = {sensor_index: self.__filter(sensor_index, conversions[sensor_index],
+                                                       sensor_index in unfiltered_indices)
+                           for sensor_index, _ in adcs}
+
+
+    def __filter_oversampling(self):
+        return 1 if self.__channel_filter is None else self.__channel_filter.oversampling
+
+
+    def __filter(self, sensor_index, conversions, unfiltered=False):
+        if self.__channel_filter is None:
+            return conversions[0]
+
+        if unfiltered:
+            return self.__channel_filter.oversample(conversions)
+
+        return self.__channel_filter.apply(sensor_index, conversions)
+
+
+    def __lock_names(self, sensor_indices=None):
+        indices = self.__adcs.keys() if sensor_indices is None else sensor_indices
+
+        return [self.__adcs[sensor_index].lock_name for sensor_index in indices]
+
+
+    def __lock_timeout(self, sensor_indices=None):
+        indices = self.__adcs.keys() if sensor_indices is None else sensor_indices
+
+        return max((self.__adcs[sensor_index].lock_timeout for sensor_index in indices), default=0.0)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __no2_sensor(self):
         for index in range(len(self.__sensors)):
-            if self.__sensors[index].gas_name == 'NO2':
+            if self.__sensors[index] is not None and self.__sensors[index].gas_name == 'NO2':
                 return index, self.__sensors[index]
 
         return None
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def adcs(self):
+        return self.__adcs
+
+
+    @property
+    def channel_filter(self):
+        return self.__channel_filter
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
         sensors = Str.collection(self.__sensors)
+        adcs = Str.collection(self.__adcs)
 
-        return "ISI:{sensors:%s, adc:%s}" %  (sensors, self.__adc)
+        return "ISI:{sensors:%s, adcs:%s, channel_filter:%s}" % (sensors, adcs, self.channel_filter)
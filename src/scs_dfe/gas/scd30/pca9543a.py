@@ -5,8 +5,18 @@ Created on 19 Nov 2020
 
 Two-Channel I2C-Bus Switch With Interrupt Logic and Reset
 https://www.ti.com/product/PCA9543A
+
+The channel state is shadowed in shared memory, so that a write that would not change the state - in this process or
+any other - is skipped. The saving depends on clients releasing lazily: a client leaves its channel selected when it
+has finished, and the selection changes only when a client needs another channel. The shadow then matches the
+hardware between operations, and a client that uses its channel repeatedly writes the selector once. Several
+downstream transactions may also be batched under one temporary selection with channel(..).
 """
 
+from contextlib import contextmanager
+
+from scs_dfe.bus.register_shadow import RegisterShadow
+
 from scs_host.bus.i2c import I2C
 
 
@@ -19,6 +29,18 @@ class PCA9543A(object):
 
     ___I2C_ADDR = 0x70
 
+    __CHANNEL_MASK = 0x03                           # the interrupt bits are not part of the channel state
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def ctrl(ch0, ch1):
+        ch0_en = 0x01 if ch0 else 0x00
+        ch1_en = 0x02 if ch1 else 0x00
+
+        return ch1_en | ch0_en
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self):
@@ -27,20 +49,58 @@ class PCA9543A(object):
         """
         self.__addr = self.___I2C_ADDR
 
+        try:
+            self.__shadow = RegisterShadow.construct("PCA9543A-0x%02x" % self.__addr)     # RegisterShadow
+
+        except OSError:
+            self.__shadow = None                    # no shared memory - every write goes to the device
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def enable(self, ch0, ch1):
-        ch0_en = 0x01 if ch0 else 0x00
-        ch1_en = 0x02 if ch1 else 0x00
-        ctrl = ch1_en | ch0_en
+    def enable(self, ch0, ch1, force=False):
+        """
+        True if the control register was written
+        """
+        ctrl = self.ctrl(ch0, ch1)
+
+        if not force and self.state == ctrl:
+            return False
 
         try:
             I2C.Sensors.start_tx(self.__addr)
             I2C.Sensors.write(ctrl)
+
+        except OSError:
+            self.invalidate()
+            raise
+
         finally:
             I2C.Sensors.end_tx()
 
+        if self.__shadow is not None:
+            self.__shadow.set(ctrl)
+
+        return True
+
+
+    @contextmanager
+    def channel(self, ch0, ch1):
+        """
+        select the channels for the duration of the block, then restore the previous selection
+        """
+        previous = self.state
+        self.enable(ch0, ch1)
+
+        try:
+            yield self
+
+        finally:
+            if previous is None:
+                self.enable(False, False)
+            else:
+                self.enable(bool(previous & 0x01), bool(previous & 0x02))
+
 
     def read(self):
         try:
@@ -49,11 +109,29 @@ class PCA9543A(object):
         finally:
             I2C.Sensors.end_tx()
 
+        if self.__shadow is not None:
+            self.__shadow.set(ctrl & self.__CHANNEL_MASK)
+
         return ctrl
 
 
     def reset(self):
-        self.enable(False, False)
+        self.enable(False, False, force=True)
+
+
+    def invalidate(self):
+        if self.__shadow is not None:
+            self.__shadow.invalidate()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def state(self):
+        """
+        the last-known channel state, or None if it is not known
+        """
+        return None if self.__shadow is None else self.__shadow.get()
 
 
     # ----------------------------------------------------------------------------------------------------------------
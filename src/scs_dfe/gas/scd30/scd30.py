@@ -7,19 +7,33 @@ NB: 1 kPa = 10 mBar
 
 https://www.sensirion.com/en/download-center/carbon-dioxide-sensors-co2/co2-sensor/
 https://github.com/Sensirion/embedded-scd/releases/tag/2.1.0
+
+In sample(), each data-ready poll is its own short lock transaction, so that other processes on the bus - with their
+2 second lock timeouts - are not locked out for a measurement interval. Only the final ready check and the measurement
+read are a single transaction. The first poll is deferred until the next measurement is due - a little before the last
+ready time plus the measurement interval - so that most readings need only one poll. stream() yields successive
+readings at the sensor's own cadence.
+
+The PCA9543A channel is released lazily: releasing the lock leaves the SCD30 channel selected, and it is deselected
+only when another channel is selected. The selector is therefore written only when the selection actually changes, and
+not for each poll or command.
 """
 
 import time
 
+from contextlib import contextmanager
+
 from scs_core.data.datum import Decode, Encode
 
 from scs_core.gas.scd30.scd30_datum import SCD30Datum
 from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
 
+from scs_dfe.bus.bus_profiler import BusProfiler
+from scs_dfe.data.crc8 import CRC8
 from scs_dfe.gas.scd30.pca9543a import PCA9543A
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
 from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -58,13 +72,11 @@ class SCD30(object):
     __CMD_RESET =                           0xd304
 
     __SERIAL_NUM_WORDS =                    16
+    __POLL_INTERVAL =                       0.05                    # seconds
+    __POLL_LEAD =                           0.1                     # seconds before the next measurement is due
     __CMD_DELAY =                           0.01
     __RESET_DELAY =                         2.0
 
-    __CRC8_POLYNOMIAL =                     0x31
-    __CRC8_INIT =                           0xff
-    __CRC8_LEN =                            1
-
     __LOCK_TIMEOUT =                        2.0
 
 
@@ -87,15 +99,53 @@ class SCD30(object):
         self.__baseline = baseline                      # SCD30Baseline
         self.__ambient_pressure_kpa = None              # float
 
+        self.__interval = None                          # int seconds (the sensor's measurement interval, cached)
+        self.__ready_time = None                        # float time.time() of the last data-ready
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # sample...
 
-    def sample(self):
-        while not self.get_data_ready():
-            time.sleep(0.1)
+    def sample(self, timeout=None):
+        # defer until the next measurement is due...
+        due_time = self.__due_time()
+
+        if due_time is not None:
+            time.sleep(max(0.0, due_time - time.time()))
+
+        timeout_time = None if timeout is None else time.time() + timeout
 
-        return self.read_measurement()
+        while True:
+            # poll - each poll is its own lock transaction, so that other processes are not locked out...
+            while not self.get_data_ready():
+                if timeout_time is not None and time.time() > timeout_time:
+                    raise TimeoutError("SCD30: data not ready")
+
+                BusProfiler.retry(self.lock_name, 'get_data_ready')
+                time.sleep(self.__POLL_INTERVAL)
+
+            # ready-and-read - another process may have read the measurement since the poll...
+            try:
+                self.obtain_lock()
+
+                if self.get_data_ready():
+                    self.__ready_time = time.time()
+
+                    return self.read_measurement()
+
+            finally:
+                self.release_lock()
+
+
+    def stream(self, count=None, timeout=None):
+        """
+        generator of SCD30Datum, at the sensor's measurement interval - the lock is released between readings
+        """
+        yielded = 0
+
+        while count is None or yielded < count:
+            yield self.sample(timeout=timeout)
+            yielded += 1
 
 
     def get_data_ready(self):
@@ -145,6 +195,7 @@ class SCD30(object):
             self.__cmd(self.__CMD_START_PERIODIC_MEASUREMENT, arg=ambient_pressure_mbar)
 
             self.__ambient_pressure_kpa = ambient_pressure_kpa
+            self.__ready_time = None
 
         finally:
             self.release_lock()
@@ -168,7 +219,9 @@ class SCD30(object):
         finally:
             self.release_lock()
 
-        return Decode.int(words[0], '>')
+        self.__interval = Decode.int(words[0], '>')
+
+        return self.__interval
 
 
     def set_measurement_interval(self, interval):
@@ -179,10 +232,23 @@ class SCD30(object):
             self.obtain_lock()
             self.__cmd(self.__CMD_MEASUREMENT_INTERVAL, arg=interval)
 
+            self.__interval = interval
+            self.__ready_time = None
+
         finally:
             self.release_lock()
 
 
+    def __due_time(self):
+        if self.__ready_time is None:
+            return None
+
+        if self.__interval is None:
+            self.get_measurement_interval()
+
+        return self.__ready_time + self.__interval - self.__POLL_LEAD
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # temperature_offset...
 
@@ -331,20 +397,33 @@ class SCD30(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @contextmanager
+    def transaction(self):
+        """
+        hold the lock, and the selector channel, across several commands
+        """
+        try:
+            self.obtain_lock()
+            yield self
+
+        finally:
+            self.release_lock()
+
+
     def obtain_lock(self):
-        Lock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
-        self.__selector.enable(True, False)
-        time.sleep(0.001)
+        if not HierarchicalLock.acquire(self.lock_name, self.__LOCK_TIMEOUT):
+            return                                      # nested - the selector is already enabled
+
+        if self.__selector.enable(True, False):
+            time.sleep(0.001)
 
 
     def release_lock(self):
-        self.__selector.enable(False, False)
-        time.sleep(0.001)
-        Lock.release(self.__lock_name)
+        HierarchicalLock.release(self.lock_name)        # the channel stays selected until another is selected
 
 
     @property
-    def __lock_name(self):
+    def lock_name(self):
         return "%s-0x%02x" % (self.__class__.__name__, self.__I2C_ADDR)
 
 
@@ -353,13 +432,18 @@ class SCD30(object):
     def __cmd(self, cmd, arg=None):
         if arg:
             values = list(Encode.int(arg, '>'))
-            values.append(self.__crc(values))
+            values.append(CRC8.crc(values))
         else:
             values = ()
 
         try:
             I2C.Sensors.start_tx(self.__I2C_ADDR)
             I2C.Sensors.write_addr16(cmd, *values)
+
+        except OSError:
+            self.__selector.invalidate()                # the selector may have been reset
+            raise
+
         finally:
             I2C.Sensors.end_tx()
 
@@ -367,23 +451,16 @@ class SCD30(object):
 
 
     def __read_words(self, word_count):
-        char_count = word_count * 3
-        words = []
+        char_count = word_count * CRC8.GROUP_LENGTH
 
         chars = self.__read(char_count)
 
         # print(["0x%02x" % char for char in chars])
 
-        for i in range(0, char_count, 3):
-            word = chars[i:i + 2]
-            crc = chars[i + 2]
-
-            if not self.__crc_check(word, crc):
-                raise ValueError(chars)
+        if not CRC8.is_valid(chars):
+            raise ValueError(chars)
 
-            words.append(word)
-
-        return words
+        return [chars[i:i + CRC8.WORD_LENGTH] for i in range(0, char_count, CRC8.GROUP_LENGTH)]
 
 
     def __read(self, char_count):
@@ -392,23 +469,13 @@ class SCD30(object):
             chars = I2C.Sensors.read(char_count)
 
             return chars
-        finally:
-            I2C.Sensors.end_tx()
-
-
-    def __crc_check(self, word, crc):
-        return crc == self.__crc(word)
-
 
-    def __crc(self, word):
-        crc = self.__CRC8_INIT
+        except OSError:
+            self.__selector.invalidate()                # the selector may have been reset
+            raise
 
-        for byte in word:
-            crc ^= byte
-            for _ in range(8):
-                crc = 0xff & ((crc << 1) ^ self.__CRC8_POLYNOMIAL if crc & 0x80 else (crc << 1))
-
-        return crc
+        finally:
+            I2C.Sensors.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -418,6 +485,11 @@ class SCD30(object):
         return self.__ambient_pressure_kpa
 
 
+    @property
+    def ready_time(self):
+        return self.__ready_time
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
@@ -2,6 +2,9 @@
 Created on 2 Sep 2019
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The receiver's output is read continuously by an NMEAReader once the serial port is open - reports are lookups against
+the latest complete epoch.
 """
 
 import time
@@ -10,7 +13,8 @@ from abc import ABC, abstractmethod
 
 from scs_core.sys.logging import Logging
 
-from scs_host.sys.host_serial import HostSerial
+from scs_dfe.bus.bus import Bus
+from scs_dfe.gps.nmea_reader import NMEAReader
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -54,7 +58,8 @@ class GPS(ABC):
         """
         self.__interface = interface
 
-        self._serial = HostSerial(uart, self.baud_rate())
+        self._serial = Bus.serial(uart, self.baud_rate())
+        self._reader = NMEAReader(self._serial, self.serial_comms_timeout())
         self._logger = Logging.getLogger()
 
 
@@ -76,6 +81,7 @@ class GPS(ABC):
 
 
     def close(self):
+        self._reader.stop()
         self._serial.close()
 
 
@@ -94,6 +100,6 @@ class GPS(ABC):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return self.__class__.__name__ + ":{interface:%s, serial:%s}" % \
-               (self.__interface, self._serial)
+        return self.__class__.__name__ + ":{interface:%s, serial:%s, reader:%s}" % \
+               (self.__interface, self._serial, self._reader)
 
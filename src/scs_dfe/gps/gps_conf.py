@@ -7,13 +7,13 @@ specifies which GPS receiver is present, if any, plus sample interval, tally and
 
 example JSON:
 {"model": "PAM7Q", "sample-interval": 10, "tally": 1, "debug": true}
+
+The receiver classes are registered by source, and imported only when the configured model is used.
 """
 
 from scs_core.gps.gps_conf import GPSConf as AbstractGPSConf
 
-from scs_dfe.gps.gps_monitor import GPSMonitor
-from scs_dfe.gps.pam_7q import PAM7Q
-from scs_dfe.gps.sam_m8q import SAMM8Q
+from scs_dfe.data.class_registry import ClassRegistry
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -23,11 +23,21 @@ class GPSConf(AbstractGPSConf):
     classdocs
     """
 
+    __RECEIVERS = ClassRegistry({
+        'PAM7Q':    ('scs_dfe.gps.pam_7q', 'PAM7Q'),
+        'SAM8Q':    ('scs_dfe.gps.sam_m8q', 'SAMM8Q')
+    })
+
+    @classmethod
+    def receivers(cls):
+        return cls.__RECEIVERS
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
     def is_valid_model(cls, model):
-        return model in (PAM7Q.SOURCE, SAMM8Q.SOURCE)
+        return model in cls.__RECEIVERS
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -42,6 +52,8 @@ class GPSConf(AbstractGPSConf):
     # ----------------------------------------------------------------------------------------------------------------
 
     def gps_monitor(self, interface, host):
+        from scs_dfe.gps.gps_monitor import GPSMonitor                  # late import
+
         gps = self.gps(interface, host)
 
         return GPSMonitor.construct(gps, self)
@@ -51,14 +63,7 @@ class GPSConf(AbstractGPSConf):
         if self.model is None:
             return None
 
-        if self.model == PAM7Q.SOURCE:
-            return PAM7Q(interface, host.gps_device())
-
-        elif self.model == SAMM8Q.SOURCE:
-            return SAMM8Q(interface, host.gps_device())
-
-        else:
-            raise ValueError('unknown model: %s' % self.model)
+        return self.__RECEIVERS.resolve(self.model)(interface, host.gps_device())
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,121 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The GPSMonitor sampling loop, as a MonitorHost worker.
+"""
+
+import sys
+
+from scs_core.data.average import Average
+
+from scs_core.position.gps_datum import GPSDatum
+from scs_core.position.nmea.gpgga import GPGGA
+
+from scs_core.sys.filesystem import Filesystem
+
+from scs_dfe.monitor.monitor_worker import MonitorWorker
+
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GPSWorker(MonitorWorker):
+    """
+    classdocs
+    """
+
+    NAME =      'gps'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, gps, conf):
+        return cls(gps, conf.sample_interval, Average(conf.tally), conf.report_file(Host), conf.debug)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, gps, sample_interval, averaging, report_file, debug):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__gps = gps                                            # GPS
+
+        self.__sample_interval = int(sample_interval)               # int seconds
+        self.__averaging = averaging                                # Average
+        self.__report_file = report_file                            # string
+
+        self.__debug = bool(debug)                                  # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # MonitorWorker implementation...
+
+    def start(self):
+        self.__gps.power_on()
+        self.__gps.open()
+
+        self.__averaging.reset()
+
+
+    def stop(self):
+        self.__gps.close()
+        Filesystem.rm(self.__report_file)
+
+
+    def run(self, stop):
+        self._publish(GPSDatum.null_datum())                        # default report
+
+        for _ in self.intervals(stop, self.__sample_interval):
+            # position...
+            gga = self.__gps.report(GPGGA)
+
+            if self.__debug:
+                print("GPSWorker - gga: %s" % gga, file=sys.stderr)
+                sys.stderr.flush()
+
+            datum = GPSDatum.construct_from_gga(gga)
+
+            if datum is None:
+                datum = GPSDatum.null_datum()                       # loss of contact with receiver = quality null
+
+            datum.save(self.__report_file)
+
+            # average...
+            if datum.quality:
+                self.__averaging.append(datum)                      # only append valid positional fixes
+
+            report = self.__averaging.mid()
+
+            if report is None:
+                report = datum                                      # provide current datum when there is no average
+
+            report.quality = datum.quality                          # quality is current quality, not average quality
+
+            self._publish(report)
+
+
+    @property
+    def name(self):
+        return self.NAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # data retrieval for client process...
+
+    def sample(self):
+        jdict = self._read()
+
+        return GPSDatum.construct_from_jdict(jdict)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GPSWorker:{sample_interval:%s, averaging:%s, gps:%s, report_file:%s, debug:%s}" % \
+               (self.__sample_interval, self.__averaging, self.__gps, self.__report_file, self.__debug)
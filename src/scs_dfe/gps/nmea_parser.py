@@ -0,0 +1,149 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An incremental NMEA 0183 sentence parser: bytes are fed as they arrive from the receiver, and each sentence is returned
+as an NMEAReport as soon as its terminator is seen. The checksum is accumulated byte-by-byte, so that a sentence is
+validated without a second pass.
+
+Bytes outside a sentence - line noise, partial sentences following a buffer overrun, or binary protocol frames - are
+discarded until the next '$'.
+
+https://www.nmea.org
+https://en.wikipedia.org/wiki/NMEA_0183
+"""
+
+from scs_core.position.nmea.nmea_report import NMEAReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NMEAParser(object):
+    """
+    classdocs
+    """
+
+    MAX_SENTENCE_LENGTH =   120                             # NMEA specifies 82, u-blox proprietary sentences are longer
+
+    __START =               ord('$')
+    __CHECKSUM =            ord('*')
+    __EOL =                 (ord('\r'), ord('\n'))
+
+    __IDLE =                0
+    __BODY =                1
+    __CHECK =               2
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__state = self.__IDLE                          # int
+        self.__body = bytearray()                           # bytearray
+        self.__checksum = 0                                 # int
+        self.__received = bytearray()                       # bytearray
+
+        self.__sentences = 0                                # int
+        self.__errors = 0                                   # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def feed(self, data):
+        """
+        returns the list of valid NMEAReports completed by the given bytes
+        """
+        reports = []
+
+        for byte in data:
+            report = self.__feed_byte(byte)
+
+            if report is not None:
+                reports.append(report)
+
+        return reports
+
+
+    def reset(self):
+        self.__state = self.__IDLE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __feed_byte(self, byte):
+        if byte == self.__START:
+            if self.__state != self.__IDLE:
+                self.__errors += 1                          # truncated sentence
+
+            self.__state = self.__BODY
+            self.__body = bytearray(b'$')
+            self.__checksum = 0
+            return None
+
+        if self.__state == self.__IDLE:
+            return None
+
+        if self.__state == self.__BODY:
+            if byte == self.__CHECKSUM:
+                self.__state = self.__CHECK
+                self.__received = bytearray()
+                return None
+
+            if byte in self.__EOL or len(self.__body) >= self.MAX_SENTENCE_LENGTH:
+                return self.__reject()
+
+            self.__body.append(byte)
+            self.__checksum ^= byte
+            return None
+
+        # checksum...
+        if len(self.__received) < 2:
+            self.__received.append(byte)
+            return None
+
+        if byte not in self.__EOL:
+            return self.__reject()
+
+        self.__state = self.__IDLE
+
+        try:
+            valid = int(self.__received.decode('ascii'), 16) == self.__checksum
+            text = self.__body.decode('ascii')
+
+        except (UnicodeDecodeError, ValueError):
+            valid = False
+
+        if not valid:
+            self.__errors += 1
+            return None
+
+        self.__sentences += 1
+
+        return NMEAReport([field.strip() for field in text.split(',')])
+
+
+    def __reject(self):
+        self.__state = self.__IDLE
+        self.__errors += 1
+
+        return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sentences(self):
+        return self.__sentences
+
+
+    @property
+    def errors(self):
+        return self.__errors
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NMEAParser:{sentences:%s, errors:%s}" % (self.sentences, self.errors)
@@ -0,0 +1,155 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A continuously-running NMEA reader: the receiver's serial output is parsed incrementally as it arrives, and the
+sentences are grouped into epochs - the set of sentences output for a single fix. Reports are then lookups against the
+latest complete epoch, rather than blocking reads.
+
+An epoch is complete when a sentence of the following epoch arrives: either a time-tagged sentence with a new time, or
+a repeat of a once-per-epoch sentence (before the receiver has a time, its time fields are empty). The first group of
+sentences after a start or reset is discarded, since reading may have begun part-way through an epoch.
+"""
+
+import time
+
+from scs_dfe.gps.nmea_parser import NMEAParser
+from scs_dfe.gps.serial_reader import SerialReader
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NMEAReader(SerialReader):
+    """
+    classdocs
+    """
+
+    __TIME_FIELDS =     {'GGA': 1, 'GLL': 5, 'RMC': 1}      # sentence type: index of its time field
+    __ONCE_IDS =        ('GGA', 'GLL', 'RMC', 'VTG')        # sentence types output once per epoch
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, serial, comms_timeout):
+        """
+        Constructor
+        """
+        super().__init__(serial, comms_timeout)
+
+        self.__parser = NMEAParser()                        # NMEAParser
+
+        self.__current = []                                 # array of NMEAReport
+        self.__current_time = None                          # string
+        self.__aligned = False                              # bool - the current group began at an epoch boundary
+        self.__epoch = None                                 # array of NMEAReport
+        self.__epoch_received = None                        # float monotonic seconds
+        self.__epochs = 0                                   # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def report(self, message_class):
+        """
+        the first sentence of the given class in the latest complete epoch, or None
+        """
+        for sentence in self.__latest_epoch():
+            if sentence.message_id in message_class.MESSAGE_IDS:
+                return message_class.construct(sentence)
+
+        return None
+
+
+    def reports(self, message_class):
+        """
+        every sentence of the given class in the latest complete epoch, such as a GSV sequence
+        """
+        return [message_class.construct(sentence) for sentence in self.__latest_epoch()
+                if sentence.message_id in message_class.MESSAGE_IDS]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # SerialReader implementation...
+
+    def _receive(self, chunk):
+        for sentence in self.__parser.feed(chunk):
+            self._logger.debug("sentence:[%s]" % sentence)
+            self.__append(sentence)
+
+
+    def _reset(self):
+        self.__parser.reset()
+
+        self.__current = []
+        self.__current_time = None
+        self.__aligned = False
+        self.__epoch = None
+        self.__epoch_received = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __latest_epoch(self):
+        self.start()
+
+        with self._condition:
+            if self.__epoch is None:
+                self._condition.wait_for(lambda: self.__epoch is not None, self._comms_timeout)
+
+            if self.__epoch is None or time.monotonic() - self.__epoch_received > self._comms_timeout:
+                return []                                   # loss of contact with receiver
+
+            return self.__epoch
+
+
+    def __append(self, sentence):
+        message_type = sentence.message_id[3:]
+        time_field = self.__TIME_FIELDS.get(message_type)
+
+        sentence_time = sentence.str(time_field) if time_field is not None and len(sentence) > time_field else None
+
+        new_time = sentence_time is not None and self.__current_time is not None and \
+            sentence_time != self.__current_time
+
+        repeated = message_type in self.__ONCE_IDS and \
+            any(report.message_id == sentence.message_id for report in self.__current)
+
+        if self.__current and (new_time or repeated) and not self.__aligned:
+            self.__aligned = True                           # discard a partial first epoch
+
+            self.__current = []
+            self.__current_time = None
+
+        elif self.__current and (new_time or repeated):
+            with self._condition:
+                self.__epoch = self.__current
+                self.__epoch_received = time.monotonic()
+                self.__epochs += 1
+
+                self._condition.notify_all()
+
+            self.__current = []
+            self.__current_time = None
+
+        self.__current.append(sentence)
+
+        if sentence_time is not None:
+            self.__current_time = sentence_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def epochs(self):
+        return self.__epochs
+
+
+    @property
+    def parser(self):
+        return self.__parser
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NMEAReader:{comms_timeout:%s, running:%s, epochs:%s, parser:%s}" % \
+               (self._comms_timeout, self.is_running(), self.epochs, self.parser)
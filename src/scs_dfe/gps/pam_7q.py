@@ -21,7 +21,6 @@ from scs_core.position.nmea.gpgsa import GPGSA
 from scs_core.position.nmea.gpgsv import GPGSV
 from scs_core.position.nmea.gprmc import GPRMC
 from scs_core.position.nmea.gpvtg import GPVTG
-from scs_core.position.nmea.nmea_report import NMEAReport
 
 from scs_dfe.gps.gps import GPS
 
@@ -43,8 +42,6 @@ class PAM7Q(GPS):
     __SERIAL_LOCK_TIMEOUT =     6.0
     __SERIAL_COMMS_TIMEOUT =    5.0
 
-    __EOL =                     "\r\n"
-
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -77,58 +74,19 @@ class PAM7Q(GPS):
     # ----------------------------------------------------------------------------------------------------------------
 
     def report(self, message_class):
-        self._serial.flush_input()
-
-        while True:
-            try:
-                sentence = self.__sentence()
-            except TimeoutError:
-                return None
-
-            if sentence.message_id in message_class.MESSAGE_IDS:
-                return message_class.construct(sentence)
+        return self._reader.report(message_class)
 
 
     def report_all(self):
-        self._serial.flush_input()
-
-        reports = []
-
-        # find start...
-        while True:
-            sentence = self.__sentence()
-
-            if sentence.message_id in GPGLL.MESSAGE_IDS:
-                break
-
-        reports.append(GPGLL.construct(sentence))
-
-        reports.append(GPRMC.construct(self.__sentence()))
-        reports.append(GPVTG.construct(self.__sentence()))
-        reports.append(GPGGA.construct(self.__sentence()))
-        reports.append(GPGSA.construct(self.__sentence()))
-
-        # find end...
-        while True:
-            sentence = self.__sentence()
-
-            if sentence.message_id not in GPGSV.MESSAGE_IDS:
-                break
-
-            reports.append(GPGSV.construct(sentence))
-
-        return reports
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def __sentence(self):
-        while True:
-            try:
-                line = self._serial.read_line(eol=self.__EOL, timeout=self.__SERIAL_COMMS_TIMEOUT)
-                self._logger.debug("sentence:[%s]" % line)
-
-                return NMEAReport.construct(line)
-
-            except (IndexError, UnicodeDecodeError, ValueError):
-                continue
+        reports = [
+            self.report(GPGLL),
+            self.report(GPRMC),
+            self.report(GPVTG),
+            self.report(GPGGA),
+            self.report(GPGSA)
+            ]
+
+        if None in reports:
+            return []
+
+        return reports + self._reader.reports(GPGSV)
@@ -20,17 +20,29 @@ $GPGSV,4,4,15,31,08,027,10,36,25,141,,49,32,173,27*49
 $GLGSV,3,1,09,68,36,057,,69,75,334,23,70,25,259,,77,16,019,*6E
 $GLGSV,3,2,09,78,24,073,,79,07,121,,83,06,176,,84,53,215,*6A
 $GLGSV,3,3,09,85,43,314,*50
+
+Given a navigation rate, the receiver is configured over UBX on open: NMEA output is disabled, UBX-NAV-PVT is enabled
+at the given rate, and the baud rate is raised. GGA reports are then derived from NAV-PVT. On close, the receiver's
+saved configuration is restored.
 """
 
+import struct
+import time
+
 from scs_core.position.nmea.gpgga import GPGGA
 from scs_core.position.nmea.gpgll import GPGLL
 from scs_core.position.nmea.gpgsa import GPGSA
 from scs_core.position.nmea.gpgsv import GPGSV
 from scs_core.position.nmea.gprmc import GPRMC
 from scs_core.position.nmea.gpvtg import GPVTG
-from scs_core.position.nmea.nmea_report import NMEAReport
+
+from scs_dfe.bus.bus import Bus
 
 from scs_dfe.gps.gps import GPS
+from scs_dfe.gps.ubx_message import UBXMessage
+from scs_dfe.gps.ubx_nav_pvt import UBXNavPVT
+from scs_dfe.gps.ubx_parser import UBXParser
+from scs_dfe.gps.ubx_reader import UBXReader
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -42,6 +54,8 @@ class SAMM8Q(GPS):
 
     SOURCE =                    "SAM8Q"
 
+    DEFAULT_NAV_BAUD_RATE =     115200
+
     # ----------------------------------------------------------------------------------------------------------------
 
     __BAUD_RATE =               9600
@@ -50,7 +64,15 @@ class SAMM8Q(GPS):
     __SERIAL_LOCK_TIMEOUT =     6.0
     __SERIAL_COMMS_TIMEOUT =    5.0
 
-    __EOL =                     "\r\n"
+    __ACK_TIMEOUT =             1.0             # seconds
+    __BAUD_SWITCH_DELAY =       0.100           # seconds
+
+    __UART1 =                   1
+    __UART_MODE_8N1 =           0x000008d0
+    __PROTO_UBX =               0x01
+    __PROTO_NMEA =              0x02
+
+    __NMEA_IDS =                (0x00, 0x01, 0x02, 0x03, 0x04, 0x05)        # GGA, GLL, GSA, GSV, RMC, VTG
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -77,27 +99,73 @@ class SAMM8Q(GPS):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, interface, uart):
+    def __init__(self, interface, uart, nav_rate=None, nav_baud_rate=DEFAULT_NAV_BAUD_RATE):
+        """
+        Constructor
+        """
         super().__init__(interface, uart)
 
+        self.__uart = uart                                          # string
+        self.__nav_rate = nav_rate                                  # float Hz, or None for NMEA output
+        self.__nav_baud_rate = int(nav_baud_rate)                   # int
+
+        if self.ubx:
+            self._reader = UBXReader(self._serial, self.serial_comms_timeout())
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def report(self, message_class):
-        self._serial.flush_input()
+    def open(self):
+        super().open()
+
+        if not self.ubx:
+            return
+
+        try:
+            self.__configure()                                      # at the default baud rate
+
+        except TimeoutError:
+            self._logger.info("SAMM8Q: no response at %d baud" % self.baud_rate())
+
+        self.__reopen(self.nav_baud_rate)
+        self.__configure()                                          # confirms the new baud rate
 
-        while True:
+
+    def close(self):
+        if self.ubx:
             try:
-                sentence = self.__read_sentence()
-            except TimeoutError:
-                return None
+                revert = UBXMessage(UBXMessage.CLASS_CFG, UBXMessage.ID_CFG_CFG, struct.pack('<III', 0, 0, 0xffff))
+                self._serial.write(*revert.frame())
+
+            except (AttributeError, OSError):
+                pass
+
+        super().close()
+
+        if self.ubx:
+            self._serial = Bus.serial(self.__uart, self.baud_rate())
+            self._reader = UBXReader(self._serial, self.serial_comms_timeout())
 
-            if sentence.message_id in message_class.MESSAGE_IDS:
-                return message_class.construct(sentence)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def report(self, message_class):
+        if not self.ubx:
+            return None if message_class is UBXNavPVT else self._reader.report(message_class)
+
+        if message_class is UBXNavPVT:
+            return self._reader.report(UBXNavPVT)
+
+        if message_class is GPGGA:
+            pvt = self._reader.report(UBXNavPVT)
+            return None if pvt is None else pvt.as_gga()
+
+        return None                                                 # NMEA output is disabled
 
 
     def report_all(self):
-        self._serial.flush_input()
+        if self.ubx:
+            return [self.report(UBXNavPVT)]
 
         reports = [
             self.report(GPGLL),
@@ -113,13 +181,73 @@ class SAMM8Q(GPS):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __read_sentence(self):
-        while True:
-            try:
-                line = self._serial.read_line(eol=self.__EOL, timeout=self.__SERIAL_COMMS_TIMEOUT)
-                self._logger.debug("sentence:[%s]" % line)
+    def __configure(self):
+        for msg_id in self.__NMEA_IDS:
+            self.__command(UBXMessage.CLASS_CFG, UBXMessage.ID_CFG_MSG, bytes((UBXMessage.CLASS_NMEA, msg_id, 0)))
+
+        self.__command(UBXMessage.CLASS_CFG, UBXMessage.ID_CFG_MSG, bytes((UBXNavPVT.MSG_CLASS, UBXNavPVT.MSG_ID, 1)))
 
-                return NMEAReport.construct(line)
+        meas_rate = int(round(1000 / self.nav_rate))                # milliseconds
+        self.__command(UBXMessage.CLASS_CFG, UBXMessage.ID_CFG_RATE, struct.pack('<HHH', meas_rate, 1, 1))
+
+        # the port switches baud rate before acknowledging...
+        prt = struct.pack('<BBHIIHHHH', self.__UART1, 0, 0, self.__UART_MODE_8N1, self.nav_baud_rate,
+                          self.__PROTO_UBX | self.__PROTO_NMEA, self.__PROTO_UBX, 0, 0)
+
+        self._serial.write(*UBXMessage(UBXMessage.CLASS_CFG, UBXMessage.ID_CFG_PRT, prt).frame())
+        time.sleep(self.__BAUD_SWITCH_DELAY)
+
+
+    def __command(self, msg_class, msg_id, payload):
+        message = UBXMessage(msg_class, msg_id, payload)
+        self._serial.write(*message.frame())
+
+        parser = UBXParser()
+        end_time = time.time() + self.__ACK_TIMEOUT
+
+        while time.time() < end_time:
+            for response in parser.feed(self._serial.read(1)):
+                ack = response.is_ack_for(message)
+
+                if ack is None:
+                    continue
+
+                if not ack:
+                    raise ValueError("command rejected: %s" % message)
+
+                return
+
+        raise TimeoutError(self.__ACK_TIMEOUT)
+
+
+    def __reopen(self, baud_rate):
+        self._serial.close()
+
+        self._serial = Bus.serial(self.__uart, baud_rate)
+        self._serial.open(self.serial_lock_timeout(), self.serial_comms_timeout())
+
+        self._reader = UBXReader(self._serial, self.serial_comms_timeout())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ubx(self):
+        return self.__nav_rate is not None
+
+
+    @property
+    def nav_rate(self):
+        return self.__nav_rate
+
+
+    @property
+    def nav_baud_rate(self):
+        return self.__nav_baud_rate
+
+
+    # ----------------------------------------------------------------------------------------------------------------
 
-            except (IndexError, UnicodeDecodeError, ValueError):
-                continue
+    def __str__(self, *args, **kwargs):
+        return "SAMM8Q:{nav_rate:%s, nav_baud_rate:%s, gps:%s}" % \
+               (self.nav_rate, self.nav_baud_rate, super().__str__())
@@ -0,0 +1,129 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A background thread that reads a receiver's serial output continuously, handing each chunk to the implementation as it
+arrives. Implementations hold the latest data, and notify waiting clients through the condition.
+
+Each read blocks for a single byte only, then takes whatever else the port has waiting, so that the end of a message is
+handed on when it arrives, rather than when enough of the next message has arrived to fill a fixed-size read.
+
+The thread is started on the first request, in the process that makes it - the serial port may be opened by a parent
+process, before the monitor process is forked.
+"""
+
+import os
+import threading
+
+from abc import ABC, abstractmethod
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SerialReader(ABC):
+    """
+    classdocs
+    """
+
+    MAX_CHUNK_SIZE =    1024                                # bytes per read
+
+    __RETRY_DELAY =     1.0                                 # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, serial, comms_timeout):
+        """
+        Constructor
+        """
+        self._serial = serial                               # Serial
+        self._comms_timeout = comms_timeout                 # float seconds
+
+        self._condition = threading.Condition()             # Condition
+
+        self.__stop = threading.Event()                     # Event
+        self.__thread = None                                # Thread
+        self.__pid = None                                   # int
+
+        self._logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.is_running():
+            return
+
+        if self.__pid != os.getpid():                       # forked - the parent's state is not shared
+            self._condition = threading.Condition()
+            self._reset()
+
+        self.__stop.clear()
+        self.__pid = os.getpid()
+
+        self.__thread = threading.Thread(target=self.__run, name=self.__class__.__name__, daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        self.__stop.set()
+
+        if self.is_running():
+            self.__thread.join(self._comms_timeout)
+
+        self.__thread = None
+
+        with self._condition:
+            self._reset()
+
+
+    def is_running(self):
+        return self.__thread is not None and self.__thread.is_alive() and self.__pid == os.getpid()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def _receive(self, chunk):
+        pass
+
+
+    @abstractmethod
+    def _reset(self):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        while not self.__stop.is_set():
+            try:
+                chunk = self.__read_available()
+
+            except Exception as ex:
+                self._logger.error("%s: %s" % (self.__class__.__name__, repr(ex)))
+                self.__stop.wait(self.__RETRY_DELAY)
+
+                with self._condition:
+                    self._reset()
+
+                continue
+
+            if chunk:
+                self._receive(chunk)
+
+
+    def __read_available(self):
+        chunk = self._serial.read(1)                        # blocks until a byte arrives, or the comms timeout
+
+        if not chunk:
+            return chunk
+
+        waiting = getattr(self._serial, 'in_waiting', 0)    # a port without in_waiting is read byte by byte
+
+        if waiting:
+            chunk += self._serial.read(min(waiting, self.MAX_CHUNK_SIZE))
+
+        return chunk
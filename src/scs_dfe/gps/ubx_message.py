@@ -0,0 +1,115 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A u-blox UBX protocol frame: sync chars, class, id, little-endian payload length, payload and 8-bit Fletcher checksum
+over class to payload.
+
+https://www.u-blox.com/sites/default/files/products/documents/u-blox8-M8_ReceiverDescrProtSpec_UBX-13003221.pdf
+"""
+
+import struct
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class UBXMessage(object):
+    """
+    classdocs
+    """
+
+    SYNC =                  b'\xb5\x62'
+
+    CLASS_NAV =             0x01
+    CLASS_ACK =             0x05
+    CLASS_CFG =             0x06
+    CLASS_NMEA =            0xf0
+
+    ID_ACK_NAK =            0x00
+    ID_ACK_ACK =            0x01
+
+    ID_CFG_PRT =            0x00
+    ID_CFG_MSG =            0x01
+    ID_CFG_RATE =           0x08
+    ID_CFG_CFG =            0x09
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def checksum(cls, data):
+        ck_a = 0
+        ck_b = 0
+
+        for byte in data:
+            ck_a = (ck_a + byte) & 0xff
+            ck_b = (ck_b + ck_a) & 0xff
+
+        return ck_a, ck_b
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, msg_class, msg_id, payload=b''):
+        """
+        Constructor
+        """
+        self.__msg_class = msg_class                        # int
+        self.__msg_id = msg_id                              # int
+        self.__payload = bytes(payload)                     # bytes
+
+
+    def __eq__(self, other):
+        try:
+            return self.msg_class == other.msg_class and self.msg_id == other.msg_id and \
+                   self.payload == other.payload
+
+        except (TypeError, AttributeError):
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def frame(self):
+        body = struct.pack('<BBH', self.msg_class, self.msg_id, len(self.payload)) + self.payload
+
+        return self.SYNC + body + bytes(self.checksum(body))
+
+
+    def is_ack_for(self, message):
+        """
+        True if this is an ACK-ACK for the given message, False if an ACK-NAK, otherwise None
+        """
+        if self.msg_class != self.CLASS_ACK or self.payload[:2] != bytes((message.msg_class, message.msg_id)):
+            return None
+
+        return self.msg_id == self.ID_ACK_ACK
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def key(self):
+        return self.msg_class, self.msg_id
+
+
+    @property
+    def msg_class(self):
+        return self.__msg_class
+
+
+    @property
+    def msg_id(self):
+        return self.__msg_id
+
+
+    @property
+    def payload(self):
+        return self.__payload
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "UBXMessage:{msg_class:0x%02x, msg_id:0x%02x, payload:%s}" % \
+               (self.msg_class, self.msg_id, self.payload.hex())
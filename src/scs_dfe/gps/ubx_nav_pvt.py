@@ -0,0 +1,236 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+UBX-NAV-PVT: navigation position velocity time solution - a fixed 92-byte little-endian payload, decoded in one pass.
+A GPGGA equivalent is provided, so that GPSDatum and the GPS monitors are unaffected by the output protocol.
+
+example:
+UBXNavPVT:{itow:385200000, datetime:2026-10-18T11:00:00.000Z, fix_type:3, flags:0x01, num_sv:9,
+lat:50.8233592, lng:-0.1230755, height:69.6, h_msl:24.2, h_acc:1.2, ground_speed:0.105}
+"""
+
+import struct
+
+from scs_core.position.nmea.gpgga import GPGGA
+from scs_core.position.nmea.gploc import GPLoc
+from scs_core.position.nmea.gptime import GPTime
+
+from scs_dfe.gps.ubx_message import UBXMessage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class UBXNavPVT(object):
+    """
+    classdocs
+    """
+
+    MSG_CLASS =             UBXMessage.CLASS_NAV
+    MSG_ID =                0x07
+
+    FIX_NONE =              0
+    FIX_2D =                2
+    FIX_3D =                3
+
+    __FLAG_GNSS_FIX_OK =    0x01
+    __FLAG_DIFF_SOLN =      0x02
+
+    __LAYOUT = struct.Struct('<IHBBBBBBIiBBBBiiiiIIiiiiiIIHB5sihH')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, message):
+        if message.key != (cls.MSG_CLASS, cls.MSG_ID) or len(message.payload) != cls.__LAYOUT.size:
+            raise TypeError("invalid message:%s" % message)
+
+        (itow, year, month, day, hour, minute, sec, valid, _, nano, fix_type, flags, _, num_sv,
+         lng, lat, height, h_msl, h_acc, v_acc, _, _, _, ground_speed, head_mot, _, _, p_dop,
+         _, _, _, _, _) = cls.__LAYOUT.unpack(message.payload)
+
+        return cls(itow, (year, month, day, hour, minute, sec, nano), valid, fix_type, flags, num_sv,
+                   lat * 1e-7, lng * 1e-7, height / 1000.0, h_msl / 1000.0, h_acc / 1000.0, v_acc / 1000.0,
+                   ground_speed / 1000.0, head_mot * 1e-5, p_dop * 0.01)
+
+
+    @classmethod
+    def payload(cls, itow, utc, fix_type, flags, num_sv, lat, lng, height, h_msl, h_acc=0.0, v_acc=0.0,
+                ground_speed=0.0, head_mot=0.0, p_dop=99.99):
+        """
+        the encoded payload - for simulation and test
+        """
+        year, month, day, hour, minute, sec, nano = utc
+
+        return cls.__LAYOUT.pack(itow, year, month, day, hour, minute, sec, 0x07, 0, nano, fix_type, flags, 0,
+                                 num_sv, round(lng * 1e7), round(lat * 1e7), round(height * 1000),
+                                 round(h_msl * 1000), round(h_acc * 1000), round(v_acc * 1000), 0, 0, 0,
+                                 round(ground_speed * 1000), round(head_mot * 1e5), 0, 0, round(p_dop * 100),
+                                 0, b'\x00' * 5, 0, 0, 0)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, itow, utc, valid, fix_type, flags, num_sv, lat, lng, height, h_msl, h_acc, v_acc,
+                 ground_speed, head_mot, p_dop):
+        """
+        Constructor
+        """
+        self.__itow = itow                                  # int milliseconds - GPS time of week
+        self.__utc = utc                                    # tuple of year, month, day, hour, minute, sec, nano
+        self.__valid = valid                                # int validity flags
+
+        self.__fix_type = fix_type                          # int
+        self.__flags = flags                                # int fix status flags
+        self.__num_sv = num_sv                              # int
+
+        self.__lat = lat                                    # float degrees
+        self.__lng = lng                                    # float degrees
+        self.__height = height                              # float metres above ellipsoid
+        self.__h_msl = h_msl                                # float metres above mean sea level
+        self.__h_acc = h_acc                                # float metres
+        self.__v_acc = v_acc                                # float metres
+
+        self.__ground_speed = ground_speed                  # float metres per second
+        self.__head_mot = head_mot                          # float degrees
+        self.__p_dop = p_dop                                # float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has_fix(self):
+        return self.fix_type in (self.FIX_2D, self.FIX_3D) and bool(self.flags & self.__FLAG_GNSS_FIX_OK)
+
+
+    def quality(self):
+        """
+        the equivalent GGA quality indicator
+        """
+        if not self.has_fix():
+            return GPGGA.QUALITY_NO_FIX
+
+        if self.flags & self.__FLAG_DIFF_SOLN:
+            return GPGGA.QUALITY_DIFFERENTIAL_GNSS
+
+        return GPGGA.QUALITY_AUTONOMOUS_GNSS
+
+
+    def as_gga(self):
+        _, _, _, hour, minute, sec, nano = self.utc
+        hundredths = max(nano, 0) // 10000000
+
+        time = GPTime("%02d%02d%02d.%02d" % (hour, minute, sec, hundredths))
+
+        if self.has_fix():
+            loc = GPLoc(self.__nmea_angle(self.lat, 2), 'N' if self.lat >= 0 else 'S',
+                        self.__nmea_angle(self.lng, 3), 'E' if self.lng >= 0 else 'W')
+            alt = round(self.h_msl, 1)
+            sep = round(self.height - self.h_msl, 1)
+
+        else:
+            loc = GPLoc(None, None, None, None)
+            alt = None
+            sep = None
+
+        return GPGGA(GPGGA.MESSAGE_IDS[0], time, loc, self.quality(), self.num_sv, None, alt, sep, None, None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __nmea_angle(deg, deg_digits):
+        deg = abs(deg)
+        whole = int(deg)
+
+        return "%0*d%08.5f" % (deg_digits, whole, (deg - whole) * 60)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def itow(self):
+        return self.__itow
+
+
+    @property
+    def utc(self):
+        return self.__utc
+
+
+    @property
+    def valid(self):
+        return self.__valid
+
+
+    @property
+    def fix_type(self):
+        return self.__fix_type
+
+
+    @property
+    def flags(self):
+        return self.__flags
+
+
+    @property
+    def num_sv(self):
+        return self.__num_sv
+
+
+    @property
+    def lat(self):
+        return self.__lat
+
+
+    @property
+    def lng(self):
+        return self.__lng
+
+
+    @property
+    def height(self):
+        return self.__height
+
+
+    @property
+    def h_msl(self):
+        return self.__h_msl
+
+
+    @property
+    def h_acc(self):
+        return self.__h_acc
+
+
+    @property
+    def v_acc(self):
+        return self.__v_acc
+
+
+    @property
+    def ground_speed(self):
+        return self.__ground_speed
+
+
+    @property
+    def head_mot(self):
+        return self.__head_mot
+
+
+    @property
+    def p_dop(self):
+        return self.__p_dop
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        year, month, day, hour, minute, sec, nano = self.utc
+        millis = max(nano, 0) // 1000000
+        datetime = "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ" % (year, month, day, hour, minute, sec, millis)
+
+        return "UBXNavPVT:{itow:%s, datetime:%s, fix_type:%s, flags:0x%02x, num_sv:%s, lat:%s, lng:%s, height:%s, " \
+               "h_msl:%s, h_acc:%s, ground_speed:%s}" % \
+               (self.itow, datetime, self.fix_type, self.flags, self.num_sv, round(self.lat, 7), round(self.lng, 7),
+                self.height, self.h_msl, self.h_acc, self.ground_speed)
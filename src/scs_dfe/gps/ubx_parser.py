@@ -0,0 +1,154 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An incremental UBX frame parser: bytes are fed as they arrive from the receiver, and each frame is returned as a
+UBXMessage as soon as its checksum is seen. The Fletcher checksum is accumulated byte-by-byte.
+
+Bytes outside a frame - such as NMEA sentences, before they are disabled - are discarded until the next sync chars.
+"""
+
+from scs_dfe.gps.ubx_message import UBXMessage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class UBXParser(object):
+    """
+    classdocs
+    """
+
+    MAX_PAYLOAD_LENGTH =    1024
+
+    __SYNC_1, __SYNC_2 =    UBXMessage.SYNC
+
+    __IDLE =                0
+    __SYNC =                1
+    __HEADER =              2
+    __PAYLOAD =             3
+    __CHECK =               4
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__state = self.__IDLE                          # int
+        self.__header = bytearray()                         # bytearray
+        self.__payload = bytearray()                        # bytearray
+        self.__length = 0                                   # int
+        self.__ck_a = 0                                     # int
+        self.__ck_b = 0                                     # int
+        self.__received = bytearray()                       # bytearray
+
+        self.__messages = 0                                 # int
+        self.__errors = 0                                   # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def feed(self, data):
+        """
+        returns the list of valid UBXMessages completed by the given bytes
+        """
+        messages = []
+
+        for byte in data:
+            message = self.__feed_byte(byte)
+
+            if message is not None:
+                messages.append(message)
+
+        return messages
+
+
+    def reset(self):
+        self.__state = self.__IDLE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __feed_byte(self, byte):
+        if self.__state == self.__IDLE:
+            if byte == self.__SYNC_1:
+                self.__state = self.__SYNC
+
+            return None
+
+        if self.__state == self.__SYNC:
+            if byte == self.__SYNC_2:
+                self.__state = self.__HEADER
+                self.__header = bytearray()
+                self.__ck_a = 0
+                self.__ck_b = 0
+
+            else:
+                self.__state = self.__SYNC if byte == self.__SYNC_1 else self.__IDLE
+
+            return None
+
+        if self.__state in (self.__HEADER, self.__PAYLOAD):
+            self.__ck_a = (self.__ck_a + byte) & 0xff
+            self.__ck_b = (self.__ck_b + self.__ck_a) & 0xff
+
+        if self.__state == self.__HEADER:
+            self.__header.append(byte)
+
+            if len(self.__header) < 4:
+                return None
+
+            self.__length = self.__header[2] | (self.__header[3] << 8)
+
+            if self.__length > self.MAX_PAYLOAD_LENGTH:
+                self.__state = self.__IDLE
+                self.__errors += 1
+                return None
+
+            self.__payload = bytearray()
+            self.__received = bytearray()
+            self.__state = self.__CHECK if self.__length == 0 else self.__PAYLOAD
+            return None
+
+        if self.__state == self.__PAYLOAD:
+            self.__payload.append(byte)
+
+            if len(self.__payload) == self.__length:
+                self.__state = self.__CHECK
+
+            return None
+
+        # checksum...
+        self.__received.append(byte)
+
+        if len(self.__received) < 2:
+            return None
+
+        self.__state = self.__IDLE
+
+        if tuple(self.__received) != (self.__ck_a, self.__ck_b):
+            self.__errors += 1
+            return None
+
+        self.__messages += 1
+
+        return UBXMessage(self.__header[0], self.__header[1], self.__payload)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def messages(self):
+        return self.__messages
+
+
+    @property
+    def errors(self):
+        return self.__errors
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "UBXParser:{messages:%s, errors:%s}" % (self.messages, self.errors)
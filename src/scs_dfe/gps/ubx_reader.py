@@ -0,0 +1,92 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A continuously-running UBX reader: the receiver's serial output is parsed incrementally as it arrives, and the latest
+message of each class and id is held. Reports are then lookups, rather than blocking reads.
+"""
+
+import time
+
+from scs_dfe.gps.serial_reader import SerialReader
+from scs_dfe.gps.ubx_parser import UBXParser
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class UBXReader(SerialReader):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, serial, comms_timeout):
+        """
+        Constructor
+        """
+        super().__init__(serial, comms_timeout)
+
+        self.__parser = UBXParser()                         # UBXParser
+        self.__latest = {}                                  # dict of key: (UBXMessage, float monotonic seconds)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def report(self, message_class):
+        """
+        the latest message of the given class, or None
+        """
+        key = (message_class.MSG_CLASS, message_class.MSG_ID)
+
+        self.start()
+
+        with self._condition:
+            if key not in self.__latest:
+                self._condition.wait_for(lambda: key in self.__latest, self._comms_timeout)
+
+            if key not in self.__latest:
+                return None
+
+            message, received = self.__latest[key]
+
+        if time.monotonic() - received > self._comms_timeout:
+            return None                                     # loss of contact with receiver
+
+        return message_class.construct(message)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # SerialReader implementation...
+
+    def _receive(self, chunk):
+        messages = self.__parser.feed(chunk)
+
+        if not messages:
+            return
+
+        with self._condition:
+            for message in messages:
+                self.__latest[message.key] = (message, time.monotonic())
+
+            self._condition.notify_all()
+
+
+    def _reset(self):
+        self.__parser.reset()
+        self.__latest = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def parser(self):
+        return self.__parser
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "UBXReader:{comms_timeout:%s, running:%s, parser:%s}" % \
+               (self._comms_timeout, self.is_running(), self.parser)
@@ -0,0 +1,119 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A process-wide cache of calibration documents - AFECalib, AFEBaseline, Pt1000Calib.
+
+Each document is keyed on its absolute path, and is valid while the file's mtime, size and inode are unchanged - a save
+by the persistence manager is an atomic rename, so it always invalidates the entry. A missing file is cached too, until
+the file appears. A long-running process can therefore call gas_sensor_interface() each cycle, and pick up a new
+baseline, without parsing any file that has not changed.
+
+The scs_core sensor objects are process-wide singletons, bound to their calibration and baseline by
+AFECalib.sensors(..) - gas_sensors() rebinds them to the cached documents on every call, which costs no file access.
+
+Cached documents are shared between callers, and must not be modified. A persistence manager that is not
+filesystem-based is loaded through, uncached.
+"""
+
+import os
+import threading
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+
+from scs_core.sys.persistence_manager import FilesystemPersistenceManager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CalibCache(object):
+    """
+    classdocs
+    """
+
+    __documents = {}                                # dict of (abs_filename, skeleton): (stat, document)
+
+    __hits = 0                                      # int
+    __misses = 0                                    # int
+
+    __guard = threading.RLock()
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, persistent_class, host, skeleton=False):
+        """
+        the persistent_class document from the host, loaded only if the file has changed since the last load
+        """
+        if not isinstance(host, FilesystemPersistenceManager):
+            return persistent_class.load(host, skeleton=skeleton)
+
+        dirname, filename = persistent_class.persistence_location()
+        abs_filename = host.abs_filename(dirname, filename)
+
+        with cls.__guard:
+            stat = cls.__stat(abs_filename)
+            entry = cls.__documents.get((abs_filename, skeleton))
+
+            if entry is not None and entry[0] == stat:
+                cls.__hits += 1
+                return entry[1]
+
+            cls.__misses += 1
+
+            document = persistent_class.load(host, skeleton=skeleton)
+            cls.__documents[(abs_filename, skeleton)] = (stat, document)
+
+            return document
+
+
+    @classmethod
+    def gas_sensors(cls, host):
+        """
+        the sensors of the cached AFE calibration and baseline, or an empty list if there is no AFE calibration
+        """
+        with cls.__guard:
+            afe_calib = cls.load(AFECalib, host)
+
+            if afe_calib is None:
+                return []
+
+            afe_baseline = cls.load(AFEBaseline, host, skeleton=True)
+
+            return afe_calib.sensors(afe_baseline)
+
+
+    @classmethod
+    def clear(cls):
+        with cls.__guard:
+            cls.__documents = {}
+
+            cls.__hits = 0
+            cls.__misses = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __stat(abs_filename):
+        try:
+            stat = os.stat(abs_filename)
+
+        except FileNotFoundError:
+            return ()
+
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def hits(cls):
+        return cls.__hits
+
+
+    @classmethod
+    def misses(cls):
+        return cls.__misses
@@ -2,11 +2,16 @@
 Created on 6 Feb 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The output state is held in the PCA8574 shared-memory shadow. A change to a power output is also saved as the
+PCA8574 snapshot, so that the power states can be recovered after a reboot - LED changes are not saved.
 """
 
+from collections import OrderedDict
+
 from scs_dfe.interface.component.pca8574 import PCA8574
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
-from scs_host.lock.lock import Lock
 from scs_host.sys.host import Host
 
 
@@ -28,6 +33,8 @@ class IO(object):
     __MASK_LED_RED =        0x40            # 0100 0000
     __MASK_LED_GREEN =      0x80            # 1000 0000
 
+    __MASK_POWER =          __MASK_GPS | __MASK_OPC | __MASK_NDIR
+
     __LOCK =                "DFE_IO"
     __LOCK_TIMEOUT =        2.0
 
@@ -114,6 +121,14 @@ class IO(object):
         self.__set_output(IO.__MASK_NDIR, level)
 
 
+    def power_states(self):                                 # in the form of Interface.power_states()
+        if self.__device is None:
+            return None
+
+        return OrderedDict((('gases', None), ('gps', self.gps_power), ('modem', None), ('ndir', self.ndir_power),
+                            ('opc', self.opc_power)))
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # LED outputs...
 
@@ -137,42 +152,50 @@ class IO(object):
         self.__set_output(IO.__MASK_LED_GREEN, on)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def set_leds(self, red, green):                         # both LEDs in a single write
+        red_bits = IO.__MASK_LED_RED if red else 0x00
+        green_bits = IO.__MASK_LED_GREEN if green else 0x00
+
+        self.__set_outputs(IO.__MASK_LED_RED | IO.__MASK_LED_GREEN, red_bits | green_bits)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __get_output(self, mask):
         if self.__device is None:
             return None
 
-        Lock.acquire(IO.__lock_name(IO.__LOCK), IO.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(IO.__lock_name(IO.__LOCK), IO.__LOCK_TIMEOUT)
 
         try:
-            byte = self.__device.state.byte
+            byte = self.__device.byte
 
             return bool(byte & mask)
 
         finally:
-            Lock.release(IO.__lock_name(IO.__LOCK))
+            HierarchicalLock.release(IO.__lock_name(IO.__LOCK))
 
 
     def __set_output(self, mask, level):
+        self.__set_outputs(mask, mask if level else 0x00)
+
+
+    def __set_outputs(self, mask, bits):
         if self.__device is None:
             return
 
-        Lock.acquire(IO.__lock_name(IO.__LOCK), IO.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(IO.__lock_name(IO.__LOCK), IO.__LOCK_TIMEOUT)
 
         try:
-            byte = self.__device.state.byte
-
-            if level:
-                byte |= mask
-            else:
-                byte &= ~mask
+            self.__device.modify(mask, bits)
 
-            self.__device.write(byte)
-            self.__device.state = byte
+            if mask & IO.__MASK_POWER:
+                self.__device.save()
 
         finally:
-            Lock.release(IO.__lock_name(IO.__LOCK))
+            HierarchicalLock.release(IO.__lock_name(IO.__LOCK))
 
 
     # ----------------------------------------------------------------------------------------------------------------
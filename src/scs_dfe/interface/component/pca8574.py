@@ -2,6 +2,10 @@
 Created on 3 Feb 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The output state is shadowed in shared memory, shared by every process that drives the device. The JSON file is read
+only if the shadow is invalid - for example, following a reboot - and is written only if snapshot is set, or if shared
+memory is not available.
 """
 
 import os
@@ -10,6 +14,8 @@ from collections import OrderedDict
 
 from scs_core.data.json import JSONReport
 
+from scs_dfe.bus.register_shadow import RegisterShadow
+
 from scs_host.bus.i2c import I2C
 
 
@@ -23,8 +29,8 @@ class PCA8574(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
-    def construct(cls, addr, directory, file):
-        device = PCA8574(addr, directory, file)
+    def construct(cls, addr, directory, file, snapshot=False):
+        device = PCA8574(addr, directory, file, snapshot=snapshot)
 
         try:
             state = device.read()                           # test whether PCA8574 is present
@@ -36,13 +42,20 @@ class PCA8574(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, addr, directory, file):
+    def __init__(self, addr, directory, file, snapshot=False):
         """
         Constructor
         """
         self.__addr = addr
         self.__directory = directory
         self.__file = file
+        self.__snapshot = snapshot                          # bool
+
+        try:
+            self.__shadow = RegisterShadow.construct("PCA8574-0x%02x" % addr)      # RegisterShadow
+
+        except OSError:
+            self.__shadow = None                            # no shared memory - the JSON file is the only state
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -70,25 +83,78 @@ class PCA8574(object):
             I2C.Sensors.end_tx()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def modify(self, mask, bits):
+        """
+        replace the masked bits, in a single write - the caller must hold the device lock
+        """
+        byte = (self.byte & ~mask) | (bits & mask)
+
+        self.write(byte)
+        self.byte = byte
+
+        return byte
+
+
+    def save(self):
+        """
+        write the crash-recovery snapshot
+        """
+        PCA8574State(self.byte).save(self.__path())
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
+    @property
+    def byte(self):
+        if self.__shadow is None:
+            return PCA8574State.load(self.__path()).byte
+
+        byte = self.__shadow.get()
+
+        if byte is None:
+            byte = PCA8574State.load(self.__path()).byte        # recover from the snapshot, or the power-on state
+            self.__shadow.set(byte)
+
+        return byte
+
+
+    @byte.setter
+    def byte(self, byte):
+        if self.__shadow is not None:
+            self.__shadow.set(byte & 0xff)
+
+        if self.__snapshot or self.__shadow is None:
+            PCA8574State(byte).save(self.__path())
+
+
     @property
     def state(self):
-        return PCA8574State.load(os.path.join(self.__directory, self.__file))
+        return PCA8574State(self.byte)
 
 
     @state.setter
     def state(self, byte):
-        state = PCA8574State.load(os.path.join(self.__directory, self.__file))
+        self.byte = byte
+
+
+    @property
+    def snapshot(self):
+        return self.__snapshot
+
+
+    # ----------------------------------------------------------------------------------------------------------------
 
-        state.byte = byte
-        state.save(self.__file)
+    def __path(self):
+        return os.path.join(self.__directory, self.__file)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "PCA8574:{addr:0x%02x, directory:%s, file:%s}" % (self.__addr, self.__directory, self.__file)
+        return "PCA8574:{addr:0x%02x, directory:%s, file:%s, snapshot:%s}" % \
+               (self.__addr, self.__directory, self.__file, self.__snapshot)
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -4,17 +4,12 @@ Created on 20 Jun 2019
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
 A digital front-end (DFE) sensor interface
-"""
-
-from scs_core.gas.afe.pt1000_calib import Pt1000Calib
 
-from scs_dfe.gas.afe.afe import AFE
-from scs_dfe.gas.afe.mcp342x import MCP342X
-from scs_dfe.gas.afe.pt1000 import Pt1000
-from scs_dfe.gas.isi.isi import ISI
+The gas, Pt1000 and temperature sensor drivers are imported when they are first used, so that constructing the
+interface - for example, to switch power - does not import them.
+"""
 
 from scs_dfe.interface.component.io import IO
-from scs_dfe.interface.component.mcp9808 import MCP9808
 from scs_dfe.interface.interface import Interface
 
 from scs_dfe.led.io_led import IOLED
@@ -56,6 +51,8 @@ class DFE(Interface):
     # ----------------------------------------------------------------------------------------------------------------
 
     def status(self):
+        from scs_dfe.interface.component.mcp9808 import MCP9808                 # late import
+
         if self._temp_sensor is None:
             self._temp_sensor = MCP9808(True)
 
@@ -63,12 +60,16 @@ class DFE(Interface):
 
 
     def null_datum(self):
+        from scs_dfe.interface.component.mcp9808 import MCP9808                 # late import
+
         return MCP9808.null_datum()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def gas_sensor_interface(self, host):
+        from scs_dfe.gas.afe.afe import AFE                                     # late import
+
         # Pt1000...
         pt1000 = self.pt1000(host)
 
@@ -79,7 +80,12 @@ class DFE(Interface):
         if self.__pt1000_addr is None:
             return None
 
-        pt1000_calib = Pt1000Calib.load(host)
+        from scs_core.gas.afe.pt1000_calib import Pt1000Calib                   # late import
+
+        from scs_dfe.gas.afe.pt1000 import Pt1000
+        from scs_dfe.interface.calib_cache import CalibCache
+
+        pt1000_calib = CalibCache.load(Pt1000Calib, host)
 
         return Pt1000(pt1000_calib)
 
@@ -88,6 +94,8 @@ class DFE(Interface):
         if self.__pt1000_addr is None:
             return None
 
+        from scs_dfe.gas.afe.mcp342x import MCP342X                             # late import
+
         return MCP342X(self.__pt1000_addr, gain, rate)
 
 
@@ -119,6 +127,10 @@ class DFE(Interface):
         self._io.opc_power = on
 
 
+    def power_states(self):
+        return self._io.power_states()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
@@ -146,6 +158,8 @@ class ISIDFE(DFE):
     # ----------------------------------------------------------------------------------------------------------------
 
     def gas_sensor_interface(self, host):
+        from scs_dfe.gas.isi.isi import ISI                                     # late import
+
         return ISI(self._gas_sensors(host))
 
 
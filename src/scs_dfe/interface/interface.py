@@ -8,9 +8,6 @@ An abstract system interface
 
 from abc import ABC, abstractmethod
 
-from scs_core.gas.afe_baseline import AFEBaseline
-from scs_core.gas.afe_calib import AFECalib
-
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -24,15 +21,9 @@ class Interface(ABC):
 
     @classmethod
     def _gas_sensors(cls, host):
-        afe_calib = AFECalib.load(host)
-
-        if afe_calib is None:
-            return []
+        from scs_dfe.interface.calib_cache import CalibCache                    # late import
 
-        afe_baseline = AFEBaseline.load(host, skeleton=True)
-        sensors = afe_calib.sensors(afe_baseline)
-
-        return sensors
+        return CalibCache.gas_sensors(host)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -96,3 +87,12 @@ class Interface(ABC):
     @abstractmethod
     def power_opc(self, on):
         pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def power_states(self):
+        """
+        the power states last commanded, by name, without bus access - None if they are not known
+        """
+        return None
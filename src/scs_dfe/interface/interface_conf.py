@@ -5,21 +5,15 @@ Created on 21 Jun 2017
 
 specifies which sensor interface board is present, if any
 
+The interface and MCU classes are imported only when interface() constructs them.
+
 example JSON:
 {"model": "DFE"}
 """
 
 from scs_core.interface.interface_conf import InterfaceConf as AbstractInterfaceConf
-from scs_dfe.interface.dfe.dfe import DFE, ISIDFE
-
-from scs_dfe.interface.opcube.opcube import OPCube
-from scs_dfe.interface.opcube.opcube_mcu_t1 import OPCubeMCUt1
 
-from scs_dfe.interface.pzhb.pzhb import PZHB
-from scs_dfe.interface.pzhb.pzhb_mcu_t0 import PZHBMCUt0
-from scs_dfe.interface.pzhb.pzhb_mcu_t1_f1 import PZHBMCUt1f1
-from scs_dfe.interface.pzhb.pzhb_mcu_t2_f1 import PZHBMCUt2f1
-from scs_dfe.interface.pzhb.pzhb_mcu_t3_f1 import PZHBMCUt3f1
+from scs_dfe.data.class_registry import ClassRegistry
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -48,6 +42,23 @@ class InterfaceConf(AbstractInterfaceConf):
         return cls.__MODELS
 
 
+    __CLASSES = ClassRegistry({
+        'DFE':          ('scs_dfe.interface.dfe.dfe', 'DFE'),
+        'ISIDFE':       ('scs_dfe.interface.dfe.dfe', 'ISIDFE'),
+        'OPCube':       ('scs_dfe.interface.opcube.opcube', 'OPCube'),
+        'OPCubeMCUt1':  ('scs_dfe.interface.opcube.opcube_mcu_t1', 'OPCubeMCUt1'),
+        'PZHB':         ('scs_dfe.interface.pzhb.pzhb', 'PZHB'),
+        'PZHBMCUt0':    ('scs_dfe.interface.pzhb.pzhb_mcu_t0', 'PZHBMCUt0'),
+        'PZHBMCUt1f1':  ('scs_dfe.interface.pzhb.pzhb_mcu_t1_f1', 'PZHBMCUt1f1'),
+        'PZHBMCUt2f1':  ('scs_dfe.interface.pzhb.pzhb_mcu_t2_f1', 'PZHBMCUt2f1'),
+        'PZHBMCUt3f1':  ('scs_dfe.interface.pzhb.pzhb_mcu_t3_f1', 'PZHBMCUt3f1')
+    })
+
+    @classmethod
+    def classes(cls):
+        return cls.__CLASSES
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -76,35 +87,45 @@ class InterfaceConf(AbstractInterfaceConf):
             return None
 
         if self.model == 'DFE':
-            return DFE()
+            return self.__class('DFE')()
 
         if self.model == 'DFE/0x68':
-            return DFE(pt1000_addr=0x68)
+            return self.__class('DFE')(pt1000_addr=0x68)
 
         if self.model == 'DFE/0x69':
-            return DFE(pt1000_addr=0x69)
+            return self.__class('DFE')(pt1000_addr=0x69)
 
         if self.model == 'DFE/ISI':
-            return ISIDFE()
+            return self.__class('ISIDFE')()
 
         if self.model == 'OPCubeT1':
-            return OPCube(OPCubeMCUt1(OPCubeMCUt1.DEFAULT_ADDR))
+            return self.__class('OPCube')(self.__mcu('OPCubeMCUt1'))
 
         if self.model == 'PZHBt0':
-            return PZHB(PZHBMCUt0())
+            return self.__class('PZHB')(self.__class('PZHBMCUt0')())
 
         if self.model == 'PZHB' or self.model == 'PZHBt1':
-            return PZHB(PZHBMCUt1f1(PZHBMCUt1f1.DEFAULT_ADDR))
+            return self.__class('PZHB')(self.__mcu('PZHBMCUt1f1'))
 
         if self.model == 'PZHBt2':
-            return PZHB(PZHBMCUt2f1(PZHBMCUt2f1.DEFAULT_ADDR))
+            return self.__class('PZHB')(self.__mcu('PZHBMCUt2f1'))
 
         if self.model == 'PZHBt3':
-            return PZHB(PZHBMCUt3f1(PZHBMCUt3f1.DEFAULT_ADDR))
+            return self.__class('PZHB')(self.__mcu('PZHBMCUt3f1'))
 
         raise ValueError('unknown model: %s' % self.model)
 
 
+    def __class(self, name):
+        return self.__CLASSES.resolve(name)
+
+
+    def __mcu(self, name):
+        mcu_class = self.__class(name)
+
+        return mcu_class(mcu_class.DEFAULT_ADDR)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
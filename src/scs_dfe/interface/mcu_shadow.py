@@ -0,0 +1,167 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A register shadow for the write-only power and LED commands of an interface MCU, in shared memory, so that every
+process knows the last state commanded. A command that would not change the state is not sent.
+
+Within a batch, commands are deferred, so that a burst of changes - such as an LED colour - is sent under a single
+lock acquisition, with only the net change of each register.
+
+Each write - the shadow comparison, the command and the shadow update - is a single transaction on the MCU's lock, as
+is the flush at the end of a batch, so that the shadow cannot diverge from the MCU when processes interleave.
+
+The MCU may be reset independently of the host: the shadow should be invalidated when this is likely. Since a reset
+may not be observed, the shadow is trusted only for commands that this instance has sent within the expiry time - the
+first command for each register, and the first after each expiry, is always sent.
+"""
+
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from scs_dfe.bus.register_shadow import RegisterShadow
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MCUShadow(object):
+    """
+    classdocs
+    """
+
+    REGISTERS = ('pg', 'pp', 'pm', 'pn', 'po', 'l1', 'l2')         # device and command characters
+
+    POWER = OrderedDict((('gases', 'pg'), ('gps', 'pp'), ('modem', 'pm'), ('ndir', 'pn'), ('opc', 'po')))
+
+    DEFAULT_EXPIRY =    60.0                                # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, lock_name, send, lock_timeout, expiry=DEFAULT_EXPIRY):
+        try:
+            shadow = RegisterShadow.construct(lock_name, size=len(cls.REGISTERS))
+
+        except OSError:
+            shadow = None                                   # no shared memory - every command is sent
+
+        return cls(shadow, send, lock_name, lock_timeout, expiry)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, shadow, send, lock_name, lock_timeout, expiry=DEFAULT_EXPIRY):
+        """
+        Constructor
+        """
+        self.__shadow = shadow                              # RegisterShadow
+        self.__send = send                                  # function(device, command, arg)
+
+        self.__lock_name = lock_name                        # string
+        self.__lock_timeout = lock_timeout                  # float seconds
+        self.__expiry = expiry                              # float seconds
+
+        self.__sent = {}                                    # dict of register: monotonic time last sent
+
+        self.__pending = None                               # OrderedDict of register: arg, while batching
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, device, command, on):
+        """
+        True if the command was sent
+        """
+        register = device + command
+        arg = 1 if on else 0
+
+        if self.__pending is not None:
+            self.__pending[register] = arg
+            return False
+
+        return self.__write(register, arg)
+
+
+    @contextmanager
+    def batch(self):
+        if self.__pending is not None:
+            yield self                                      # nested - the outermost batch sends
+            return
+
+        self.__pending = OrderedDict()
+
+        try:
+            yield self
+            pending = self.__pending
+
+        finally:
+            self.__pending = None
+
+        with HierarchicalLock.transaction(self.__lock_name, timeout=self.__lock_timeout):
+            for register, arg in pending.items():
+                self.__write(register, arg)
+
+
+    def invalidate(self):
+        self.__sent = {}
+
+        if self.__shadow is not None:
+            self.__shadow.invalidate()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def state(self, device, command):
+        """
+        the last state commanded, or None if it is not known
+        """
+        if self.__shadow is None:
+            return None
+
+        arg = self.__shadow.get(self.REGISTERS.index(device + command))
+
+        return None if arg is None else bool(arg)
+
+
+    def power_states(self):
+        return OrderedDict((name, self.state(*register)) for name, register in self.POWER.items())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __write(self, register, arg):
+        index = self.REGISTERS.index(register)
+
+        with HierarchicalLock.transaction(self.__lock_name, timeout=self.__lock_timeout):
+            if self.__shadow is not None and self.__shadow.get(index) == arg and self.__is_confirmed(register):
+                return False
+
+            try:
+                self.__send(register[0], register[1], arg)
+
+            except OSError:
+                self.invalidate()
+                raise
+
+            if self.__shadow is not None:
+                self.__shadow.set(arg, index)
+
+            self.__sent[register] = time.monotonic()
+
+            return True
+
+
+    def __is_confirmed(self, register):
+        return register in self.__sent and time.monotonic() - self.__sent[register] < self.__expiry
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        states = OrderedDict((register, self.state(*register)) for register in self.REGISTERS)
+
+        return "MCUShadow:{shadow:%s, expiry:%s, states:%s}" % (self.__shadow is not None, self.__expiry, states)
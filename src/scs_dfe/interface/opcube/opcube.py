@@ -6,8 +6,6 @@ Created on 16 Sep 2020
 An OPCube controller
 """
 
-from scs_dfe.gas.isi.isi import ISI
-
 from scs_dfe.interface.interface import Interface
 from scs_dfe.interface.interface_status import InterfaceStatus
 
@@ -41,6 +39,8 @@ class OPCube(Interface):
     # ----------------------------------------------------------------------------------------------------------------
 
     def gas_sensor_interface(self, host):
+        from scs_dfe.gas.isi.isi import ISI                                     # late import
+
         sensors = self._gas_sensors(host)
 
         return None if not sensors else ISI(sensors)
@@ -82,6 +82,10 @@ class OPCube(Interface):
         return self.__mcu.power_opc(on)
 
 
+    def power_states(self):
+        return self.__mcu.power_states()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
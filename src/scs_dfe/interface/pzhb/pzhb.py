@@ -6,11 +6,6 @@ Created on 20 Jun 2019
 A Pi Zero Header Breakout system interface
 """
 
-from scs_core.gas.afe_baseline import AFEBaseline
-from scs_core.gas.afe_calib import AFECalib
-
-from scs_dfe.gas.isi.isi import ISI
-
 from scs_dfe.interface.interface import Interface
 
 
@@ -43,15 +38,14 @@ class PZHB(Interface):
     # ----------------------------------------------------------------------------------------------------------------
 
     def gas_sensor_interface(self, host):
+        from scs_dfe.gas.isi.isi import ISI                                     # late import
+
         # sensors...
-        afe_calib = AFECalib.load(host)
+        sensors = self._gas_sensors(host)
 
-        if afe_calib is None:
+        if not sensors:
             return None
 
-        afe_baseline = AFEBaseline.load(host, skeleton=True)
-        sensors = afe_calib.sensors(afe_baseline)
-
         return ISI(sensors)
 
 
@@ -91,6 +85,10 @@ class PZHB(Interface):
         return self.__mcu.power_opc(on)
 
 
+    def power_states(self):
+        return self.__mcu.power_states()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
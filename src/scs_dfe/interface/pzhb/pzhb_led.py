@@ -48,8 +48,9 @@ class PZHBLED(LED):
 
         states = self.__MAPPING[colour]
 
-        self.__mcu.led1(states[0])
-        self.__mcu.led2(states[1])
+        with self.__mcu.batch():
+            self.__mcu.led1(states[0])
+            self.__mcu.led2(states[1])
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -7,6 +7,7 @@ An abstract Pi Zero Header Breakout MCU
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -60,12 +61,22 @@ class PZHBMCU(ABC):
         pass
 
 
+    @contextmanager
+    def batch(self):                            # by default, commands are sent immediately
+        yield self
+
+
+    def power_states(self):                     # by default, power states are not known
+        return None
+
+
     def power_all(self, on):
-        self.power_gases(on)
-        self.power_gps(on)
-        self.power_ndir(on)
-        self.power_opc(on)
-        self.power_modem(on)
+        with self.batch():
+            self.power_gases(on)
+            self.power_gps(on)
+            self.power_ndir(on)
+            self.power_opc(on)
+            self.power_modem(on)
 
 
     @abstractmethod
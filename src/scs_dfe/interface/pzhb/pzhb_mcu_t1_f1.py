@@ -15,9 +15,9 @@ from scs_core.data.datum import Decode
 from scs_dfe.interface.component.io import IO
 from scs_dfe.interface.pzhb.pzhb_mcu import PZHBMCU
 from scs_dfe.led.io_led import IOLED
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
 from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -115,6 +115,10 @@ class PZHBMCUt1f1(PZHBMCU):
         self.__io.opc_power = on
 
 
+    def power_states(self):
+        return self.__io.power_states()
+
+
     def power_modem(self, on):
         pass
 
@@ -140,11 +144,11 @@ class PZHBMCUt1f1(PZHBMCU):
     # ----------------------------------------------------------------------------------------------------------------
 
     def obtain_lock(self):
-        Lock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
 
 
     def release_lock(self):
-        Lock.release(self.__lock_name)
+        HierarchicalLock.release(self.__lock_name)
 
 
     @property
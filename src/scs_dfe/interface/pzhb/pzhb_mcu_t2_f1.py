@@ -10,13 +10,16 @@ https://github.com/south-coast-science/scs_rpz_header_t2_f1
 
 import time
 
+from contextlib import contextmanager
+
 from scs_core.data.datum import Decode
 
+from scs_dfe.interface.mcu_shadow import MCUShadow
 from scs_dfe.interface.pzhb.pzhb_led import PZHBLED
 from scs_dfe.interface.pzhb.pzhb_mcu import PZHBMCU
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
 from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -41,12 +44,15 @@ class PZHBMCUt2f1(PZHBMCU):
         Constructor
         """
         self.__addr = addr
+        self.__shadow = MCUShadow.construct(self.__lock_name, self.__send,       # MCUShadow
+                                            self.__LOCK_TIMEOUT)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def host_shutdown_initiated(self):
         self.__cmd(0, 'h', 'i')
+        self.__shadow.invalidate()                  # the MCU will remove power
 
 
     def button_enable(self):
@@ -97,37 +103,61 @@ class PZHBMCUt2f1(PZHBMCU):
 
 
     def power_gases(self, on):                  # switches digital component only
-        self.__cmd(0, 'p', 'g', on)
+        self.__shadow.update('p', 'g', on)
 
 
     def power_gps(self, on):
-        self.__cmd(0, 'p', 'p', on)
+        self.__shadow.update('p', 'p', on)
 
 
     def power_modem(self, on):
-        self.__cmd(0, 'p', 'm', on)
+        self.__shadow.update('p', 'm', on)
 
 
     def power_ndir(self, on):                   # WARNING: this crashes the MCU on versions prior to 002.001.008
-        self.__cmd(0, 'p', 'n', on)
+        self.__shadow.update('p', 'n', on)
 
 
     def power_opc(self, on):
-        self.__cmd(0, 'p', 'o', on)
+        self.__shadow.update('p', 'o', on)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def led1(self, on):
-        self.__cmd(0, 'l', '1', on)                 # LED 1
+        self.__shadow.update('l', '1', on)          # LED 1
 
 
     def led2(self, on):
-        self.__cmd(0, 'l', '2', on)                 # LED 2
+        self.__shadow.update('l', '2', on)          # LED 2
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @contextmanager
+    def batch(self):
+        """
+        send a burst of power and LED commands under a single lock acquisition, without redundant commands
+        """
+        with HierarchicalLock.transaction(self.__lock_name, timeout=self.__LOCK_TIMEOUT):
+            with self.__shadow.batch():
+                yield self
+
+
+    def power_states(self):
+        return self.__shadow.power_states()
+
+
+    def invalidate(self):
+        self.__shadow.invalidate()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __send(self, device, command, arg):
+        self.__cmd(0, device, command, arg)
+
+
     def __cmd(self, response_size, device, command, arg=0):
         message = [ord(device), ord(command), arg]
 
@@ -149,11 +179,11 @@ class PZHBMCUt2f1(PZHBMCU):
     # ----------------------------------------------------------------------------------------------------------------
 
     def obtain_lock(self):
-        Lock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
 
 
     def release_lock(self):
-        Lock.release(self.__lock_name)
+        HierarchicalLock.release(self.__lock_name)
 
 
     @property
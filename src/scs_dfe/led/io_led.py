@@ -61,8 +61,7 @@ class IOLED(LED):
 
         state = LED.STATES[colour]
 
-        self.__io.led_red = state & self.__RED_MASK
-        self.__io.led_green = state & self.__GREEN_MASK
+        self.__io.set_leds(state & self.__RED_MASK, state & self.__GREEN_MASK)
 
 
     # ----------------------------------------------------------------------------------------------------------------
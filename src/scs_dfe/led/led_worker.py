@@ -0,0 +1,86 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The LEDController loop, as a MonitorHost worker. The client process writes the LED state to the worker's slot.
+"""
+
+from scs_core.led.led_state import LEDState
+
+from scs_dfe.monitor.monitor_worker import MonitorWorker
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class LEDWorker(MonitorWorker):
+    """
+    classdocs
+    """
+
+    NAME =              'led'
+
+    __STATE0_PERIOD =   0.7             # seconds - short period
+    __STATE1_PERIOD =   0.3             # seconds - long period
+
+    __SLOT_SIZE =       256             # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, led):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__led = led
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # MonitorWorker implementation...
+
+    def stop(self):
+        self.__led.colour = 'A'                     # set default mode on stop
+
+
+    def run(self, stop):
+        for _ in self.intervals(stop, self.__STATE0_PERIOD + self.__STATE1_PERIOD):
+            # values...
+            state = LEDState.construct_from_jdict(self._read())
+
+            if state is None or not state.is_valid():
+                continue
+
+            # state 0 (short)...
+            if state.colour0 != self.__led.colour:
+                self.__led.colour = state.colour0
+
+            if stop.wait(self.__STATE0_PERIOD):
+                break
+
+            # state 1 (long)...
+            if state.colour1 != self.__led.colour:
+                self.__led.colour = state.colour1
+
+
+    @property
+    def name(self):
+        return self.NAME
+
+
+    @property
+    def slot_size(self):
+        return self.__SLOT_SIZE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # setter for client process...
+
+    def set_state(self, state):
+        self._publish(state)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "LEDWorker:{led:%s}" % self.__led
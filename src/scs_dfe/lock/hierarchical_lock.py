@@ -0,0 +1,190 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A two-level lock, with the interface of the scs_host Lock: the outermost acquisition of a name by a thread takes an
+in-process lock, then the cross-process file lock - nested acquisitions by the same thread only increment a count.
+The file lock is released when the outermost acquisition is released.
+
+A logical transaction - such as a whole AFE cycle - may hold several names at once, so that the register accesses
+within it are nested:
+
+with HierarchicalLock.transaction('ADS1115-0x48', 'ADS1115-0x49', timeout=adc.lock_timeout):
+    ...
+
+Names in a transaction are acquired in sorted order, to avoid deadlock between transactions. There is no default
+timeout: the caller gives the timeout of the drivers whose names it holds.
+
+Within a transaction, a surplus release - such as a driver's defensive release in a finally clause - does not release
+the name. A release by a thread that does not hold the name is ignored: the name may be held by another thread, or the
+file lock by another process.
+"""
+
+import threading
+import time
+
+from contextlib import contextmanager
+
+from scs_dfe.lock.hierarchical_lock_timeout import HierarchicalLockTimeout
+from scs_dfe.lock.lock_stats import LockStats
+
+from scs_host.lock.lock import Lock
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HierarchicalLock(object):
+    """
+    classdocs
+    """
+
+    __mutexes = {}                                  # dict of name: threading.Lock
+    __stats = {}                                    # dict of name: LockStats
+    __guard = threading.Lock()
+
+    __local = threading.local()                     # per-thread dict of name: [depth, pins, acquisition time]
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def acquire(cls, name, timeout):
+        """
+        True if this was the outermost acquisition of the name by this thread
+        """
+        held = cls.__held()
+
+        if name in held:
+            held[name][0] += 1
+
+            cls.__stats_for(name).record_nested()
+            return False
+
+        mutex, stats = cls.__mutex_for(name), cls.__stats_for(name)
+
+        start_time = time.monotonic()
+        contended = not mutex.acquire(blocking=False)
+
+        if contended and not mutex.acquire(timeout=timeout):
+            stats.record_timeout()
+            raise HierarchicalLockTimeout(name)
+
+        try:
+            Lock.acquire(name, max(0.0, timeout - (time.monotonic() - start_time)))
+
+        except BaseException:
+            mutex.release()
+            raise
+
+        acquired = time.monotonic()
+        held[name] = [1, 0, acquired]
+
+        stats.record_outer(acquired - start_time, contended)
+
+        return True
+
+
+    @classmethod
+    def release(cls, name):
+        held = cls.__held()
+
+        if name not in held:
+            return                                          # not held by this thread - nothing to release
+
+        depth, pins, acquired = held[name]
+
+        if depth <= pins:
+            return                                          # a surplus release cannot end a transaction
+
+        if depth > 1:
+            held[name][0] -= 1
+            return
+
+        del held[name]
+
+        try:
+            Lock.release(name)
+
+        finally:
+            cls.__mutexes[name].release()
+            cls.__stats_for(name).record_hold(time.monotonic() - acquired)
+
+
+    @classmethod
+    @contextmanager
+    def transaction(cls, *names, timeout):
+        names = sorted(set(name for name in names if name is not None))
+        held = cls.__held()
+        acquired = []
+
+        try:
+            for name in names:
+                cls.acquire(name, timeout)
+                held[name][1] += 1
+                acquired.append(name)
+
+            yield
+
+        finally:
+            for name in reversed(acquired):
+                held[name][1] -= 1
+                cls.release(name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def depth(cls, name):
+        """
+        the number of acquisitions of the name currently held by this thread
+        """
+        held = cls.__held()
+
+        return held[name][0] if name in held else 0
+
+
+    @classmethod
+    def stats(cls, name):
+        return cls.__stats.get(name)
+
+
+    @classmethod
+    def all_stats(cls):
+        with cls.__guard:
+            return dict(cls.__stats)
+
+
+    @classmethod
+    def reset_stats(cls):
+        with cls.__guard:
+            cls.__stats = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __held(cls):
+        local = cls.__local
+
+        if not hasattr(local, 'held'):
+            local.held = {}
+
+        return local.held
+
+
+    @classmethod
+    def __mutex_for(cls, name):
+        with cls.__guard:
+            if name not in cls.__mutexes:
+                cls.__mutexes[name] = threading.Lock()
+
+            return cls.__mutexes[name]
+
+
+    @classmethod
+    def __stats_for(cls, name):
+        with cls.__guard:
+            if name not in cls.__stats:
+                cls.__stats[name] = LockStats()
+
+            return cls.__stats[name]
@@ -0,0 +1,41 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+raised when a HierarchicalLock name is held by another thread of this process beyond the timeout - a LockTimeout, so
+that callers handle in-process contention in the same way as contention between processes
+"""
+
+from scs_host.lock.lock_timeout import LockTimeout
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HierarchicalLockTimeout(LockTimeout):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name):
+        """
+        Constructor
+        """
+        RuntimeError.__init__(self, name)
+
+        self.__name = name                              # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HierarchicalLockTimeout:{name:%s}" % self.name
@@ -0,0 +1,132 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Contention and hold-time statistics for a HierarchicalLock name. Outer acquisitions take the cross-process file lock,
+nested acquisitions do not. Times are in seconds.
+
+example JSON:
+{"outer": 120, "nested": 840, "contended": 3, "timeouts": 0, "wait": {"total": 0.0412, "max": 0.0208},
+"hold": {"total": 37.2, "max": 0.412}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class LockStats(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__outer = 0                                # int
+        self.__nested = 0                               # int
+        self.__contended = 0                            # int
+        self.__timeouts = 0                             # int
+
+        self.__wait_total = 0.0                         # float seconds
+        self.__wait_max = 0.0                           # float seconds
+
+        self.__hold_total = 0.0                         # float seconds
+        self.__hold_max = 0.0                           # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record_outer(self, wait, contended):
+        self.__outer += 1
+
+        if contended:
+            self.__contended += 1
+
+        self.__wait_total += wait
+        self.__wait_max = max(self.__wait_max, wait)
+
+
+    def record_nested(self):
+        self.__nested += 1
+
+
+    def record_timeout(self):
+        self.__timeouts += 1
+
+
+    def record_hold(self, hold):
+        self.__hold_total += hold
+        self.__hold_max = max(self.__hold_max, hold)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['outer'] = self.outer
+        jdict['nested'] = self.nested
+        jdict['contended'] = self.contended
+        jdict['timeouts'] = self.timeouts
+        jdict['wait'] = OrderedDict([('total', round(self.wait_total, 6)), ('max', round(self.wait_max, 6))])
+        jdict['hold'] = OrderedDict([('total', round(self.hold_total, 6)), ('max', round(self.hold_max, 6))])
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def outer(self):
+        return self.__outer
+
+
+    @property
+    def nested(self):
+        return self.__nested
+
+
+    @property
+    def contended(self):
+        return self.__contended
+
+
+    @property
+    def timeouts(self):
+        return self.__timeouts
+
+
+    @property
+    def wait_total(self):
+        return self.__wait_total
+
+
+    @property
+    def wait_max(self):
+        return self.__wait_max
+
+
+    @property
+    def hold_total(self):
+        return self.__hold_total
+
+
+    @property
+    def hold_max(self):
+        return self.__hold_max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "LockStats:{outer:%s, nested:%s, contended:%s, timeouts:%s, wait_total:%s, wait_max:%s, " \
+               "hold_total:%s, hold_max:%s}" % \
+               (self.outer, self.nested, self.contended, self.timeouts, self.wait_total, self.wait_max,
+                self.hold_total, self.hold_max)
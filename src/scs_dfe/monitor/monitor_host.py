@@ -0,0 +1,144 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A single process hosting several monitor workers - such as OPC, GPS and LED - each on its own thread, in place of a
+SynchronisedProcess and a Manager server process per monitor. The workers publish through one MonitorState block.
+
+On stop, the workers are asked to finish, and the process is terminated only if they do not.
+
+example:
+host = MonitorHost(OPCWorker(opc, conf, Host), GPSWorker.construct(gps, gps_conf), LEDWorker(led))
+host.start()
+...
+datum = host.worker('opc').sample()
+"""
+
+import threading
+
+from collections import OrderedDict
+from multiprocessing import Event
+
+from scs_core.sync.synchronised_process import SynchronisedProcess
+
+from scs_core.sys.logging import Logging
+
+from scs_dfe.monitor.monitor_state import MonitorState
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MonitorHost(SynchronisedProcess):
+    """
+    classdocs
+    """
+
+    __STOP_TIMEOUT =    10.0            # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, *workers):
+        """
+        Constructor
+        """
+        self.__logger = Logging.getLogger()
+        self.__logging_specification = Logging.specification()
+
+        SynchronisedProcess.__init__(self)
+
+        self.__workers = OrderedDict((worker.name, worker) for worker in workers)
+        self.__state = MonitorState.create(OrderedDict((worker.name, worker.slot_size) for worker in workers))
+
+        for worker in workers:
+            worker.bind(self.__state)
+
+        self.__stop = Event()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # SynchronisedProcess implementation...
+
+    def start(self):
+        try:
+            for worker in self.__workers.values():
+                worker.start()
+
+            self.__stop.clear()
+
+            super().start()
+
+        except (KeyboardInterrupt, SystemExit):
+            pass
+
+
+    def stop(self):
+        try:
+            self.__stop.set()
+
+            if self._proc is not None:
+                self._proc.join(self.__STOP_TIMEOUT)
+
+            super().stop()                                  # terminate, if the workers did not finish
+
+            for worker in self.__workers.values():
+                try:
+                    worker.stop()
+
+                except Exception as ex:
+                    self.__logger.error("%s: %s" % (worker.name, repr(ex)))
+
+        except (ConnectionError, KeyboardInterrupt, SystemExit):
+            pass
+
+        finally:
+            self.__state.close()
+
+
+    def run(self):
+        Logging.replicate(self.__logging_specification)
+        self.__logger = Logging.getLogger()
+
+        threads = [threading.Thread(target=self.__run_worker, args=(worker, ), name=worker.name, daemon=True)
+                   for worker in self.__workers.values()]
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        except (ConnectionError, KeyboardInterrupt, SystemExit):
+            pass
+
+
+    def __run_worker(self, worker):
+        try:
+            worker.run(self.__stop)
+
+        except Exception as ex:
+            self.__logger.error("%s: %s" % (worker.name, repr(ex)))
+            self.__state.set_status(worker.name, MonitorState.STATUS_FATAL_ERROR)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def worker(self, name):
+        return self.__workers[name]
+
+
+    @property
+    def names(self):
+        return list(self.__workers.keys())
+
+
+    @property
+    def state(self):
+        return self.__state
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MonitorHost:{workers:%s, state:%s}" % (self.names, self.__state)
@@ -0,0 +1,197 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A block of named slots in shared memory, each holding the latest JSON document of one monitor worker, with a status.
+Each slot has a single writer and any number of readers, and is protected by a sequence lock - the writer makes the
+sequence number odd while it writes - so that readers neither block the writer nor pass messages.
+
+layout, per slot:
+seq (uint64), status (int32), length (uint32), document (size bytes)
+
+https://docs.python.org/3/library/multiprocessing.shared_memory.html
+https://en.wikipedia.org/wiki/Seqlock
+"""
+
+import json
+import struct
+
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MonitorState(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_SLOT_SIZE =         2048                # bytes
+
+    STATUS_OK =                 0
+    STATUS_EMPTY =              1
+    STATUS_FATAL_ERROR =        -1
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    __SEQ =                     struct.Struct('<Q')
+    __HEADER =                  struct.Struct('<iI')
+
+    __MAX_READ_ATTEMPTS =       100
+
+    __created = set()                               # names of segments created by this process
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def create(cls, slots, name=None):
+        """
+        slots is an OrderedDict of slot name: document size
+        """
+        offsets = cls.__offsets(slots)
+        size = sum(cls.__SEQ.size + cls.__HEADER.size + slot_size for slot_size in slots.values())
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        cls.__created.add(shm.name)
+
+        state = cls(shm, slots, offsets, True)
+
+        for slot in slots:
+            state.set_status(slot, cls.STATUS_EMPTY)
+
+        return state
+
+
+    @classmethod
+    def attach(cls, name, slots):
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)            # Python 3.13+
+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+
+            if shm.name not in cls.__created:
+                resource_tracker.unregister(shm._name, 'shared_memory')         # the creator owns the segment
+
+        return cls(shm, slots, cls.__offsets(slots), False)
+
+
+    @classmethod
+    def __offsets(cls, slots):
+        offsets = OrderedDict()
+        offset = 0
+
+        for slot, slot_size in slots.items():
+            offsets[slot] = offset
+            offset += cls.__SEQ.size + cls.__HEADER.size + slot_size
+
+        return offsets
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, shm, slots, offsets, owner):
+        """
+        Constructor
+        """
+        self.__shm = shm                                    # SharedMemory
+        self.__slots = slots                                # OrderedDict of slot name: document size
+        self.__offsets = offsets                            # OrderedDict of slot name: offset
+        self.__owner = owner                                # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # writer...
+
+    def write(self, slot, document):
+        """
+        document is a JSONable, or anything that JSONify can encode
+        """
+        chars = JSONify.dumps(document).encode()
+
+        if len(chars) > self.__slots[slot]:
+            raise ValueError("MonitorState: document too long for %s: %d" % (slot, len(chars)))
+
+        self.__store(slot, self.STATUS_OK, chars)
+
+
+    def set_status(self, slot, status):
+        self.__store(slot, status, b'')
+
+
+    def close(self):
+        self.__shm.close()
+
+        if self.__owner:
+            self.__shm.unlink()
+            self.__created.discard(self.__shm.name)
+
+
+    def __store(self, slot, status, chars):
+        offset = self.__offsets[slot]
+        seq = self.__SEQ.unpack_from(self.__shm.buf, offset)[0]
+
+        body = offset + self.__SEQ.size + self.__HEADER.size
+
+        self.__SEQ.pack_into(self.__shm.buf, offset, seq + 1)                       # odd: write in progress
+        self.__HEADER.pack_into(self.__shm.buf, offset + self.__SEQ.size, status, len(chars))
+        self.__shm.buf[body:body + len(chars)] = chars
+        self.__SEQ.pack_into(self.__shm.buf, offset, seq + 2)                       # even: stable
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # readers...
+
+    def read(self, slot):
+        """
+        the latest document as a jdict, or None if the slot is not OK
+        """
+        status, chars = self.__load(slot)
+
+        return json.loads(chars.decode(), object_pairs_hook=OrderedDict) if status == self.STATUS_OK else None
+
+
+    def status(self, slot):
+        return self.__load(slot)[0]
+
+
+    def __load(self, slot):
+        offset = self.__offsets[slot]
+        body = offset + self.__SEQ.size + self.__HEADER.size
+
+        for _ in range(self.__MAX_READ_ATTEMPTS):
+            seq = self.__SEQ.unpack_from(self.__shm.buf, offset)[0]
+
+            if seq & 1:
+                continue
+
+            status, length = self.__HEADER.unpack_from(self.__shm.buf, offset + self.__SEQ.size)
+            chars = bytes(self.__shm.buf[body:body + length])
+
+            if self.__SEQ.unpack_from(self.__shm.buf, offset)[0] == seq:
+                return status, chars
+
+        return self.STATUS_EMPTY, b''                                               # writer is too busy
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__shm.name
+
+
+    @property
+    def slots(self):
+        return self.__slots
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MonitorState:{name:%s, owner:%s, slots:%s}" % (self.name, self.__owner, dict(self.slots))
@@ -0,0 +1,110 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An abstract worker for a MonitorHost: run() is called on its own thread in the host process, and publishes to the
+worker's slot in the host's MonitorState. start() and stop() are called in the client process, before the host
+process is started and after it is stopped. Client-side accessors read the slot directly.
+
+run() should return promptly once the stop event is set.
+"""
+
+import time
+
+from abc import ABC, abstractmethod
+
+from scs_dfe.monitor.monitor_state import MonitorState
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MonitorWorker(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def intervals(stop, interval):
+        """
+        yield at the interval until the stop event is set
+        """
+        next_time = time.monotonic() + interval
+
+        while not stop.wait(max(0.0, next_time - time.monotonic())):
+            yield
+
+            next_time += interval
+
+            if next_time < time.monotonic():
+                next_time = time.monotonic() + interval                     # overrun: do not catch up
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__state = None                                 # MonitorState
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def bind(self, state):
+        self.__state = state
+
+
+    def start(self):
+        pass
+
+
+    def stop(self):
+        pass
+
+
+    @abstractmethod
+    def run(self, stop):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    @abstractmethod
+    def name(self):
+        pass
+
+
+    @property
+    def slot_size(self):
+        return MonitorState.DEFAULT_SLOT_SIZE
+
+
+    @property
+    def _state(self):
+        return self.__state
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _publish(self, document):
+        self.__state.write(self.name, document)
+
+
+    def _empty(self):
+        self.__state.set_status(self.name, MonitorState.STATUS_EMPTY)
+
+
+    def _error(self):
+        self.__state.set_status(self.name, MonitorState.STATUS_FATAL_ERROR)
+
+
+    def _read(self):
+        return self.__state.read(self.name)
+
+
+    def _status(self):
+        return self.__state.status(self.name)
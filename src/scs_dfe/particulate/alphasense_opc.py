@@ -4,15 +4,20 @@ Created on 2 May 2019
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
+import time
+
 from abc import ABC
 from subprocess import Popen
 
 from scs_core.particulate.opc_datum import OPCDatum
 from scs_core.sys.logging import Logging
 
+from scs_dfe.bus.bus import Bus
+from scs_dfe.bus.bus_profiler import BusProfiler
 from scs_dfe.particulate.opc import OPC
+from scs_dfe.particulate.opc_readiness import OPCReadiness
 
-from scs_host.bus.spi import SPI
+from scs_host.sys.host import Host
 
 
 # TODO: fix lock_name()
@@ -23,6 +28,11 @@ class AlphasenseOPC(OPC, ABC):
     classdocs
     """
 
+    DEFAULT_BURST_CHUNK_DELAY =         0.001       # seconds
+
+    __MAX_BURST_FAILURES =              3
+    __READINESS_SAVE_INTERVAL =         100         # waits
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -37,15 +47,26 @@ class AlphasenseOPC(OPC, ABC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, interface, dev_path, spi_mode, spi_clock):
+    def __init__(self, interface, dev_path, spi_mode, spi_clock, burst=False, burst_chunk_size=None,
+                 burst_chunk_delay=None):
         """
         Constructor
         """
         super().__init__(interface)
 
-        self._spi = SPI(dev_path, spi_mode, spi_clock)
+        self._spi = Bus.spi(dev_path, spi_mode, spi_clock)
         self._logger = Logging.getLogger()
 
+        self.__burst = bool(burst)                                          # bool
+        self.__burst_chunk_size = burst_chunk_size                          # int (None: whole payload)
+        self.__burst_chunk_delay = self.DEFAULT_BURST_CHUNK_DELAY if burst_chunk_delay is None \
+            else burst_chunk_delay                                          # float seconds
+
+        self.__burst_failures = 0                                           # int
+
+        self.__readiness_filename = OPCReadiness.filename(Host, self.lock_name)
+        self.__readiness = None                                             # OPCReadiness (loaded on first use)
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -89,6 +110,103 @@ class AlphasenseOPC(OPC, ABC):
             self._logger.debug('set_device_mode: %s: spi-pm-ctrl not available' % mode)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _wait_until_ready(self, key, is_ready, timeout=None):
+        self.readiness.wait(key, is_ready, timeout=timeout)
+
+        if self.readiness.unsaved >= self.__READINESS_SAVE_INTERVAL:
+            self.save_readiness()
+
+
+    def save_readiness(self):
+        if self.__readiness is None:
+            return
+
+        try:
+            self.__readiness.save(self.__readiness_filename)
+
+        except OSError as ex:
+            self._logger.error("save_readiness: %s" % repr(ex))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _read_frame(self, request, read_bytes, construct, count):
+        """
+        request() issues the command, read_bytes(count) reads byte-at-a-time, construct(chars) decodes and checks -
+        in burst mode, a decode failure causes the frame to be re-requested and read byte-at-a-time
+        """
+        request()
+
+        if not self.__burst:
+            return construct(read_bytes(count))
+
+        try:
+            datum = construct(self.__read_burst(count))
+            self.__burst_failures = 0
+
+            return datum
+
+        except ValueError as ex:
+            self.__burst_failures += 1
+            self._logger.error("burst read failed (%d of %d): %s" %
+                               (self.__burst_failures, self.__MAX_BURST_FAILURES, repr(ex)))
+
+            if self.__burst_failures >= self.__MAX_BURST_FAILURES:
+                self._logger.error("burst mode disabled")
+                self.__burst = False
+
+        # fallback...
+        BusProfiler.retry(self.lock_name, 'burst')
+        request()
+
+        return construct(read_bytes(count))
+
+
+    def __read_burst(self, count):
+        chunk_size = self.__burst_chunk_size if self.__burst_chunk_size else count
+        chars = []
+
+        while len(chars) < count:
+            if chars:
+                time.sleep(self.__burst_chunk_delay)
+
+            chars.extend(self._spi.read_bytes(min(chunk_size, count - len(chars))))
+
+        return chars
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def readiness(self):
+        if self.__readiness is None:
+            try:
+                self.__readiness = OPCReadiness.load(self.__readiness_filename)
+
+            except (OSError, ValueError) as ex:
+                self._logger.error("readiness: %s" % repr(ex))          # unreadable or corrupt: learn afresh
+                self.__readiness = OPCReadiness.construct_from_jdict(None)
+
+        return self.__readiness
+
+
+    @property
+    def burst(self):
+        return self.__burst
+
+
+    @property
+    def burst_chunk_size(self):
+        return self.__burst_chunk_size
+
+
+    @property
+    def burst_chunk_delay(self):
+        return self.__burst_chunk_delay
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -116,4 +234,6 @@ class AlphasenseOPC(OPC, ABC):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return self.__class__.__name__ + ":{interface:%s, spi:%s}" %  (self.interface, self._spi)
+        return self.__class__.__name__ + ":{interface:%s, spi:%s, burst:%s, burst_chunk_size:%s, " \
+                                         "burst_chunk_delay:%s}" %  \
+               (self.interface, self._spi, self.burst, self.burst_chunk_size, self.burst_chunk_delay)
@@ -8,7 +8,7 @@ import time
 
 from abc import ABC, abstractmethod
 
-from scs_host.lock.lock import Lock
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -197,11 +197,11 @@ class OPC(ABC):
     # ----------------------------------------------------------------------------------------------------------------
 
     def obtain_lock(self):
-        Lock.acquire(self.lock_name, self.lock_timeout())
+        HierarchicalLock.acquire(self.lock_name, self.lock_timeout())
 
 
     def release_lock(self):
-        Lock.release(self.lock_name)
+        HierarchicalLock.release(self.lock_name)
 
 
     @property
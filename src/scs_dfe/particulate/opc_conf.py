@@ -7,18 +7,19 @@ settings for OPCMonitor
 
 example JSON:
 {"model": "N3", "sample-period": 10, "restart-on-zeroes": true, "power-saving": false,
-"custom-dev-path": "/dev/spi/by-connector/H3"}
-"""
+"custom-dev-path": "/dev/spi/by-connector/H3", "burst": true, "burst-chunk-size": 16, "burst-chunk-delay": 0.001}
 
-from scs_core.particulate.opc_conf import OPCConf as AbstractOPCConf
+The OPC classes are registered by source, and imported only when the configured model is used.
 
-from scs_dfe.particulate.opc_monitor import OPCMonitor
+The burst fields set the SPI burst transfer of the Alphasense OPCs - they are omitted from the JSON unless burst is
+set, and are ignored by I2C OPCs.
+"""
 
-from scs_dfe.particulate.opc_n2.opc_n2 import OPCN2
-from scs_dfe.particulate.opc_n3.opc_n3 import OPCN3
-from scs_dfe.particulate.opc_r1.opc_r1 import OPCR1
+from collections import OrderedDict
+
+from scs_core.particulate.opc_conf import OPCConf as AbstractOPCConf
 
-from scs_dfe.particulate.sps_30.sps_30 import SPS30
+from scs_dfe.data.class_registry import ClassRegistry
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -28,66 +29,132 @@ class OPCConf(AbstractOPCConf):
     classdocs
     """
 
+    __OPCS = ClassRegistry({
+        'N2':   ('scs_dfe.particulate.opc_n2.opc_n2', 'OPCN2'),
+        'N3':   ('scs_dfe.particulate.opc_n3.opc_n3', 'OPCN3'),
+        'R1':   ('scs_dfe.particulate.opc_r1.opc_r1', 'OPCR1'),
+        'S30':  ('scs_dfe.particulate.sps_30.sps_30', 'SPS30')
+    })
+
+    @classmethod
+    def opcs(cls):
+        return cls.__OPCS
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
     def is_valid_model(cls, model):
-        return model in (OPCN2.source(), OPCN3.source(), OPCR1.source(), SPS30.source())
+        return model in cls.__OPCS
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, name=None, skeleton=False):
+        if not jdict:
+            return None
+
+        model = jdict.get('model')
+        sample_period = jdict.get('sample-period')
+        restart_on_zeroes = jdict.get('restart-on-zeroes', True)
+        power_saving = jdict.get('power-saving')
+
+        custom_dev_path = jdict.get('custom-dev-path')
+
+        burst = jdict.get('burst', False)
+        burst_chunk_size = jdict.get('burst-chunk-size')
+        burst_chunk_delay = jdict.get('burst-chunk-delay')
+
+        return cls(model, sample_period, restart_on_zeroes, power_saving, custom_dev_path, burst=burst,
+                   burst_chunk_size=burst_chunk_size, burst_chunk_delay=burst_chunk_delay, name=name)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, model, sample_period, restart_on_zeroes, power_saving, custom_dev_path, name=None):
+    def __init__(self, model, sample_period, restart_on_zeroes, power_saving, custom_dev_path, burst=False,
+                 burst_chunk_size=None, burst_chunk_delay=None, name=None):
         """
         Constructor
         """
         super().__init__(model, sample_period, restart_on_zeroes, power_saving, custom_dev_path, name=name)
 
+        self.__burst = bool(burst)                                  # bool
+        self.__burst_chunk_size = burst_chunk_size                  # int (None: whole payload)
+        self.__burst_chunk_delay = burst_chunk_delay                # float seconds (None: driver default)
+
+
+    def __eq__(self, other):                            # ignore name
+        try:
+            return super().__eq__(other) and self.burst == other.burst and \
+                   self.burst_chunk_size == other.burst_chunk_size and self.burst_chunk_delay == other.burst_chunk_delay
+
+        except (TypeError, AttributeError):
+            return False
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def opc_monitor(self, manager, interface):
+    def opc_monitor(self, manager, interface, shared_memory=False):
+        from scs_dfe.particulate.opc_monitor import OPCMonitor          # late import
+
         opc = self.opc(interface)
 
-        return OPCMonitor(manager, opc, self)
+        return OPCMonitor(manager, opc, self, shared_memory=shared_memory)
 
 
     def opc(self, interface):
-        if self.model == OPCN2.source():
-            return OPCN2(interface, self.dev_path)
+        opc_class = self.__OPCS.resolve(self.model)
 
-        elif self.model == OPCN3.source():
-            return OPCN3(interface, self.dev_path)
+        if opc_class.uses_spi():
+            return opc_class(interface, self.dev_path, burst=self.burst, burst_chunk_size=self.burst_chunk_size,
+                             burst_chunk_delay=self.burst_chunk_delay)
 
-        elif self.model == OPCR1.source():
-            return OPCR1(interface, self.dev_path)
+        return opc_class(interface, opc_class.DEFAULT_ADDR)
 
-        elif self.model == SPS30.source():
-            return SPS30(interface, SPS30.DEFAULT_ADDR)
 
-        raise ValueError('unknown model: %s' % self.model)
+    def uses_spi(self):
+        return self.__OPCS.resolve(self.model).uses_spi()
 
 
-    def uses_spi(self):
-        if self.model == OPCN2.source():
-            return OPCN2.uses_spi()
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def burst(self):
+        return self.__burst
+
+
+    @property
+    def burst_chunk_size(self):
+        return self.__burst_chunk_size
+
+
+    @property
+    def burst_chunk_delay(self):
+        return self.__burst_chunk_delay
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict(super().as_json(**kwargs))
 
-        elif self.model == OPCN3.source():
-            return OPCN3.uses_spi()
+        if self.burst:
+            jdict['burst'] = self.burst
 
-        elif self.model == OPCR1.source():
-            return OPCR1.uses_spi()
+            if self.burst_chunk_size is not None:
+                jdict['burst-chunk-size'] = self.burst_chunk_size
 
-        elif self.model == SPS30.source():
-            return SPS30.uses_spi()
+            if self.burst_chunk_delay is not None:
+                jdict['burst-chunk-delay'] = self.burst_chunk_delay
 
-        raise ValueError('unknown model: %s' % self.model)
+        return jdict
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
         return "OPCConf(dfe):{name:%s, model:%s, sample_period:%s, restart_on_zeroes:%s, power_saving:%s, " \
-               "custom_dev_path:%s}" %  \
+               "custom_dev_path:%s, burst:%s, burst_chunk_size:%s, burst_chunk_delay:%s}" %  \
                (self.name, self.model, self.sample_period, self.restart_on_zeroes, self.power_saving,
-                self.custom_dev_path)
+                self.custom_dev_path, self.burst, self.burst_chunk_size, self.burst_chunk_delay)
@@ -0,0 +1,105 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A precompiled layout for a fixed-length OPC frame - a whole frame is decoded by a single struct call, rather than by
+slicing and decoding each field in turn. A batch of frames is decoded by a single iter_unpack over the joined frames,
+into columns.
+
+Fields are given as (name, count) - a field with a count greater than one is decoded as a list.
+
+https://docs.python.org/3/library/struct.html
+"""
+
+import math
+import struct
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCFrame(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def float(value):
+        return None if math.isnan(value) else value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, layout, fields):
+        """
+        Constructor
+        """
+        self.__struct = struct.Struct(layout)                               # Struct
+        self.__fields = tuple(fields)                                       # tuple of (name, count)
+
+        self.__slices = []                                                  # array of (name, start, end)
+        start = 0
+
+        for name, count in self.__fields:
+            self.__slices.append((name, start, start + count))
+            start += count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def values(self, chars):
+        """
+        the flat tuple of decoded values, in layout order
+        """
+        if len(chars) != self.__struct.size:
+            raise ValueError(chars)
+
+        return self.__struct.unpack(bytes(chars))
+
+
+    def columns(self, frames):
+        """
+        a dict of field name: list of values, one per frame - grouped fields give a list per frame
+        """
+        for chars in frames:
+            if len(chars) != self.__struct.size:
+                raise ValueError(chars)
+
+        records = list(self.__struct.iter_unpack(b''.join(bytes(chars) for chars in frames)))
+        flat = list(zip(*records)) if records else [()] * len(self)
+
+        columns = OrderedDict()
+
+        for name, start, end in self.__slices:
+            if end - start == 1:
+                columns[name] = list(flat[start])
+            else:
+                columns[name] = [list(record[start:end]) for record in records]
+
+        return columns
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def size(self):
+        return self.__struct.size
+
+
+    @property
+    def fields(self):
+        return [name for name, _ in self.__fields]
+
+
+    def __len__(self):
+        return self.__slices[-1][2] if self.__slices else 0                 # number of decoded values
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCFrame:{layout:%s, size:%s, fields:%s}" % (self.__struct.format, self.size, self.fields)
@@ -0,0 +1,101 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A bounded history of OPC data, with any number of sliding-window aggregates
+"""
+
+from collections import deque, OrderedDict
+
+from scs_dfe.particulate.opc_window import OPCWindow
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCHistory(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_LENGTH =        1440                # four hours at the default sample period
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, max_length=DEFAULT_MAX_LENGTH, periods=()):
+        """
+        Constructor
+        """
+        self.__data = deque(maxlen=max_length)                              # deque of OPCDatum
+        self.__windows = OrderedDict()                                      # dict of period: OPCWindow
+
+        for period in periods:
+            self.add_window(period)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, datum):
+        self.__data.append(datum)
+
+        for window in self.__windows.values():
+            window.append(datum)
+
+
+    def add_window(self, period):
+        if period in self.__windows:
+            return
+
+        window = OPCWindow(period)
+
+        for datum in self.__data:                                           # back-fill from retained history
+            window.append(datum)
+
+        self.__windows[period] = window
+
+
+    def remove_window(self, period):
+        del self.__windows[period]
+
+
+    def aggregate(self, period):
+        if period not in self.__windows:
+            self.add_window(period)
+
+        return self.__windows[period].report()
+
+
+    def data(self, start=None, end=None):
+        start_timestamp = None if start is None else start.timestamp()
+        end_timestamp = None if end is None else end.timestamp()
+
+        return [datum for datum in self.__data
+                if (start_timestamp is None or datum.rec.timestamp() >= start_timestamp) and
+                (end_timestamp is None or datum.rec.timestamp() <= end_timestamp)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def latest(self):
+        return self.__data[-1] if self.__data else None
+
+
+    @property
+    def periods(self):
+        return list(self.__windows.keys())
+
+
+    @property
+    def max_length(self):
+        return self.__data.maxlen
+
+
+    def __len__(self):
+        return len(self.__data)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCHistory:{max_length:%s, len:%s, periods:%s}" % (self.max_length, len(self), self.periods)
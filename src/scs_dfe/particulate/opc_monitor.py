@@ -2,6 +2,14 @@
 Created on 9 Jul 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+With shared_memory set, data are published through an OPCRing rather than a Manager list - this requires an
+OPCDatum-derived datum class, otherwise the Manager list is used. OPCRing is imported only in that case, since
+multiprocessing.shared_memory requires Python 3.8.
+
+The client process keeps an OPCHistory, with windowed aggregates, brought up to date on each client call from every
+datum that the monitor process has published - from the ring with shared_memory, otherwise from a second Manager list,
+of the most recent history_length data. The aggregates therefore do not depend on how often the client calls sample().
 """
 
 import copy
@@ -10,6 +18,7 @@ import time
 from collections import OrderedDict
 from multiprocessing import Manager
 
+from scs_core.particulate.opc_datum import OPCDatum
 from scs_core.particulate.opc_error_log import OPCErrorLog
 
 from scs_core.sync.interval_timer import IntervalTimer
@@ -18,6 +27,7 @@ from scs_core.sync.synchronised_process import SynchronisedProcess
 from scs_core.sys.logging import Logging
 
 from scs_dfe.particulate.opc import OPC
+from scs_dfe.particulate.opc_history import OPCHistory
 
 from scs_host.lock.lock_timeout import LockTimeout
 
@@ -33,14 +43,37 @@ class OPCMonitor(SynchronisedProcess):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, manager, opc: OPC, conf):
+    def __init__(self, manager, opc: OPC, conf, shared_memory=False, ring_capacity=None,
+                 history_length=OPCHistory.DEFAULT_MAX_LENGTH, periods=()):
         """
         Constructor
         """
         self.__logger = Logging.getLogger()
         self.__logging_specification = Logging.specification()
 
-        SynchronisedProcess.__init__(self, Manager().list())
+        datum_class = opc.datum_class()
+        use_ring = shared_memory and issubclass(datum_class, OPCDatum)
+
+        if use_ring:
+            from scs_dfe.particulate.opc_ring import OPCRing                    # late import - Python 3.8+
+
+            capacity = OPCRing.DEFAULT_CAPACITY if ring_capacity is None else ring_capacity
+            self.__ring = OPCRing.create(datum_class, capacity=capacity)
+
+        else:
+            self.__ring = None
+
+        if use_ring:
+            SynchronisedProcess.__init__(self, None)
+            self.__published = None
+
+        else:
+            process_manager = Manager()
+
+            SynchronisedProcess.__init__(self, process_manager.list())
+            self.__published = process_manager.list()                           # list of jlist, in the monitor
+
+        self.__history_length = history_length
 
         self.__manager = manager
         self.__opc = opc
@@ -48,7 +81,9 @@ class OPCMonitor(SynchronisedProcess):
 
         self.__first_reading = True
         self.__zero_count = 0
-        self.__datum_class = self.__opc.datum_class()
+        self.__datum_class = datum_class
+
+        self.__history = OPCHistory(max_length=history_length, periods=periods)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -78,6 +113,10 @@ class OPCMonitor(SynchronisedProcess):
         except (KeyboardInterrupt, LockTimeout, OSError, SystemExit):
             pass
 
+        finally:
+            if self.__ring is not None:
+                self.__ring.close()
+
 
     def run(self):
         Logging.replicate(self.__logging_specification)
@@ -116,8 +155,7 @@ class OPCMonitor(SynchronisedProcess):
                         self.__zero_count = 0
 
                     if not self.__first_reading:
-                        with self._lock:
-                            datum.as_list(self._value)
+                        self.__publish(datum)
 
                 except LockTimeout as ex:
                     self.__logger.error(repr(ex))
@@ -143,13 +181,38 @@ class OPCMonitor(SynchronisedProcess):
     # ----------------------------------------------------------------------------------------------------------------
     # SynchronisedProcess special operations...
 
+    def __publish(self, datum):
+        if self.__ring is not None:
+            self.__ring.write(datum)
+            return
+
+        jlist = []
+        datum.as_list(jlist)
+
+        with self._lock:
+            datum.as_list(self._value)
+
+            self.__published.append(jlist)
+
+            if len(self.__published) > self.__history_length:
+                del self.__published[0]
+
+
     def __error(self, code):
+        if self.__ring is not None:
+            self.__ring.set_status(self.__ring.STATUS_FATAL_ERROR)
+            return
+
         with self._lock:
             del self._value[:]
             self._value.append(code)
 
 
     def __empty(self):
+        if self.__ring is not None:
+            self.__ring.set_status(self.__ring.STATUS_EMPTY)
+            return
+
         with self._lock:
             del self._value[:]
 
@@ -193,15 +256,82 @@ class OPCMonitor(SynchronisedProcess):
 
 
     def sample(self):
+        if self.__ring is not None:
+            if self.__ring.status == self.__ring.STATUS_FATAL_ERROR:
+                raise StopIteration()
+
+            self.__refresh_history()
+
+            return self.__ring.latest()
+
         with self._lock:
             value = copy.deepcopy(self._value)
 
         if len(value) == 1 and value[0] == self.__FATAL_ERROR:
             raise StopIteration()
 
+        self.__refresh_history()
+
         return self.__datum_class.construct_from_jdict(OrderedDict(value))
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # history for client process...
+
+    def history(self, start=None, end=None):
+        self.__refresh_history()
+
+        return self.__history.data(start=start, end=end)
+
+
+    def add_window(self, period):
+        self.__history.add_window(period)
+
+
+    def aggregate(self, period):
+        self.__refresh_history()
+
+        return self.__history.aggregate(period)
+
+
+    def __refresh_history(self):
+        latest = self.__history.latest
+
+        if self.__ring is not None:
+            for datum in self.__ring.history(start=None if latest is None else latest.rec):
+                self.__append_history(datum)
+
+            return
+
+        with self._lock:
+            published = self.__published[:]
+
+        data = []
+
+        for jlist in reversed(published):                                       # only those not yet recorded
+            datum = self.__datum_class.construct_from_jdict(OrderedDict(jlist))
+
+            if latest is not None and datum.rec.timestamp() <= latest.rec.timestamp():
+                break
+
+            data.append(datum)
+
+        for datum in reversed(data):
+            self.__append_history(datum)
+
+
+    def __append_history(self, datum):
+        if datum is None:
+            return
+
+        latest = self.__history.latest
+
+        if latest is not None and datum.rec.timestamp() <= latest.rec.timestamp():
+            return
+
+        self.__history.append(datum)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -209,8 +339,13 @@ class OPCMonitor(SynchronisedProcess):
         return self.__opc
 
 
+    @property
+    def ring_name(self):
+        return None if self.__ring is None else self.__ring.name
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "OPCMonitor:{value:%s, opc:%s, conf:%s, first_reading:%s}" % \
-               (self._value, self.__opc, self.__conf, self.__first_reading)
+        return "OPCMonitor:{value:%s, ring:%s, history:%s, opc:%s, conf:%s, first_reading:%s}" % \
+               (self._value, self.__ring, self.__history, self.__opc, self.__conf, self.__first_reading)
@@ -57,7 +57,6 @@ class OPCN2(AlphasenseOPC):
 
     __DELAY_TRANSFER =                  0.001
     __DELAY_CMD =                       0.010
-    __DELAY_BUSY =                      0.100
 
     __LOCK_TIMEOUT =                    20.0
 
@@ -91,11 +90,12 @@ class OPCN2(AlphasenseOPC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, interface, dev_path):
+    def __init__(self, interface, dev_path, burst=False, burst_chunk_size=None, burst_chunk_delay=None):
         """
         Constructor
         """
-        super().__init__(interface, dev_path, self.__SPI_MODE, self.__SPI_CLOCK)
+        super().__init__(interface, dev_path, self.__SPI_MODE, self.__SPI_CLOCK,
+                         burst=burst, burst_chunk_size=burst_chunk_size, burst_chunk_delay=burst_chunk_delay)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -136,12 +136,8 @@ class OPCN2(AlphasenseOPC):
             self.obtain_lock()
             self._spi.open()
 
-            # command...
-            self.__cmd(self.__CMD_READ_HISTOGRAM)
-            chars = self.__read_bytes(OPCN2Datum.CHARS)
-
-            # report...
-            return OPCN2Datum.construct(chars)
+            # command & report...
+            return self._read_frame(self.__request_histogram, self.__read_bytes, OPCN2Datum.construct, OPCN2Datum.CHARS)
 
         finally:
             self._spi.close()
@@ -191,15 +187,17 @@ class OPCN2(AlphasenseOPC):
 
     def __wait_while_busy(self, specified_timeout=None):
         timeout = self.DEFAULT_BUSY_TIMEOUT if specified_timeout is None else specified_timeout
-        timeout_time = time.time() + timeout
 
         self.__cmd(self.__CMD_CHECK)
+        self._wait_until_ready('busy', self.__is_not_busy, timeout=timeout)
+
+
+    def __is_not_busy(self):
+        return self._spi.read_bytes(1)[0] != self.__RESPONSE_BUSY
 
-        while self.__read_byte() == self.__RESPONSE_BUSY:
-            if time.time() > timeout_time:
-                raise TimeoutError()
 
-            time.sleep(self.__DELAY_BUSY)
+    def __request_histogram(self):
+        self.__cmd(self.__CMD_READ_HISTOGRAM)
 
 
     def __cmd_power(self, cmd):
@@ -5,10 +5,11 @@ Created on 14 Feb 2020
 """
 
 from scs_core.data.datetime import LocalizedDatetime
-from scs_core.data.datum import Decode
 
 from scs_core.particulate.opc_datum import OPCDatum
 
+from scs_dfe.particulate.opc_frame import OPCFrame
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -20,49 +21,35 @@ class OPCN2Datum(OPCDatum):
     SOURCE =                    'N2'
     CHARS =                     62
 
+    FRAME = OPCFrame('<16H4B8xfH3f', (('bins', 16), ('bin-mtofs', 4), ('period', 1), ('checksum', 1),
+                                      ('pm1', 1), ('pm2p5', 1), ('pm10', 1)))
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
     def construct(cls, chars):
-        if len(chars) != cls.CHARS:
-            raise ValueError(chars)
+        values = cls.FRAME.values(chars)
 
         # time...
         rec = LocalizedDatetime.now().utc()
 
         # bins...
-        bins = [Decode.unsigned_int(chars[i:i + 2], '<') for i in range(0, 32, 2)]
+        bins = list(values[0:16])
 
         # bin MToFs...
-        bin_1_mtof = chars[32]
-        bin_3_mtof = chars[33]
-        bin_5_mtof = chars[34]
-        bin_7_mtof = chars[35]
+        bin_1_mtof, bin_3_mtof, bin_5_mtof, bin_7_mtof = values[16:20]
 
         # period...
-        period = Decode.float(chars[44:48], '<')
+        period = OPCFrame.float(values[20])
 
         # checksum...
-        actual = Decode.unsigned_int(chars[48:50], '<')
+        actual = values[21]
         required = sum(bins) % 65536
 
         if required != actual:
             raise ValueError("bad checksum: required: 0x%04x actual: 0x%04x" % (required, actual))
 
         # PMx...
-        try:
-            pm1 = Decode.float(chars[50:54], '<')
-        except TypeError:
-            pm1 = None
-
-        try:
-            pm2p5 = Decode.float(chars[54:58], '<')
-        except TypeError:
-            pm2p5 = None
-
-        try:
-            pm10 = Decode.float(chars[58:62], '<')
-        except TypeError:
-            pm10 = None
+        pm1, pm2p5, pm10 = (OPCFrame.float(value) for value in values[22:25])
 
         return cls(cls.SOURCE, rec, pm1, pm2p5, pm10, period, bins, bin_1_mtof, bin_3_mtof, bin_5_mtof, bin_7_mtof)
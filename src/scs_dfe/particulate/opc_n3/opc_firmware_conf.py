@@ -18,9 +18,11 @@ Example:
 
 from collections import OrderedDict
 
-from scs_core.data.datum import Decode, Encode
+from scs_core.data.datum import Encode
 from scs_core.data.json import JSONReport
 
+from scs_dfe.particulate.opc_frame import OPCFrame
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -31,35 +33,33 @@ class OPCFirmwareConf(JSONReport):
 
     CHARS = 168
 
+    FRAME = OPCFrame('<25H25H24H3HH2HH6B', (('bin-boundaries', 25), ('bin-boundaries-diameter', 25),
+                                            ('bin-weightings', 24), ('pm-diameters', 3), ('max-tof', 1),
+                                            ('am-interval-counts', 2), ('am-max-data-arrays-in-file', 1),
+                                            ('am-flags', 3), ('tof-to-sfr-factor', 1), ('pvp', 1),
+                                            ('bin-weighting-index', 1)))
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
     def construct(cls, chars):
-        if len(chars) != cls.CHARS:
-            raise ValueError(chars)
+        values = cls.FRAME.values(chars)
 
-        bin_boundaries = [Decode.unsigned_int(chars[i:i + 2], '<') for i in range(0, 50, 2)]
-        bin_boundaries_diameter = [Decode.unsigned_int(chars[i:i + 2], '<') for i in range(50, 100, 2)]
-        bin_weightings = [Decode.unsigned_int(chars[i:i + 2], '<') for i in range(100, 148, 2)]
+        bin_boundaries = list(values[0:25])
+        bin_boundaries_diameter = list(values[25:50])
+        bin_weightings = list(values[50:74])
 
-        pm_diameter_a = Decode.unsigned_int(chars[148:150], '<')
-        pm_diameter_b = Decode.unsigned_int(chars[150:152], '<')
-        pm_diameter_c = Decode.unsigned_int(chars[152:154], '<')
+        pm_diameter_a, pm_diameter_b, pm_diameter_c = values[74:77]
 
-        max_tof = Decode.unsigned_int(chars[154:156], '<')
+        max_tof = values[77]
 
-        am_sampling_interval_count = Decode.unsigned_int(chars[156:158], '<')
-        am_middle_interval_count = Decode.unsigned_int(chars[158:160], '<')
+        am_sampling_interval_count, am_middle_interval_count = values[78:80]
 
-        am_max_data_arrays_in_file = Decode.unsigned_int(chars[160:162], '<')
+        am_max_data_arrays_in_file = values[80]
 
-        am_only_save_pm_data = chars[162]
-        am_fan_on_in_idle = chars[163]
-        am_laser_on_in_idle = chars[164]
+        am_only_save_pm_data, am_fan_on_in_idle, am_laser_on_in_idle = values[81:84]
 
-        tof_to_sfr_factor = chars[165]
-        pvp = chars[166]
-        bin_weighting_index = chars[167]
+        tof_to_sfr_factor, pvp, bin_weighting_index = values[84:87]
 
         return cls(bin_boundaries, bin_boundaries_diameter, bin_weightings,
                    pm_diameter_a, pm_diameter_b, pm_diameter_c,
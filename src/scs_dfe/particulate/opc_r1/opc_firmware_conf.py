@@ -14,9 +14,11 @@ Example:
 
 from collections import OrderedDict
 
-from scs_core.data.datum import Decode, Encode
+from scs_core.data.datum import Encode
 from scs_core.data.json import JSONReport
 
+from scs_dfe.particulate.opc_frame import OPCFrame
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -27,34 +29,31 @@ class OPCFirmwareConf(JSONReport):
 
     CHARS = 193
 
+    FRAME = OPCFrame('<17H17f16fffB3fBBHBB', (('bin-boundaries', 17), ('bin-boundaries-diameter', 17),
+                                              ('bin-weightings', 16), ('gain-scaling-coefficient', 1),
+                                              ('sample-flow-rate', 1), ('tof-to-sfr-factor', 1),
+                                              ('pm-concentrations', 3), ('pvp', 1), ('power-status', 1),
+                                              ('max-tof', 1), ('laser-dac', 1), ('bin-weighting-index', 1)))
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
     def construct(cls, chars):
-        if len(chars) != cls.CHARS:
-            raise ValueError(chars)
-
-        # print(chars)
-
-        bin_boundaries = [Decode.unsigned_int(chars[i:i + 2], '<') for i in range(0, 34, 2)]
-        bin_boundaries_diameter = [Decode.float(chars[i:i + 4], '<') for i in range(34, 102, 4)]
-        bin_weightings = [Decode.float(chars[i:i + 4], '<') for i in range(102, 166, 4)]
+        values = cls.FRAME.values(chars)
 
-        gain_scaling_coefficient = Decode.float(chars[166:170], '<')
-        sample_flow_rate = Decode.float(chars[170:174], '<')
+        bin_boundaries = list(values[0:17])
+        bin_boundaries_diameter = [OPCFrame.float(value) for value in values[17:34]]
+        bin_weightings = [OPCFrame.float(value) for value in values[34:50]]
 
-        tof_to_sfr_factor = chars[174]
+        gain_scaling_coefficient = OPCFrame.float(values[50])
+        sample_flow_rate = OPCFrame.float(values[51])
 
-        pm_concentration_a = Decode.float(chars[175:179], '<')
-        pm_concentration_b = Decode.float(chars[179:183], '<')
-        pm_concentration_c = Decode.float(chars[183:187], '<')
+        tof_to_sfr_factor = values[52]
 
-        pvp = chars[187]
-        power_status = chars[188]
-        max_tof = Decode.unsigned_int(chars[189:191], '<')
-        laser_dac = chars[191]
+        pm_concentration_a, pm_concentration_b, pm_concentration_c = \
+            (OPCFrame.float(value) for value in values[53:56])
 
-        bin_weighting_index = chars[192]
+        pvp, power_status, max_tof, laser_dac, bin_weighting_index = values[56:61]
 
         return cls(bin_boundaries, bin_boundaries_diameter, bin_weightings,
                    gain_scaling_coefficient, sample_flow_rate, tof_to_sfr_factor,
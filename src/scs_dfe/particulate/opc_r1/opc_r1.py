@@ -67,7 +67,6 @@ class OPCR1(AlphasenseOPC):
 
     __DELAY_TRANSFER =                  0.020
     __DELAY_CMD =                       0.020
-    __DELAY_BUSY =                      0.100
 
     __LOCK_TIMEOUT =                    20.0
 
@@ -101,11 +100,12 @@ class OPCR1(AlphasenseOPC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, interface, dev_path):
+    def __init__(self, interface, dev_path, burst=False, burst_chunk_size=None, burst_chunk_delay=None):
         """
         Constructor
         """
-        super().__init__(interface, dev_path, self.__SPI_MODE, self.__SPI_CLOCK)
+        super().__init__(interface, dev_path, self.__SPI_MODE, self.__SPI_CLOCK,
+                         burst=burst, burst_chunk_size=burst_chunk_size, burst_chunk_delay=burst_chunk_delay)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -155,13 +155,8 @@ class OPCR1(AlphasenseOPC):
             self.obtain_lock()
             self._spi.open()
 
-            # command...
-            self.__wait_while_busy()
-            self.__cmd(self.__CMD_READ_HISTOGRAM)
-            chars = self.__read_bytes(OPCR1Datum.CHARS)
-
-            # report...
-            return OPCR1Datum.construct(chars)
+            # command & report...
+            return self._read_frame(self.__request_histogram, self.__read_bytes, OPCR1Datum.construct, OPCR1Datum.CHARS)
 
         finally:
             self._spi.close()
@@ -268,15 +263,18 @@ class OPCR1(AlphasenseOPC):
 
     def __wait_while_busy(self, specified_timeout=None):
         timeout = self.DEFAULT_BUSY_TIMEOUT if specified_timeout is None else specified_timeout
-        timeout_time = time.time() + timeout
 
         self.__cmd(self.__CMD_CHECK)
+        self._wait_until_ready('busy', self.__is_not_busy, timeout=timeout)
+
 
-        while self.__read_byte() == self.__RESPONSE_BUSY:
-            if time.time() > timeout_time:
-                raise TimeoutError()
+    def __is_not_busy(self):
+        return self._spi.read_bytes(1)[0] != self.__RESPONSE_BUSY
 
-            time.sleep(self.__DELAY_BUSY)
+
+    def __request_histogram(self):
+        self.__wait_while_busy()
+        self.__cmd(self.__CMD_READ_HISTOGRAM)
 
 
     def __cmd_power(self, cmd):
@@ -299,14 +297,13 @@ class OPCR1(AlphasenseOPC):
 
     def __cmd(self, cmd):
         self._spi.xfer([cmd])
-        time.sleep(self.__DELAY_CMD)
 
-        self._spi.xfer([cmd])
-        time.sleep(self.__DELAY_TRANSFER)
+        self._wait_until_ready("0x%02x" % cmd, lambda: self._spi.xfer([cmd])[0] != self.__RESPONSE_BUSY,
+                               timeout=self.DEFAULT_BUSY_TIMEOUT)
 
 
     def __read_bytes(self, count):
-        return (self.__read_byte() for _ in range(count))
+        return [self.__read_byte() for _ in range(count)]
 
 
     def __read_byte(self):
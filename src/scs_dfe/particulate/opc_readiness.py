@@ -0,0 +1,169 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+adaptive ready-wait for Alphasense OPC SPI commands
+
+Polling starts at the 10 ms interval that the Alphasense protocol recommends between command byte retries, and backs
+off exponentially. The typical latency of each command is learned, so that the first poll can be deferred until the
+device is likely to be ready.
+
+example JSON:
+{"latencies": {"0x30": 0.0115, "busy": 0.0009},
+"histograms": {"0x30": [0, 0, 0, 2, 31, 1, 0, 0, 0, 0, 0, 0], "busy": [28, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]}}
+"""
+
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCReadiness(JSONReport):
+    """
+    classdocs
+    """
+
+    MIN_INTERVAL =              0.010               # seconds - the protocol minimum between command byte retries
+    MAX_INTERVAL =              0.100               # seconds
+
+    BUCKETS =                   (0.0005, 0.001, 0.002, 0.005, 0.010, 0.020, 0.050, 0.100, 0.200, 0.500, 1.0)
+
+    __LEAD_FRACTION =           0.75                # proportion of the typical latency slept before the first poll
+    __LEARNING_RATE =           0.2
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    __FILENAME =                "opc_readiness_%s.json"
+
+    @classmethod
+    def filename(cls, manager, device_name):
+        return manager.tmp_file(cls.__FILENAME % device_name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return cls({}, {})
+
+        latencies = jdict.get('latencies', {})
+        histograms = jdict.get('histograms', {})
+
+        return cls(latencies, histograms)
+
+
+    @classmethod
+    def bucket_index(cls, latency):
+        for index in range(len(cls.BUCKETS)):
+            if latency <= cls.BUCKETS[index]:
+                return index
+
+        return len(cls.BUCKETS)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, latencies, histograms):
+        """
+        Constructor
+        """
+        self.__latencies = OrderedDict(latencies)                   # dict of key: float seconds
+        self.__histograms = OrderedDict(histograms)                 # dict of key: array of int
+
+        self.__unsaved = 0                                          # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def wait(self, key, is_ready, timeout=None):
+        """
+        call is_ready() until it returns True, backing off exponentially
+        returned value is the latency in seconds
+        """
+        start_time = time.time()
+        timeout_time = None if timeout is None else start_time + timeout
+
+        typical = self.__latencies.get(key)
+
+        if typical:
+            time.sleep(typical * self.__LEAD_FRACTION)
+
+        interval = self.MIN_INTERVAL
+
+        while not is_ready():
+            if timeout_time is not None and time.time() > timeout_time:
+                raise TimeoutError(key)
+
+            time.sleep(interval)
+            interval = min(interval * 2.0, self.MAX_INTERVAL)
+
+        latency = time.time() - start_time
+        self.__record(key, latency)
+
+        return latency
+
+
+    def save(self, filename):
+        super().save(filename)
+        self.__unsaved = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __record(self, key, latency):
+        typical = self.__latencies.get(key)
+
+        self.__latencies[key] = latency if typical is None else typical + self.__LEARNING_RATE * (latency - typical)
+
+        if key not in self.__histograms:
+            self.__histograms[key] = [0] * (len(self.BUCKETS) + 1)
+
+        self.__histograms[key][self.bucket_index(latency)] += 1
+        self.__unsaved += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['latencies'] = OrderedDict((key, round(latency, 6)) for key, latency in self.__latencies.items())
+        jdict['histograms'] = self.__histograms
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def latency(self, key):
+        return self.__latencies.get(key)
+
+
+    def histogram(self, key):
+        counts = self.__histograms.get(key, [0] * (len(self.BUCKETS) + 1))
+        bounds = [str(bound) for bound in self.BUCKETS] + ['inf']
+
+        return OrderedDict(zip(bounds, counts))
+
+
+    @property
+    def keys(self):
+        return list(self.__histograms.keys())
+
+
+    @property
+    def unsaved(self):
+        return self.__unsaved
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCReadiness:{latencies:%s, histograms:%s, unsaved:%s}" % \
+               (dict(self.__latencies), dict(self.__histograms), self.unsaved)
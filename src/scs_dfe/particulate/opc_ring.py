@@ -0,0 +1,263 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A fixed-layout ring of the most recent OPC histogram records, in shared memory, for a single writer and any number
+of readers. Each record is protected by a sequence lock - the writer makes the sequence number odd while it writes -
+so that readers neither block the writer nor need to pickle or pass messages.
+
+layout:
+header:     head (uint64 - records written), status (int32), capacity (uint32), source (4 chars)
+record:     seq (uint64), rec, pm1, pm2p5, pm10, period, sfr, temp, humid, 4 x MToF (float64),
+            bin count (uint16), 24 x bin (uint32)
+
+None values are held as NaN. Bins are particle counts, and are held - and returned - as ints, as the OPC reports them.
+
+https://docs.python.org/3/library/multiprocessing.shared_memory.html
+https://en.wikipedia.org/wiki/Seqlock
+"""
+
+import math
+import struct
+
+from multiprocessing import resource_tracker, shared_memory
+
+from scs_core.climate.sht_datum import SHTDatum
+from scs_core.data.datetime import LocalizedDatetime
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCRing(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CAPACITY =          360                 # records - one hour at the default sample period
+
+    MAX_BINS =                  24
+
+    STATUS_OK =                 0
+    STATUS_EMPTY =              1
+    STATUS_FATAL_ERROR =        -1
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    __HEADER =                  struct.Struct('<QiI4s')
+    __SEQ =                     struct.Struct('<Q')
+    __BODY =                    struct.Struct('<8d4dH%dI' % MAX_BINS)
+
+    __RECORD_SIZE =             __SEQ.size + __BODY.size
+
+    __MAX_READ_ATTEMPTS =       100
+
+    __created = set()                               # names of segments created by this process
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def create(cls, datum_class, capacity=DEFAULT_CAPACITY, name=None):
+        size = cls.__HEADER.size + capacity * cls.__RECORD_SIZE
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        cls.__created.add(shm.name)
+
+        ring = cls(shm, datum_class, True)
+        cls.__HEADER.pack_into(shm.buf, 0, 0, cls.STATUS_EMPTY, capacity, b'')
+
+        return ring
+
+
+    @classmethod
+    def attach(cls, name, datum_class):
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)            # Python 3.13+
+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+
+            if shm.name not in cls.__created:
+                resource_tracker.unregister(shm._name, 'shared_memory')         # the creator owns the segment
+
+        return cls(shm, datum_class, False)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __pack_value(value):
+        return math.nan if value is None else float(value)
+
+
+    @staticmethod
+    def __unpack_value(value):
+        return None if math.isnan(value) else value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, shm, datum_class, owner):
+        """
+        Constructor
+        """
+        self.__shm = shm                                    # SharedMemory
+        self.__datum_class = datum_class                    # OPCDatum class
+        self.__owner = owner                                # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # writer...
+
+    def write(self, datum):
+        head, _, capacity, _ = self.__HEADER.unpack_from(self.__shm.buf, 0)
+        offset = self.__offset(head % capacity)
+
+        seq = self.__SEQ.unpack_from(self.__shm.buf, offset)[0]
+
+        sht = getattr(datum, 'sht', None)
+        temp = None if sht is None else sht.temp
+        humid = None if sht is None else sht.humid
+
+        bins = [int(round(count)) for count in datum.bins[:self.MAX_BINS]]
+        padded_bins = bins + [0] * (self.MAX_BINS - len(bins))
+
+        values = [self.__pack_value(value) for value in
+                  (datum.rec.timestamp(), datum.pm1, datum.pm2p5, datum.pm10, datum.period,
+                   getattr(datum, 'sfr', None), temp, humid,
+                   datum.bin_1_mtof, datum.bin_3_mtof, datum.bin_5_mtof, datum.bin_7_mtof)]
+
+        self.__SEQ.pack_into(self.__shm.buf, offset, seq + 1)                       # odd: write in progress
+        self.__BODY.pack_into(self.__shm.buf, offset + self.__SEQ.size, *values, len(bins), *padded_bins)
+        self.__SEQ.pack_into(self.__shm.buf, offset, seq + 2)                       # even: stable
+
+        self.__HEADER.pack_into(self.__shm.buf, 0, head + 1, self.STATUS_OK, capacity, datum.source.encode()[:4])
+
+
+    def set_status(self, status):
+        head, _, capacity, source = self.__HEADER.unpack_from(self.__shm.buf, 0)
+        self.__HEADER.pack_into(self.__shm.buf, 0, head, status, capacity, source)
+
+
+    def close(self):
+        self.__shm.close()
+
+        if self.__owner:
+            self.__shm.unlink()
+            self.__created.discard(self.__shm.name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # readers...
+
+    def latest(self):
+        """
+        the most recent datum, or None if the writer has not published since it was last emptied
+        """
+        head, status, capacity, _ = self.__HEADER.unpack_from(self.__shm.buf, 0)
+
+        if status != self.STATUS_OK or head == 0:
+            return None
+
+        return self.__read((head - 1) % capacity)
+
+
+    def history(self, start=None, end=None):
+        """
+        the retained data in chronological order, optionally restricted to start <= rec <= end (LocalizedDatetime)
+        """
+        head, _, capacity, _ = self.__HEADER.unpack_from(self.__shm.buf, 0)
+
+        start_timestamp = None if start is None else start.timestamp()
+        end_timestamp = None if end is None else end.timestamp()
+
+        data = []
+
+        for index in range(max(0, head - capacity), head):
+            datum = self.__read(index % capacity, start_timestamp, end_timestamp)
+
+            if datum is not None:
+                data.append(datum)
+
+        return data
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __read(self, slot, start_timestamp=None, end_timestamp=None):
+        offset = self.__offset(slot)
+
+        for _ in range(self.__MAX_READ_ATTEMPTS):
+            seq = self.__SEQ.unpack_from(self.__shm.buf, offset)[0]
+
+            if seq & 1:
+                continue
+
+            values = self.__BODY.unpack_from(self.__shm.buf, offset + self.__SEQ.size)
+
+            if self.__SEQ.unpack_from(self.__shm.buf, offset)[0] == seq:
+                break
+
+        else:
+            return None                                                             # writer is too busy
+
+        timestamp = values[0]
+
+        if start_timestamp is not None and timestamp < start_timestamp:
+            return None
+
+        if end_timestamp is not None and timestamp > end_timestamp:
+            return None
+
+        return self.__datum(values)
+
+
+    def __datum(self, values):
+        source = self.__HEADER.unpack_from(self.__shm.buf, 0)[3].rstrip(b'\0').decode()
+        rec = LocalizedDatetime.construct_from_timestamp(values[0]).utc()
+
+        pm1, pm2p5, pm10, period, sfr, temp, humid, mtof1, mtof3, mtof5, mtof7 = \
+            (self.__unpack_value(value) for value in values[1:12])
+
+        bin_count = values[12]
+        bins = list(values[13:13 + bin_count])
+
+        sht = None if temp is None else SHTDatum(humid, temp)
+
+        return self.__datum_class(source, rec, pm1, pm2p5, pm10, period, bins, mtof1, mtof3, mtof5, mtof7,
+                                  sfr=sfr, sht=sht)
+
+
+    def __offset(self, slot):
+        return self.__HEADER.size + slot * self.__RECORD_SIZE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__shm.name
+
+
+    @property
+    def status(self):
+        return self.__HEADER.unpack_from(self.__shm.buf, 0)[1]
+
+
+    @property
+    def capacity(self):
+        return self.__HEADER.unpack_from(self.__shm.buf, 0)[2]
+
+
+    def __len__(self):
+        head, _, capacity, _ = self.__HEADER.unpack_from(self.__shm.buf, 0)
+
+        return min(head, capacity)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCRing:{name:%s, datum_class:%s, owner:%s, capacity:%s, len:%s, status:%s}" % \
+               (self.name, self.__datum_class.__name__, self.__owner, self.capacity, len(self), self.status)
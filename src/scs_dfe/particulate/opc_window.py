@@ -0,0 +1,244 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A sliding time window over OPC data, with aggregates that are updated incrementally: running sums for the mean and
+the bin counts, and monotonic queues for min and max. The cost per datum does not depend on the window length.
+
+The window is relative to the rec of the most recent datum.
+
+example JSON:
+{"period": 60, "count": 6, "start": "2026-10-18T11:00:04Z", "end": "2026-10-18T11:00:54Z",
+"pm1": {"mean": 1.2, "min": 0.9, "max": 1.6}, "pm2p5": {"mean": 2.4, "min": 2.0, "max": 3.1},
+"pm10": {"mean": 4.8, "min": 3.9, "max": 5.7}, "bins": [612, 140, 37, 12, 3, 1, 0, 0, 0, 0, 0, 0]}
+"""
+
+from collections import deque, OrderedDict
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCWindow(object):
+    """
+    classdocs
+    """
+
+    FIELDS = ('pm1', 'pm2p5', 'pm10')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, period):
+        """
+        Constructor
+        """
+        self.__period = period                                              # int or float seconds
+
+        self.__entries = deque()                                            # deque of (index, timestamp, ...)
+        self.__next_index = 0                                               # int
+
+        self.__sums = [0.0] * len(self.FIELDS)                              # array of float
+        self.__counts = [0] * len(self.FIELDS)                              # array of int
+        self.__mins = [deque() for _ in self.FIELDS]                        # array of deque of (index, value)
+        self.__maxs = [deque() for _ in self.FIELDS]                        # array of deque of (index, value)
+
+        self.__bin_sums = []                                                # array of float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, datum):
+        index = self.__next_index
+        self.__next_index += 1
+
+        timestamp = datum.rec.timestamp()
+        values = tuple(getattr(datum, field) for field in self.FIELDS)
+        bins = tuple(getattr(datum, 'bins', None) or ())                   # SPSDatum has no bins
+
+        self.__entries.append((index, timestamp, datum.rec, values, bins))
+
+        for i in range(len(values)):
+            value = values[i]
+
+            if value is None:
+                continue
+
+            self.__sums[i] += value
+            self.__counts[i] += 1
+
+            while self.__mins[i] and self.__mins[i][-1][1] >= value:
+                self.__mins[i].pop()
+
+            self.__mins[i].append((index, value))
+
+            while self.__maxs[i] and self.__maxs[i][-1][1] <= value:
+                self.__maxs[i].pop()
+
+            self.__maxs[i].append((index, value))
+
+        if len(bins) > len(self.__bin_sums):
+            self.__bin_sums.extend([0.0] * (len(bins) - len(self.__bin_sums)))
+
+        for i in range(len(bins)):
+            self.__bin_sums[i] += bins[i]
+
+        self.__evict(timestamp - self.__period)
+
+
+    def report(self):
+        if not self.__entries:
+            return OPCWindowReport(self.__period, 0, None, None, {}, [])
+
+        stats = OrderedDict()
+
+        for i in range(len(self.FIELDS)):
+            if self.__counts[i] == 0:
+                stats[self.FIELDS[i]] = (None, None, None)
+                continue
+
+            mean = self.__sums[i] / self.__counts[i]
+            stats[self.FIELDS[i]] = (mean, self.__mins[i][0][1], self.__maxs[i][0][1])
+
+        start = self.__entries[0][2]
+        end = self.__entries[-1][2]
+
+        return OPCWindowReport(self.__period, len(self.__entries), start, end, stats, list(self.__bin_sums))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __evict(self, oldest_timestamp):
+        while self.__entries and self.__entries[0][1] <= oldest_timestamp:
+            index, _, _, values, bins = self.__entries.popleft()
+
+            for i in range(len(values)):
+                if values[i] is None:
+                    continue
+
+                self.__sums[i] -= values[i]
+                self.__counts[i] -= 1
+
+                if self.__mins[i] and self.__mins[i][0][0] <= index:
+                    self.__mins[i].popleft()
+
+                if self.__maxs[i] and self.__maxs[i][0][0] <= index:
+                    self.__maxs[i].popleft()
+
+            for i in range(len(bins)):
+                self.__bin_sums[i] -= bins[i]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCWindow:{period:%s, len:%s}" % (self.period, len(self))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCWindowReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, period, count, start, end, stats, bins):
+        """
+        Constructor
+        """
+        self.__period = period                                              # int or float seconds
+        self.__count = int(count)                                           # int
+
+        self.__start = start                                                # LocalizedDatetime
+        self.__end = end                                                    # LocalizedDatetime
+
+        self.__stats = stats                                                # dict of field: (mean, min, max)
+        self.__bins = [round(count, 1) for count in bins]                   # array of float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['period'] = self.period
+        jdict['count'] = self.count
+
+        jdict['start'] = None if self.start is None else self.start.as_iso8601()
+        jdict['end'] = None if self.end is None else self.end.as_iso8601()
+
+        for field in OPCWindow.FIELDS:
+            jdict[field] = OrderedDict(zip(('mean', 'min', 'max'), self.stats(field)))
+
+        jdict['bins'] = self.bins
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def stats(self, field):
+        stats = self.__stats.get(field, (None, None, None))
+
+        return tuple(Datum.float(value, 3) for value in stats)
+
+
+    def mean(self, field):
+        return self.stats(field)[0]
+
+
+    def min(self, field):
+        return self.stats(field)[1]
+
+
+    def max(self, field):
+        return self.stats(field)[2]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def start(self):
+        return self.__start
+
+
+    @property
+    def end(self):
+        return self.__end
+
+
+    @property
+    def bins(self):
+        return self.__bins
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCWindowReport:{period:%s, count:%s, start:%s, end:%s, stats:%s, bins:%s}" % \
+               (self.period, self.count, self.start, self.end, self.__stats, self.bins)
@@ -0,0 +1,184 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The OPCMonitor sampling loop, as a MonitorHost worker.
+"""
+
+import time
+
+from scs_core.particulate.opc_error_log import OPCErrorLog
+
+from scs_core.sys.logging import Logging
+
+from scs_dfe.monitor.monitor_state import MonitorState
+from scs_dfe.monitor.monitor_worker import MonitorWorker
+from scs_dfe.particulate.opc import OPC
+
+from scs_host.lock.lock_timeout import LockTimeout
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCWorker(MonitorWorker):
+    """
+    classdocs
+    """
+
+    NAME =      'opc'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, opc: OPC, conf, manager):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__logger = Logging.getLogger()
+
+        self.__opc = opc
+        self.__conf = conf
+        self.__manager = manager
+
+        self.__first_reading = True
+        self.__zero_count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # MonitorWorker implementation...
+
+    def start(self):
+        self.__opc.power_on()
+        self.__opc.operations_on()
+
+        self.__first_reading = True
+        self.__zero_count = 0
+
+
+    def stop(self):
+        try:
+            self.__opc.operations_off()
+            self.__opc.power_off()
+
+        except (LockTimeout, OSError):
+            pass
+
+
+    def run(self, stop):
+        self.__logger = Logging.getLogger()
+
+        self.__opc.clean()
+
+        max_permitted_zero_readings = self.__opc.max_permitted_zero_readings()
+        self.__zero_count = 0
+
+        for _ in self.intervals(stop, self.__conf.sample_period):
+            try:
+                if not self.__opc.data_ready():
+                    self.__logger.error("data not ready.")
+                    self._empty()
+                    continue
+
+                datum = self.__opc.sample()
+
+                if self.__conf.restart_on_zeroes and datum.is_zero():
+                    self.__zero_count += 1
+
+                    if self.__zero_count > max_permitted_zero_readings:
+                        raise ValueError("zero reading")
+
+                    if not self.__first_reading:
+                        self.__logger.error("zero reading %d of %d" %
+                                            (self.__zero_count, max_permitted_zero_readings))
+
+                else:
+                    self.__zero_count = 0
+
+            except LockTimeout as ex:
+                self.__logger.error(repr(ex))
+                self._empty()
+
+            except ValueError as ex:
+                self.__logger.error(repr(ex))
+                self._empty()
+                self.__power_cycle(ex)
+
+            except OSError as ex:
+                self.__logger.error(repr(ex))
+                self._error()
+                break
+
+            else:
+                # publish - outside the OPC exception handling: a document too long for the slot is not an OPC fault...
+                if not self.__first_reading:
+                    try:
+                        self._publish(datum)
+
+                    except ValueError as ex:
+                        self.__logger.error(repr(ex))
+                        self._error()
+                        break
+
+            if self.__first_reading:
+                self.__first_reading = False
+
+
+    @property
+    def name(self):
+        return self.NAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __power_cycle(self, ex):
+        self.__logger.error("power cycle")
+
+        OPCErrorLog.save_event(self.__manager, str(ex), trim=True)
+
+        try:
+            # off...
+            self.__opc.operations_off()
+            self.__opc.power_off()
+
+            time.sleep(self.__opc.power_cycle_time())
+
+            # on...
+            self.__opc.power_on()
+            self.__opc.operations_on()
+
+            self.__first_reading = True
+            self.__zero_count = 0
+
+        except Exception as ex:
+            self.__logger.error("power cycle: %s" % repr(ex))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # data retrieval for client process...
+
+    def firmware(self):
+        return self.__opc.firmware()
+
+
+    def sample(self):
+        if self._status() == MonitorState.STATUS_FATAL_ERROR:
+            raise StopIteration()
+
+        jdict = self._read()
+
+        return None if jdict is None else self.__opc.datum_class().construct_from_jdict(jdict)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def opc(self):
+        return self.__opc
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCWorker:{opc:%s, conf:%s, first_reading:%s}" % (self.__opc, self.__conf, self.__first_reading)
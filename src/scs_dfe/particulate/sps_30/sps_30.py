@@ -17,6 +17,7 @@ from scs_core.data.datum import Decode, Encode
 
 from scs_core.particulate.sps_datum import SPSDatum, SPSDatumCounts
 
+from scs_dfe.data.crc8 import CRC8
 from scs_dfe.particulate.opc import OPC
 
 from scs_host.bus.i2c import I2C
@@ -81,51 +82,6 @@ class SPS30(OPC):
         return SPSDatum
 
 
-    # ----------------------------------------------------------------------------------------------------------------
-
-    @classmethod
-    def __decode(cls, chars):
-        decoded = []
-
-        for i in range(0, len(chars), 3):
-            group = chars[i:i + 2]
-            decoded.extend(group)
-
-            actual_crc = chars[i + 2]
-            required_crc = cls.__crc(group)
-
-            if actual_crc != required_crc:
-                raise ValueError("bad checksum: required: 0x%02x actual: 0x%02x" % (required_crc, actual_crc))
-
-        return decoded
-
-
-    @classmethod
-    def __encode(cls, chars):
-        encoded = []
-
-        for i in range(0, len(chars), 2):
-            group = chars[i:i + 2]
-
-            encoded.extend(group)
-            encoded.append(cls.__crc(group))
-
-        return encoded
-
-
-    @staticmethod
-    def __crc(data):
-        crc = 0xff
-
-        for datum in data:
-            crc ^= datum
-
-            for bit in range(8, 0, -1):
-                crc = ((crc << 1) ^ 0x31 if crc & 0x80 else (crc << 1)) & 0xff
-
-        return crc
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -297,7 +253,7 @@ class SPS30(OPC):
                 I2C.Sensors.start_tx(self.__i2c_addr)
 
                 encoded = I2C.Sensors.read_cmd16(command, count)
-                values = self.__decode(encoded)
+                values = CRC8.decode(encoded)
 
             finally:
                 I2C.Sensors.end_tx()
@@ -316,7 +272,7 @@ class SPS30(OPC):
             try:
                 I2C.Sensors.start_tx(self.__i2c_addr)
 
-                encoded = self.__encode(values)
+                encoded = CRC8.encode(values)
                 I2C.Sensors.write_addr16(command, *encoded)
 
             finally:
@@ -0,0 +1,195 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Samples several sensors concurrently on one asyncio event loop, so that a complete record costs the latency of the
+slowest chain of sensors, rather than the sum of all of them.
+
+Each sampler is a callable, given the data of the samplers it depends on - for example, an AFE depends on an SHT31:
+
+scheduler.add('climate', sht31.sample)
+scheduler.add('gas', afe.sample, 'climate')
+scheduler.add('particulates', opc.sample)
+
+A blocking sampler runs in a worker thread, where its conversion waits overlap those of the others. A coroutine
+function is awaited on the loop, so may use asyncio.sleep(..) for its waits. While the scheduler is open, the I2C buses
+are serialised, so that no two threads interleave their transactions.
+
+An exception raised by a sampler is returned in its place in the record, as for asyncio.gather(..).
+"""
+
+import asyncio
+import functools
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_dfe.bus.bus import Bus
+from scs_dfe.bus.serialised_i2c import SerialisedI2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SamplingScheduler(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, max_workers=None):
+        """
+        Constructor
+        """
+        self.__max_workers = max_workers                    # int or None for one per sampler
+
+        self.__samplers = OrderedDict()                     # dict of name: (callable, tuple of names)
+        self.__latencies = OrderedDict()                    # dict of name: float seconds
+
+        self.__executor = None                              # ThreadPoolExecutor
+        self.__saved = None                                 # dict of bus name: backend
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, name, sampler, *depends):
+        if name in self.__samplers:
+            raise ValueError("duplicate sampler: %s" % name)
+
+        for dependency in depends:
+            if dependency not in self.__samplers:
+                raise ValueError("unknown dependency: %s" % dependency)     # also prevents cycles
+
+        self.__samplers[name] = (sampler, depends)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__executor is not None:
+            return
+
+        workers = len(self.__samplers) if self.__max_workers is None else self.__max_workers
+        self.__executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='SamplingScheduler')
+
+        self.__saved = {'installed': Bus.is_installed()}
+        backends = {}
+
+        for name in Bus.I2C_BUSES:
+            backend = Bus.i2c(name)
+            self.__saved[name] = backend
+
+            if backend is not None and not isinstance(backend, SerialisedI2C):
+                backends[name.lower()] = SerialisedI2C(backend)
+
+        Bus.install(**backends)
+
+
+    def close(self):
+        if self.__executor is None:
+            return
+
+        self.__executor.shutdown(wait=True)
+        self.__executor = None
+
+        saved = self.__saved
+
+        if saved['installed']:
+            Bus.install(**{name.lower(): saved[name] for name in Bus.I2C_BUSES})
+        else:
+            Bus.restore()
+
+        self.__saved = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sample(self):
+        """
+        a synchronous record, for callers without an event loop
+        """
+        return asyncio.run(self.sample_all())
+
+
+    async def sample_all(self):
+        """
+        OrderedDict of name: datum
+        """
+        if self.__executor is None:
+            raise RuntimeError("SamplingScheduler: not open")
+
+        tasks = OrderedDict()
+
+        for name, (sampler, depends) in self.__samplers.items():
+            tasks[name] = asyncio.ensure_future(self.__sample(name, sampler, [tasks[dep] for dep in depends]))
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        return OrderedDict(zip(tasks.keys(), results))
+
+
+    async def run(self, interval, count=None):
+        """
+        records at the given interval, without catching up on overrun
+        """
+        next_time = time.monotonic()
+        yielded = 0
+
+        while count is None or yielded < count:
+            yield await self.sample_all()
+            yielded += 1
+
+            next_time += interval
+            delay = next_time - time.monotonic()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_time = time.monotonic()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def __sample(self, name, sampler, dependencies):
+        args = [await dependency for dependency in dependencies]        # a failed dependency fails this sampler
+
+        start_time = time.monotonic()
+
+        if asyncio.iscoroutinefunction(sampler):
+            datum = await sampler(*args)
+        else:
+            datum = await asyncio.get_running_loop().run_in_executor(self.__executor,
+                                                                     functools.partial(sampler, *args))
+
+        self.__latencies[name] = time.monotonic() - start_time
+
+        return datum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def names(self):
+        return list(self.__samplers.keys())
+
+
+    @property
+    def latencies(self):
+        """
+        OrderedDict of name: the latency of the last successful sample
+        """
+        return OrderedDict(self.__latencies)
+
+
+    @property
+    def is_open(self):
+        return self.__executor is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SamplingScheduler:{max_workers:%s, names:%s, is_open:%s}" % \
+               (self.__max_workers, self.names, self.is_open)
@@ -0,0 +1,92 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Register-level model of a Texas Instruments ADS1115 ADC: single-shot and continuous conversion at the configured
+data rate, with the OS bit reporting conversion status.
+"""
+
+import time
+
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimADS1115(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_VOLTAGE =   0.25                                # volts
+
+    __REG_CONV =        0x00
+    __REG_CONFIG =      0x01
+
+    __OS =              0x8000
+    __MODE_SINGLE =     0x0100
+
+    __FULL_SCALE = {0x0000: 6.144, 0x0200: 4.096, 0x0400: 2.048, 0x0600: 1.024, 0x0800: 0.512, 0x0a00: 0.256,
+                    0x0c00: 0.256, 0x0e00: 0.256}
+
+    __SPS = {0x0000: 8, 0x0020: 16, 0x0040: 32, 0x0060: 64, 0x0080: 128, 0x00a0: 250, 0x00c0: 475, 0x00e0: 860}
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, voltages=None):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__voltages = {} if voltages is None else dict(voltages)    # dict of mux: volts
+
+        self.__registers = {0x00: 0x0000, 0x01: 0x8583, 0x02: 0x8000, 0x03: 0x7fff}
+        self.__pointer = self.__REG_CONV
+        self.__ready_time = 0.0                                         # float monotonic seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def set_voltage(self, mux, v):
+        self.__voltages[mux] = v
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        self.__pointer = chars[0] & 0x03
+
+        if len(chars) < 3:
+            return
+
+        value = (chars[1] << 8) | chars[2]
+        self.__registers[self.__pointer] = value & ~self.__OS if self.__pointer == self.__REG_CONFIG else value
+
+        if self.__pointer != self.__REG_CONFIG:
+            return
+
+        if not (value & self.__MODE_SINGLE) or (value & self.__OS):
+            self.__ready_time = time.monotonic() + 1.0 / self.__SPS[value & 0x00e0]
+            self.__registers[self.__REG_CONV] = self.__code(value)
+
+
+    def read(self, count):
+        value = self.__registers[self.__pointer]
+
+        if self.__pointer == self.__REG_CONFIG and time.monotonic() >= self.__ready_time:
+            value |= self.__OS                                          # not performing a conversion
+
+        return self._pad((value >> 8, value & 0xff), count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __code(self, config):
+        v = self.__voltages.get(config & 0x7000, self.DEFAULT_VOLTAGE)
+        full_scale = self.__FULL_SCALE[config & 0x0e00]
+
+        signed = max(-32768, min(32767, int(round(v / full_scale * 32767.5))))
+
+        return signed & 0xffff
@@ -0,0 +1,106 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Command-level model of a South Coast Science DSI microcontroller: start conversion, conversion counts and voltages,
+and version strings. A two-channel (electrochemical) DSI reports aux then wrk - a single-channel (PID) DSI reports wrk
+only.
+
+Optionally, each conversion adds Gaussian noise to both channels, and every nth conversion adds a spike to wrk.
+"""
+
+import random
+import struct
+
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimDSI(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    __RESPONSE_ACK =    1
+
+    __COUNTS_PER_VOLT = 65535 / 3.3
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, v_wrk=0.3, v_aux=0.25, ident='SimDSI', tag='0.0.0', noise=0.0, spike_every=0, spike=0.0,
+                 seed=None):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__v_wrk = v_wrk                                # float volts
+        self.__v_aux = v_aux                                # float volts
+        self.__ident = ident                                # string
+        self.__tag = tag                                    # string
+
+        self.__noise = float(noise)                         # float volts standard deviation
+        self.__spike_every = int(spike_every)               # int conversions
+        self.__spike = float(spike)                         # float volts
+        self.__random = random.Random(seed)
+
+        self.__conversions = 0                              # int
+        self.__cmd = None                                   # string
+        self.__converted = (v_wrk, v_aux)                   # tuple of float volts - wrk, aux
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        self.__cmd = chr(chars[0])
+
+        if self.__cmd == 's':
+            self.__conversions += 1
+            self.__converted = self.__convert()
+
+
+    def read(self, count):
+        if self.__cmd in ('s', '1', '0'):
+            return self._pad([self.__RESPONSE_ACK], count)
+
+        v_wrk, v_aux = self.__converted
+
+        if self.__cmd == 'c':
+            c_wrk = int(v_wrk * self.__COUNTS_PER_VOLT)
+            c_aux = int(v_aux * self.__COUNTS_PER_VOLT)
+
+            return list(struct.pack('<HH', c_aux, c_wrk) if count >= 4 else struct.pack('<H', c_wrk))[:count]
+
+        if self.__cmd == 'v':
+            return list(struct.pack('<ff', v_aux, v_wrk) if count >= 8 else struct.pack('<f', v_wrk))[:count]
+
+        if self.__cmd == 'i':
+            return list(self.__ident.ljust(count).encode()[:count])
+
+        if self.__cmd == 't':
+            return list(self.__tag.ljust(count).encode()[:count])
+
+        return self._pad([], count)
+
+
+    def __convert(self):
+        v_wrk = self.__v_wrk
+        v_aux = self.__v_aux
+
+        if self.__noise:
+            v_wrk += self.__random.gauss(0.0, self.__noise)
+            v_aux += self.__random.gauss(0.0, self.__noise)
+
+        if self.__spike_every and self.__conversions % self.__spike_every == 0:
+            v_wrk += self.__spike
+
+        return v_wrk, v_aux
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def conversions(self):
+        return self.__conversions
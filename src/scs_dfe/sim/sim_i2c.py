@@ -0,0 +1,229 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A deterministic in-process I2C bus, with the interface of the scs_host I2C buses, routing transactions to register-level
+device models. Each read or write is a transaction, with a configurable latency and per-byte time.
+
+As with the scs_host buses, a single-byte read returns an int.
+"""
+
+import time
+
+from abc import ABC, abstractmethod
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimI2C(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, bus=1, latency=0.0, byte_time=0.0):
+        """
+        Constructor
+        """
+        self.__bus = bus                                    # int
+        self.__latency = latency                            # float seconds per transaction
+        self.__byte_time = byte_time                        # float seconds per byte
+
+        self.__devices = {}                                 # dict of addr: SimI2CDevice
+        self.__device = None                                # SimI2CDevice
+
+        self.__transactions = 0                             # int
+        self.__bytes = 0                                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def attach(self, device):
+        self.__devices[device.addr] = device
+
+        return device
+
+
+    def detach(self, addr):
+        del self.__devices[addr]
+
+
+    def device(self, addr):
+        return self.__devices.get(addr)
+
+
+    def reset_counts(self):
+        self.__transactions = 0
+        self.__bytes = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # scs_host I2C interface...
+
+    def open(self):
+        pass
+
+
+    def close(self):
+        pass
+
+
+    def start_tx(self, addr):
+        if addr not in self.__devices:
+            raise OSError("SimI2C: no device at 0x%02x" % addr)
+
+        self.__device = self.__devices[addr]
+
+
+    def end_tx(self):
+        self.__device = None
+
+
+    def read(self, count):
+        chars = self.__read(count)
+
+        return chars[0] if count == 1 else chars
+
+
+    def read_cmd(self, cmd, count, wait=None):
+        self.__write(cmd if isinstance(cmd, (list, tuple)) else [cmd])         # the MCUs send a command message
+
+        if wait:
+            time.sleep(wait)
+
+        return self.read(count)
+
+
+    def read_cmd16(self, cmd, count, wait=None):
+        self.__write([cmd >> 8, cmd & 0xff])
+
+        if wait:
+            time.sleep(wait)
+
+        return self.read(count)
+
+
+    def write(self, *values):
+        self.__write(values)
+
+
+    def write16(self, value):
+        self.__write([value >> 8, value & 0xff])
+
+
+    def write_addr(self, addr, *values):
+        self.__write([addr, *values])
+
+
+    def write_addr16(self, addr, *values):
+        self.__write([addr >> 8, addr & 0xff, *values])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __read(self, count):
+        self.__transaction(count)
+
+        return list(self.__selected().read(count))
+
+
+    def __write(self, chars):
+        self.__transaction(len(chars))
+        self.__selected().write([int(char) for char in chars])
+
+
+    def __selected(self):
+        if self.__device is None:
+            raise OSError("SimI2C: no transaction")
+
+        return self.__device
+
+
+    def __transaction(self, count):
+        self.__transactions += 1
+        self.__bytes += count
+
+        delay = self.__latency + count * self.__byte_time
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def bus(self):
+        return self.__bus
+
+
+    @property
+    def transactions(self):
+        return self.__transactions
+
+
+    @property
+    def bytes(self):
+        return self.__bytes
+
+
+    @property
+    def addrs(self):
+        return sorted(self.__devices.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimI2C:{bus:%s, latency:%s, byte_time:%s, addrs:%s, transactions:%s, bytes:%s}" % \
+               (self.bus, self.__latency, self.__byte_time, ['0x%02x' % addr for addr in self.addrs],
+                self.transactions, self.bytes)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimI2CDevice(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr):
+        """
+        Constructor
+        """
+        self.__addr = addr                                  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def write(self, chars):
+        pass
+
+
+    @abstractmethod
+    def read(self, count):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _pad(chars, count):
+        return (list(chars) + [0] * count)[:count]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def addr(self):
+        return self.__addr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "%s:{addr:0x%02x}" % (self.__class__.__name__, self.addr)
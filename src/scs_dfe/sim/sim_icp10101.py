@@ -0,0 +1,76 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Command-level model of a TDK InvenSense ICP-10101 barometric pressure sensor: OTP calibration constants, ID and
+ultra-low-noise measurement, with CRC-8 protected words.
+"""
+
+from scs_dfe.data.crc8 import CRC8
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimICP10101(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_CONSTANTS = (1000, 1000, 1000, 3800)                 # with p_count 0xacf4a4, about 101.3 kPa at 21 °C
+
+    __CMD_MEASURE_ULN =     0x7866
+    __CMD_READ_ID =         0xefc8
+    __CMD_OTP_READ =        0xc7f7
+    __CMD_OTP_START =       0xc595
+
+    __ID =                  0x0848
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, temp=21.0, p_count=0xacf4a4, constants=DEFAULT_CONSTANTS):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__temp = temp                                  # float °C
+        self.__p_count = p_count                            # int (24-bit raw)
+        self.__constants = list(constants)                  # array of int
+
+        self.__otp_index = 0                                # int
+        self.__response = []                                # array of int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        cmd = (chars[0] << 8) | chars[1] if len(chars) > 1 else chars[0]
+
+        if cmd == self.__CMD_OTP_START:
+            self.__otp_index = 0
+            self.__response = []
+
+        elif cmd == self.__CMD_OTP_READ:
+            constant = self.__constants[self.__otp_index % len(self.__constants)]
+            self.__otp_index += 1
+
+            self.__response = CRC8.encode([constant >> 8, constant & 0xff])
+
+        elif cmd == self.__CMD_READ_ID:
+            self.__response = CRC8.encode([self.__ID >> 8, self.__ID & 0xff])
+
+        elif cmd == self.__CMD_MEASURE_ULN:
+            t_count = int(round((self.__temp + 45.0) * 65536.0 / 175.0)) & 0xffff
+            p_count = self.__p_count & 0xffffff
+
+            self.__response = CRC8.encode([t_count >> 8, t_count & 0xff,
+                                           p_count >> 16, (p_count >> 8) & 0xff, p_count & 0xff, 0x00])
+
+        else:
+            self.__response = []
+
+
+    def read(self, count):
+        return self._pad(self.__response, count)
@@ -0,0 +1,74 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Register-level model of a Microchip Technology MCP3421 / MCP3425 ADC: single-shot conversion at the configured rate,
+with the RDY bit set until the conversion is complete.
+"""
+
+import time
+
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimMCP342X(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_VOLTAGE =   0.3                                 # volts
+
+    __RDY =             0x80
+    __MODE_CONT =       0x10
+
+    __GAIN = {0x00: 1.0, 0x01: 2.0, 0x02: 4.0, 0x03: 8.0}
+    __SPS = {0x00: 240, 0x04: 60, 0x08: 15, 0x0c: 15}
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, voltage=DEFAULT_VOLTAGE):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__voltage = voltage                            # float volts
+        self.__config = 0x10                                # int
+        self.__ready_time = 0.0                             # float monotonic seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        self.__config = chars[0] & ~self.__RDY
+
+        if chars[0] & self.__RDY or chars[0] & self.__MODE_CONT:
+            self.__ready_time = time.monotonic() + 1.0 / self.__SPS[chars[0] & 0x0c]
+
+
+    def read(self, count):
+        gain = self.__GAIN[self.__config & 0x03]
+        signed = max(-32768, min(32767, int(round(self.__voltage * gain / 2.048 * 32767.5))))
+        unsigned = signed & 0xffff
+
+        config = self.__config
+
+        if time.monotonic() < self.__ready_time:
+            config |= self.__RDY                            # conversion not ready
+
+        return self._pad((unsigned >> 8, unsigned & 0xff, config), count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def voltage(self):
+        return self.__voltage
+
+
+    @voltage.setter
+    def voltage(self, voltage):
+        self.__voltage = voltage
@@ -0,0 +1,66 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Command-level model of a South Coast Science interface MCU (PZHB or OPCube): power and LED commands are recorded as
+state, version strings are reported, and every other command returns zeros.
+"""
+
+from collections import OrderedDict
+
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimMCU(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, ident='SimMCU', tag='0.0.0'):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__ident = ident                                # string
+        self.__tag = tag                                    # string
+
+        self.__states = OrderedDict()                       # dict of register: int
+        self.__commands = 0                                 # int
+        self.__cmd = None                                   # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        self.__cmd = chr(chars[0]) + chr(chars[1])
+        self.__commands += 1
+
+        if self.__cmd[0] in ('p', 'l'):
+            self.__states[self.__cmd] = chars[2]
+
+
+    def read(self, count):
+        if self.__cmd == 'vi':
+            return list(self.__ident.ljust(count).encode()[:count])
+
+        if self.__cmd == 'vt':
+            return list(self.__tag.ljust(count).encode()[:count])
+
+        return self._pad([], count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def state(self, register):
+        return self.__states.get(register)
+
+
+    @property
+    def commands(self):
+        return self.__commands
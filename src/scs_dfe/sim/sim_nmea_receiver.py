@@ -0,0 +1,169 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Model of a u-blox receiver's default NMEA output: once per navigation interval, aligned to the clock, a burst of
+sentences timed to that epoch, transmitted at the line rate (ten bits per byte). Optionally, the checksum of every nth
+sentence is corrupted.
+
+The receiver transmits at its own line rate: if the host port is set to a different baud rate, nothing is received.
+
+example burst:
+$GNRMC,104822.00,A,5049.40155,N,00007.38453,W,0.105,,201119,,,D*79
+$GNVTG,,T,,M,0.105,N,0.194,K,D*30
+$GNGGA,104822.00,5049.40155,N,00007.38453,W,2,09,1.01,24.2,M,45.4,M,,0000*66
+$GNGSA,A,3,31,22,09,17,19,23,06,07,,,,,1.48,1.01,1.08*1D
+$GPGSV,2,1,08,06,66,247,39,07,24,164,47,09,,,33,17,04,214,39*48
+$GPGSV,2,2,08,19,15,227,50,23,57,066,33,24,,,30,26,,,29*76
+$GNGLL,5049.40155,N,00007.38453,W,104822.00,A,D*6D
+"""
+
+import time
+
+from scs_core.position.nmea.nmea_report import NMEAReport
+
+from scs_dfe.sim.sim_serial import SimSerialDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimNMEAReceiver(SimSerialDevice):
+    """
+    classdocs
+    """
+
+    __MAX_BACKLOG =     2                                   # epochs - older output is lost, as by a UART overrun
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, interval=1.0, corrupt_every=0, baud_rate=9600):
+        """
+        Constructor
+        """
+        self._interval = float(interval)                    # float seconds
+        self.__corrupt_every = int(corrupt_every)           # int
+
+        self._baud_rate = baud_rate                         # int line rate
+        self.__host_baud_rate = None                        # int
+        self.__cursor = None                                # float seconds
+        self.__pending = bytearray()                        # bytearray - responses, ahead of the next burst
+
+        self.__burst_epoch = None                           # tuple of epoch, interval
+        self.__burst = b""                                  # bytes
+
+        self.__sentences = 0                                # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # SimSerialDevice implementation...
+
+    def connect(self, baud_rate):
+        self.__host_baud_rate = baud_rate
+
+
+    def transmit(self, now):
+        if self.__cursor is None:
+            self.__cursor = now
+            return b""
+
+        start_time = max(self.__cursor, now - self.__MAX_BACKLOG * self._interval)
+        chars = bytearray(self.__pending)
+
+        for epoch in range(int(start_time // self._interval), int(now // self._interval) + 1):
+            burst = self.burst(epoch)
+            epoch_time = epoch * self._interval
+
+            sent = self.__sent(start_time - epoch_time, len(burst))
+            chars += burst[sent:self.__sent(now - epoch_time, len(burst))]
+
+        self.__cursor = now
+        self.__pending = bytearray()
+
+        return bytes(chars) if self.__host_baud_rate == self._baud_rate else b""
+
+
+    def receive(self, data, port):
+        if self.__host_baud_rate == self._baud_rate:
+            self._receive(data)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def burst(self, epoch):
+        if (epoch, self._interval) == self.__burst_epoch:
+            return self.__burst
+
+        self.__burst = self._output(epoch * self._interval)
+        self.__burst_epoch = (epoch, self._interval)
+
+        return self.__burst
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _output(self, epoch_time):
+        """
+        the bytes output for the epoch at the given time
+        """
+        hhmmss = time.strftime("%H%M%S", time.gmtime(epoch_time))
+        ddmmyy = time.strftime("%d%m%y", time.gmtime(epoch_time))
+        fraction = "%02d" % (round(epoch_time % 1 * 100) % 100)
+
+        utc = hhmmss + "." + fraction
+        loc = "5049.40155,N,00007.38453,W"
+
+        bodies = (
+            "GNRMC,%s,A,%s,0.105,,%s,,,D" % (utc, loc, ddmmyy),
+            "GNVTG,,T,,M,0.105,N,0.194,K,D",
+            "GNGGA,%s,%s,2,09,1.01,24.2,M,45.4,M,,0000" % (utc, loc),
+            "GNGSA,A,3,31,22,09,17,19,23,06,07,,,,,1.48,1.01,1.08",
+            "GPGSV,2,1,08,06,66,247,39,07,24,164,47,09,,,33,17,04,214,39",
+            "GPGSV,2,2,08,19,15,227,50,23,57,066,33,24,,,30,26,,,29",
+            "GNGLL,%s,%s,A,D" % (loc, utc)
+        )
+
+        return b"".join(self.__sentence(body) for body in bodies if self._is_enabled(body[2:5]))
+
+
+    def _is_enabled(self, message_type):
+        return True
+
+
+    def _receive(self, data):
+        pass
+
+
+    def _respond(self, chars):
+        self.__pending += chars
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __sentence(self, body):
+        self.__sentences += 1
+
+        checksum = NMEAReport.checksum("$" + body)
+
+        if self.__corrupt_every and self.__sentences % self.__corrupt_every == 0:
+            checksum ^= 0xff
+
+        return ("$%s*%02X\r\n" % (body, checksum)).encode('ascii')
+
+
+    def __sent(self, elapsed, length):
+        return int(min(max(elapsed * self._baud_rate / 10.0, 0), length))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sentences(self):
+        return self.__sentences
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return self.__class__.__name__ + ":{interval:%s, corrupt_every:%s, baud_rate:%s, sentences:%s}" % \
+               (self._interval, self.__corrupt_every, self._baud_rate, self.sentences)
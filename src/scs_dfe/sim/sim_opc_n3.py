@@ -0,0 +1,79 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Command-level model of an Alphasense OPC-N3 on SPI: the check, histogram and power commands, with a histogram frame of
+known values and a valid CRC. Any other command is answered with READY, then zero bytes.
+"""
+
+import struct
+
+from scs_core.data.crc import modbus_crc
+
+from scs_dfe.sim.sim_spi import SimSPIDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimOPCN3(SimSPIDevice):
+    """
+    classdocs
+    """
+
+    __CMD_CHECK =           0xcf
+    __CMD_READ_HISTOGRAM =  0x30
+
+    __RESPONSE_READY =      0xf3
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def histogram(cls, bins=tuple(range(24)), pm=(1.1, 2.2, 3.3)):
+        body = list(struct.pack('<24H', *bins)) + [1, 2, 3, 4] + list(struct.pack('<HHHH', 1000, 550, 25000, 32000)) + \
+            list(struct.pack('<fff', *pm)) + [0] * 12
+
+        return body + list(struct.pack('<H', modbus_crc(body)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, corrupt_bursts=0):
+        """
+        Constructor
+        """
+        self.__corrupt_bursts = corrupt_bursts              # int
+        self.__payload = []                                 # array of int
+
+        self.__histograms = 0                               # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def xfer(self, values):
+        if values[0] == self.__CMD_CHECK:
+            self.__payload = [self.__RESPONSE_READY]
+
+        elif values[0] == self.__CMD_READ_HISTOGRAM:
+            self.__payload = self.histogram()
+            self.__histograms += 1
+
+        return [self.__RESPONSE_READY] * len(values)
+
+
+    def read_bytes(self, count):
+        chars = (self.__payload[:count] + [0] * count)[:count]
+        self.__payload = self.__payload[count:]
+
+        if count > 1 and self.__corrupt_bursts > 0:
+            self.__corrupt_bursts -= 1
+            chars[0] ^= 0xff
+
+        return chars
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def histograms(self):
+        return self.__histograms
@@ -0,0 +1,51 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Model of an NXP PCA8574 remote 8-bit I/O expander - or any single-register I2C device, such as a PCA9543A switch.
+"""
+
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimPCA8574(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, byte=0xff):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__byte = byte                                  # int
+        self.__writes = 0                                   # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        self.__byte = chars[-1]
+        self.__writes += 1
+
+
+    def read(self, count):
+        return [self.__byte] * count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def byte(self):
+        return self.__byte
+
+
+    @property
+    def writes(self):
+        return self.__writes
@@ -0,0 +1,145 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Model of a u-blox SAM M8Q receiver: the default NMEA output, plus the UBX configuration used by SAMM8Q - CFG-MSG for
+NMEA and NAV-PVT output rates, CFG-RATE, CFG-PRT for the baud rate and CFG-CFG to revert. Configuration is acknowledged
+with ACK-ACK, and unsupported messages with ACK-NAK. A CFG-PRT baud rate change takes effect immediately.
+"""
+
+import struct
+import time
+
+from scs_dfe.gps.ubx_message import UBXMessage
+from scs_dfe.gps.ubx_nav_pvt import UBXNavPVT
+from scs_dfe.gps.ubx_parser import UBXParser
+
+from scs_dfe.sim.sim_nmea_receiver import SimNMEAReceiver
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSAMM8Q(SimNMEAReceiver):
+    """
+    classdocs
+    """
+
+    __DEFAULT_BAUD_RATE =   9600
+
+    __NMEA_TYPES =          {0x00: 'GGA', 0x01: 'GLL', 0x02: 'GSA', 0x03: 'GSV', 0x04: 'RMC', 0x05: 'VTG'}
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, corrupt_every=0):
+        """
+        Constructor
+        """
+        super().__init__(interval=1.0, corrupt_every=corrupt_every, baud_rate=self.__DEFAULT_BAUD_RATE)
+
+        self.__parser = UBXParser()                         # UBXParser
+
+        self.__disabled = set()                             # set of string NMEA message types
+        self.__nav_pvt = False                              # bool
+
+        self.__commands = 0                                 # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _output(self, epoch_time):
+        output = super()._output(epoch_time)
+
+        if not self.__nav_pvt:
+            return output
+
+        utc = time.gmtime(epoch_time)
+        nano = int(round(epoch_time % 1 * 1000)) * 1000000
+
+        payload = UBXNavPVT.payload(int(epoch_time * 1000) % 604800000,
+                                    (utc.tm_year, utc.tm_mon, utc.tm_mday, utc.tm_hour, utc.tm_min, utc.tm_sec, nano),
+                                    UBXNavPVT.FIX_3D, 0x01, 9, 50.8233592, -0.1230755, 69.6, 24.2, h_acc=1.2,
+                                    ground_speed=0.105, p_dop=1.48)
+
+        return output + UBXMessage(UBXNavPVT.MSG_CLASS, UBXNavPVT.MSG_ID, payload).frame()
+
+
+    def _is_enabled(self, message_type):
+        return message_type not in self.__disabled
+
+
+    def _receive(self, data):
+        for message in self.__parser.feed(data):
+            self.__commands += 1
+            self.__configure(message)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __configure(self, message):
+        if message.msg_class != UBXMessage.CLASS_CFG:
+            self.__acknowledge(message, False)
+            return
+
+        if message.msg_id == UBXMessage.ID_CFG_MSG:
+            msg_class, msg_id, rate = message.payload[:3]
+
+            if msg_class == UBXMessage.CLASS_NMEA and msg_id in self.__NMEA_TYPES:
+                message_type = self.__NMEA_TYPES[msg_id]
+
+                if rate:
+                    self.__disabled.discard(message_type)
+                else:
+                    self.__disabled.add(message_type)
+
+            elif (msg_class, msg_id) == (UBXNavPVT.MSG_CLASS, UBXNavPVT.MSG_ID):
+                self.__nav_pvt = bool(rate)
+
+            else:
+                self.__acknowledge(message, False)
+                return
+
+        elif message.msg_id == UBXMessage.ID_CFG_RATE:
+            meas_rate, _, _ = struct.unpack('<HHH', message.payload)
+            self._interval = meas_rate / 1000.0
+
+        elif message.msg_id == UBXMessage.ID_CFG_PRT:
+            self.__acknowledge(message, True)
+            self._baud_rate = struct.unpack('<I', message.payload[8:12])[0]
+            return
+
+        elif message.msg_id == UBXMessage.ID_CFG_CFG:
+            self.__disabled = set()
+            self.__nav_pvt = False
+            self._interval = 1.0
+            self._baud_rate = self.__DEFAULT_BAUD_RATE
+
+        else:
+            self.__acknowledge(message, False)
+            return
+
+        self.__acknowledge(message, True)
+
+
+    def __acknowledge(self, message, ack):
+        msg_id = UBXMessage.ID_ACK_ACK if ack else UBXMessage.ID_ACK_NAK
+        self._respond(UBXMessage(UBXMessage.CLASS_ACK, msg_id, bytes((message.msg_class, message.msg_id))).frame())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def nav_pvt(self):
+        return self.__nav_pvt
+
+
+    @property
+    def commands(self):
+        return self.__commands
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimSAMM8Q:{disabled:%s, nav_pvt:%s, commands:%s, receiver:%s}" % \
+               (sorted(self.__disabled), self.nav_pvt, self.commands, super().__str__())
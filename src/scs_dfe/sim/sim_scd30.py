@@ -0,0 +1,91 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Command-level model of a Sensirion SCD30 CO2 sensor: the measurement interval, the data-ready flag and measurement
+read, with CRC-8 protected words. A new measurement is ready once per interval, and is cleared by the read. Other
+commands with an argument are accepted - any other read is answered with zero words.
+"""
+
+import struct
+import time
+
+from scs_dfe.data.crc8 import CRC8
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSCD30(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    __CMD_GET_DATA_READY =      0x0202
+    __CMD_READ_MEASUREMENT =    0x0300
+    __CMD_MEASUREMENT_INTERVAL = 0x4600
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, co2=420.0, temp=21.0, humid=50.0, interval=2):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__co2 = co2                                    # float ppm
+        self.__temp = temp                                  # float °C
+        self.__humid = humid                                # float %
+        self.__interval = interval                          # int seconds
+
+        self.__epoch = time.time()                          # float
+        self.__read_index = -1                              # int index of the last measurement read
+        self.__ready_polls = 0                              # int
+
+        self.__response = []                                # array of int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        cmd = (chars[0] << 8) | chars[1] if len(chars) > 1 else chars[0]
+
+        if cmd == self.__CMD_GET_DATA_READY:
+            self.__ready_polls += 1
+            self.__response = CRC8.encode([0x00, 0x01 if self.__index() > self.__read_index else 0x00])
+
+        elif cmd == self.__CMD_READ_MEASUREMENT:
+            self.__read_index = self.__index()
+            self.__response = CRC8.encode(struct.pack('>fff', self.__co2, self.__temp, self.__humid))
+
+        elif cmd == self.__CMD_MEASUREMENT_INTERVAL:
+            if len(chars) > 2:
+                self.__interval = (chars[2] << 8) | chars[3]
+                self.__epoch = time.time()
+                self.__read_index = -1
+
+            self.__response = CRC8.encode([self.__interval >> 8, self.__interval & 0xff])
+
+        else:
+            self.__response = []
+
+
+    def read(self, count):
+        if not self.__response:
+            return CRC8.encode([0x00] * (count // CRC8.GROUP_LENGTH * CRC8.WORD_LENGTH))
+
+        return self._pad(self.__response, count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __index(self):
+        return int((time.time() - self.__epoch) / self.__interval)       # the latest measurement
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ready_polls(self):
+        return self.__ready_polls
@@ -0,0 +1,193 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An in-process serial port, with the interface of scs_host HostSerial, connected to a device model. The device
+transmits at the port's line rate: a read blocks until the requested bytes have arrived, or the comms timeout elapses.
+"""
+
+import time
+
+from abc import ABC, abstractmethod
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSerial(object):
+    """
+    classdocs
+    """
+
+    __POLL_INTERVAL =       0.002                           # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def factory(cls, device):
+        """
+        a factory for Bus.install(serial_factory=..)
+        """
+        def construct(device_identifier, baud_rate):
+            return cls(device, device_identifier, baud_rate)
+
+        return construct
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, device, device_identifier, baud_rate):
+        """
+        Constructor
+        """
+        self.__device = device                              # SimSerialDevice
+        self.__device_identifier = device_identifier        # string or int
+        self.__baud_rate = baud_rate                        # int
+
+        self.__comms_timeout = None                         # float seconds
+        self.__buffer = bytearray()                         # bytearray
+        self.__is_open = False                              # bool
+
+        self.__bytes_read = 0                               # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # HostSerial interface...
+
+    def open(self, lock_timeout, comms_timeout):
+        self.__comms_timeout = comms_timeout
+        self.__device.connect(self.__baud_rate)
+        self.__is_open = True
+
+
+    def close(self):
+        self.__is_open = False
+
+
+    def read(self, count):
+        self.__check_open()
+
+        end_time = time.time() + self.__comms_timeout
+
+        while True:
+            self.__buffer += self.__device.transmit(time.time())
+
+            if len(self.__buffer) >= count or time.time() > end_time:
+                break
+
+            time.sleep(self.__POLL_INTERVAL)
+
+        chars = bytes(self.__buffer[:count])
+        del self.__buffer[:count]
+
+        self.__bytes_read += len(chars)
+
+        return chars
+
+
+    def read_line(self, eol=None, timeout=None):
+        terminator = b"\n" if eol is None else eol.encode()
+        end_time = None if timeout is None else time.time() + timeout
+
+        line = b""
+        while True:
+            if timeout is not None and time.time() > end_time:
+                raise TimeoutError(timeout)
+
+            line += self.read(1)
+
+            if line.endswith(terminator):
+                break
+
+        return line.decode(errors='ignore').strip()
+
+
+    def write(self, *chars):
+        self.__check_open()
+        self.__device.receive(bytes(chars), self)
+
+
+    def flush_input(self):
+        self.__buffer = bytearray()
+        self.__device.transmit(time.time())
+
+
+    @property
+    def in_waiting(self):
+        self.__check_open()
+        self.__buffer += self.__device.transmit(time.time())
+
+        return len(self.__buffer)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def set_baud_rate(self, baud_rate):
+        self.__baud_rate = baud_rate
+        self.__device.connect(baud_rate)
+
+
+    def __check_open(self):
+        if not self.__is_open:
+            raise OSError("serial port is not open: %s" % self.__device_identifier)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def device(self):
+        return self.__device
+
+
+    @property
+    def device_identifier(self):
+        return self.__device_identifier
+
+
+    @property
+    def baud_rate(self):
+        return self.__baud_rate
+
+
+    @property
+    def bytes_read(self):
+        return self.__bytes_read
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimSerial:{device_identifier:%s, baud_rate:%s, serial_open:%s, bytes_read:%s}" % \
+               (self.device_identifier, self.baud_rate, self.__is_open, self.bytes_read)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSerialDevice(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def connect(self, baud_rate):
+        pass
+
+
+    @abstractmethod
+    def transmit(self, now):
+        """
+        the bytes transmitted since the previous call
+        """
+        pass
+
+
+    def receive(self, data, port):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "%s:{}" % self.__class__.__name__
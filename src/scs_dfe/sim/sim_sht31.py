@@ -0,0 +1,56 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Command-level model of a Sensirion SHT3x-DIS temperature and humidity sensor.
+"""
+
+from scs_dfe.data.crc8 import CRC8
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSHT31(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    __CMD_READ_SINGLE_HIGH =    0x2c06
+    __CMD_READ_SINGLE_LOW =     0x2c10
+    __CMD_READ_STATUS =         0xf32d
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, temp=21.0, humid=50.0):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__temp = temp                                  # float °C
+        self.__humid = humid                                # float %
+        self.__response = []                                # array of int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        cmd = (chars[0] << 8) | chars[1] if len(chars) > 1 else chars[0]
+
+        if cmd in (self.__CMD_READ_SINGLE_HIGH, self.__CMD_READ_SINGLE_LOW):
+            raw_temp = int(round((self.__temp + 45.0) / 175.0 * 65535.0))
+            raw_humid = int(round(self.__humid / 100.0 * 65535.0))
+
+            self.__response = CRC8.encode([raw_temp >> 8, raw_temp & 0xff, raw_humid >> 8, raw_humid & 0xff])
+
+        elif cmd == self.__CMD_READ_STATUS:
+            self.__response = CRC8.encode([0x80, 0x10])
+
+        else:
+            self.__response = []
+
+
+    def read(self, count):
+        return self._pad(self.__response, count)
@@ -0,0 +1,148 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A deterministic in-process SPI bus, with the interface of scs_host SPI, routing transfers to a device model. Each xfer
+or read_bytes call is a transaction, with a configurable latency and per-byte time.
+"""
+
+import time
+
+from abc import ABC, abstractmethod
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSPI(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def factory(cls, device, latency=0.0, byte_time=0.0):
+        """
+        a factory for Bus.install(spi_factory=..) - every SPI instance shares the device and its counts
+        """
+        spi = None
+
+        def construct(dev_path, mode, max_speed):
+            nonlocal spi
+
+            if spi is None:
+                spi = cls(device, dev_path=dev_path, latency=latency, byte_time=byte_time)
+
+            return spi
+
+        return construct
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, device, dev_path=None, latency=0.0, byte_time=0.0):
+        """
+        Constructor
+        """
+        self.__device = device                              # SimSPIDevice
+        self.__dev_path = dev_path                          # string
+        self.__latency = latency                            # float seconds per transaction
+        self.__byte_time = byte_time                        # float seconds per byte
+
+        self.__transactions = 0                             # int
+        self.__bytes = 0                                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # scs_host SPI interface...
+
+    def open(self):
+        pass
+
+
+    def close(self):
+        pass
+
+
+    def xfer(self, values):
+        self.__transaction(len(values))
+
+        return list(self.__device.xfer(list(values)))
+
+
+    def read_bytes(self, count):
+        self.__transaction(count)
+
+        return list(self.__device.read_bytes(count))
+
+
+    def reset_counts(self):
+        self.__transactions = 0
+        self.__bytes = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __transaction(self, count):
+        self.__transactions += 1
+        self.__bytes += count
+
+        delay = self.__latency + count * self.__byte_time
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def device(self):
+        return self.__device
+
+
+    @property
+    def dev_path(self):
+        return self.__dev_path
+
+
+    @property
+    def transactions(self):
+        return self.__transactions
+
+
+    @property
+    def bytes(self):
+        return self.__bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SimSPI:{device:%s, dev_path:%s, latency:%s, byte_time:%s, transactions:%s, bytes:%s}" % \
+               (self.device, self.dev_path, self.__latency, self.__byte_time, self.transactions, self.bytes)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSPIDevice(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def xfer(self, values):
+        pass
+
+
+    @abstractmethod
+    def read_bytes(self, count):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "%s:{}" % self.__class__.__name__
@@ -0,0 +1,74 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Command-level model of a Sensirion SPS30 particulate sensor: the data-ready flag, measured values, identity strings and
+the auto-cleaning interval, with CRC-8 protected words.
+"""
+
+import struct
+
+from scs_dfe.data.crc8 import CRC8
+from scs_dfe.sim.sim_i2c import SimI2CDevice
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSPS30(SimI2CDevice):
+    """
+    classdocs
+    """
+
+    DEFAULT_VALUES = (1.1, 2.2, 3.3, 4.4, 10.0, 20.0, 30.0, 40.0, 50.0, 0.6)
+
+    __CMD_READ_DATA_READY_FLAG =    0x0202
+    __CMD_READ_MEASURED_VALUES =    0x0300
+    __CMD_AUTO_CLEANING_INTERVAL =  0x8004
+    __CMD_READ_ARTICLE_CODE =       0xd025
+    __CMD_READ_SERIAL_NUMBER =      0xd033
+
+    __IDENTITY_LENGTH =             32
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, addr, values=DEFAULT_VALUES, serial_no='SIM0000000000001'):
+        """
+        Constructor
+        """
+        super().__init__(addr)
+
+        self.__values = tuple(values)                       # tuple of 10 float
+        self.__serial_no = serial_no                        # string
+        self.__cleaning_interval = 604800                   # int seconds
+
+        self.__response = []                                # array of int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, chars):
+        cmd = (chars[0] << 8) | chars[1]
+
+        if cmd == self.__CMD_READ_DATA_READY_FLAG:
+            self.__response = CRC8.encode([0x00, 0x01])
+
+        elif cmd == self.__CMD_READ_MEASURED_VALUES:
+            self.__response = CRC8.encode(struct.pack('>10f', *self.__values))
+
+        elif cmd == self.__CMD_AUTO_CLEANING_INTERVAL:
+            if len(chars) > 2:
+                self.__cleaning_interval = struct.unpack('>L', bytes(CRC8.decode(chars[2:])))[0]
+
+            self.__response = CRC8.encode(struct.pack('>L', self.__cleaning_interval))
+
+        elif cmd in (self.__CMD_READ_ARTICLE_CODE, self.__CMD_READ_SERIAL_NUMBER):
+            identity = self.__serial_no.encode().ljust(self.__IDENTITY_LENGTH, b'\0')
+            self.__response = CRC8.encode(identity)
+
+        else:
+            self.__response = []
+
+
+    def read(self, count):
+        return self._pad(self.__response, count)
@@ -8,8 +8,9 @@ Note: time shall always be stored as UTC, then localized on retrieval.
 
 from scs_core.data.rtc_datetime import RTCDatetime
 
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
+
 from scs_host.bus.i2c import I2C
-from scs_host.lock.lock import Lock
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -174,12 +175,12 @@ class DS1338(object):
 
     @classmethod
     def obtain_lock(cls):
-        Lock.acquire(cls.__lock_name(), DS1338.__LOCK_TIMEOUT)
+        HierarchicalLock.acquire(cls.__lock_name(), DS1338.__LOCK_TIMEOUT)
 
 
     @classmethod
     def release_lock(cls):
-        Lock.release(cls.__lock_name())
+        HierarchicalLock.release(cls.__lock_name())
 
 
     @classmethod
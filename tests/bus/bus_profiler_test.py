@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+profiles a few drivers against the in-process simulator
+"""
+
+import os
+import tempfile
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
+from scs_core.gas.sensor_baseline import SensorBaseline
+
+from scs_dfe.bus.bus import Bus
+from scs_dfe.bus.bus_profile import BusProfile
+from scs_dfe.bus.bus_profiler import BusProfiler
+
+from scs_dfe.climate.sht31 import SHT31
+from scs_dfe.gas.scd30.scd30 import SCD30
+from scs_dfe.particulate.opc_n3.opc_n3 import OPCN3
+
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_opc_n3 import SimOPCN3
+from scs_dfe.sim.sim_pca8574 import SimPCA8574
+from scs_dfe.sim.sim_scd30 import SimSCD30
+from scs_dfe.sim.sim_sht31 import SimSHT31
+from scs_dfe.sim.sim_spi import SimSPI
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sensors = SimI2C(bus=1, latency=0.000100, byte_time=0.000025)
+
+sensors.attach(SimSHT31(0x44))
+sensors.attach(SimSCD30(0x61))
+sensors.attach(SimPCA8574(0x70, byte=0x00))
+
+Bus.install(sensors=sensors, spi_factory=SimSPI.factory(SimOPCN3(corrupt_bursts=1), latency=0.000100,
+                                                         byte_time=0.000025))
+
+filename = os.path.join(tempfile.gettempdir(), 'bus_profile_test.json')
+
+try:
+    profiler = BusProfiler.enable(filename=filename, flush_interval=0.5)
+    print(profiler)
+    print("-")
+
+    sht31 = SHT31(0x44)
+    scd30 = SCD30(SCD30Baseline(SensorBaseline(None, 0)))
+    opc = OPCN3(None, '/dev/spidev0.0', burst=True)
+
+    for _ in range(3):
+        sht31.sample()
+        scd30.sample()
+        opc.sample()
+
+    interim = profiler.report()
+    print("interim ranking: %s" % interim.ranking())
+    print("-")
+
+    report = BusProfiler.disable()
+
+    print("sensors restored: %s" % (Bus.i2c('Sensors') is sensors))
+    print("-")
+
+    print(JSONify.dumps(report, indent=4))
+    print("-")
+
+    for device in report.ranking():
+        total = report.total(device=device)
+        print("%s: duty:%0.4f bus:%0.4f sleep:%0.4f lock-wait:%0.4f retries:%s bytes:%s" %
+              (device, report.duty(device), total.bus_time, total.sleep_time, total.lock_wait, total.retries,
+               total.byte_count))
+
+    print("-")
+
+    saved = BusProfile.load(filename)
+    print("saved devices: %s" % saved.devices)
+
+finally:
+    BusProfiler.disable()
+    Bus.restore()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import random
+import time
+
+from scs_core.data.crc import crc8
+
+from scs_dfe.data.crc8 import CRC8
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def bitwise_crc(data):
+    crc = 0xff
+
+    for datum in data:
+        crc ^= datum
+
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x31 if crc & 0x80 else (crc << 1)) & 0xff
+
+    return crc
+
+
+def bitwise_decode(chars):
+    decoded = []
+
+    for i in range(0, len(chars), 3):
+        group = chars[i:i + 2]
+        decoded.extend(group)
+
+        if chars[i + 2] != bitwise_crc(group):
+            raise ValueError(chars)
+
+    return decoded
+
+
+def timed(func, buffers):
+    start_time = time.time()
+
+    for chars in buffers:
+        func(chars)
+
+    return (time.time() - start_time) * 1e6 / len(buffers)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+# Sensirion datasheet example...
+print("0xbeef: 0x%02x (expected 0x92)" % CRC8.crc([0xbe, 0xef]))
+print("-")
+
+# equivalence...
+words = [(random.randint(0, 255), random.randint(0, 255)) for _ in range(10000)]
+mismatches = [word for word in words if not (CRC8.crc(word) == bitwise_crc(word) == crc8(word))]
+print("mismatches: %d" % len(mismatches))
+
+# SPS30 measurement response: 20 words, 60 bytes...
+payloads = [[random.randint(0, 255) for _ in range(40)] for _ in range(2000)]
+responses = [CRC8.encode(payload) for payload in payloads]
+
+print("round trip: %s" % all(CRC8.decode(response) == payload for response, payload in zip(responses, payloads)))
+
+corrupt = list(responses[0])
+corrupt[5] ^= 0x01
+print("corrupt valid: %s" % CRC8.is_valid(corrupt))
+
+try:
+    CRC8.decode(corrupt)
+except ValueError as ex:
+    print("corrupt decode: %s" % repr(ex))
+
+print("-")
+
+# per-response cost...
+print("bitwise decode: %0.1f us" % timed(bitwise_decode, responses))
+print("table decode: %0.1f us" % timed(CRC8.decode, responses))
+print("table is_valid: %0.1f us" % timed(CRC8.is_valid, responses))
+print("table encode: %0.1f us" % timed(CRC8.encode, payloads))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_dfe.gas.afe.ads1115 import ADS1115
+
+from scs_host.bus.i2c import I2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ADS1115.init()
+
+gain = ADS1115.GAIN_1p024
+rate = ADS1115.RATE_128
+
+sn1 = ADS1115.MUX_A3_GND
+sn4 = ADS1115.MUX_A0_GND
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+try:
+    I2C.Sensors.open()
+
+    wrk = ADS1115(ADS1115.ADDR_WRK, rate)
+    print("wrk: %s sps: %d" % (wrk, wrk.sps))
+    print("-")
+
+    # single channel - one config write...
+    start_time = time.time()
+
+    for timestamp, mux, v in wrk.stream((sn4, ), gain, count=16):
+        print("%0.3f: 0x%04x: %0.6f" % (timestamp - start_time, mux, v))
+
+    print("elapsed: %0.3f" % (time.time() - start_time))
+    print("-")
+
+    # two channels, four conversions per visit...
+    start_time = time.time()
+
+    for timestamp, mux, v in wrk.stream((sn1, sn4), gain, per_channel=4, count=16):
+        print("%0.3f: 0x%04x: %0.6f" % (timestamp - start_time, mux, v))
+
+    print("elapsed: %0.3f" % (time.time() - start_time))
+
+finally:
+    I2C.Sensors.close()
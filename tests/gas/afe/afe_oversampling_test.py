@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+oversamples simulated ADS1115s through the AFE electrochem callbacks, in sequential and pipelined mode: each reading
+must be made of the oversampling count of conversions, streamed without a config write per conversion, whichever mode
+is used
+"""
+
+import time
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.gas.afe.ads1115 import ADS1115
+from scs_dfe.gas.afe.afe import AFE
+from scs_dfe.gas.gas_channel_filter import GasChannelFilter
+
+from scs_dfe.sim.sim_ads1115 import SimADS1115
+from scs_dfe.sim.sim_i2c import SimI2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ADS1115.init()
+
+gain_index = 3                                                          # 2.048 V
+readings = 4
+
+bus = SimI2C()
+bus.attach(SimADS1115(ADS1115.ADDR_WRK, {ADS1115.MUX_A3_GND: 0.310}))
+bus.attach(SimADS1115(ADS1115.ADDR_AUX, {ADS1115.MUX_A3_GND: 0.290}))
+
+Bus.install(sensors=bus)
+
+try:
+    for pipelined in (False, True):
+        counts = {}
+
+        for oversampling in (1, 4):
+            afe = AFE(None, None, [None], pipelined=pipelined, rate=ADS1115.RATE_250, oversampling=oversampling)
+
+            bus.reset_counts()
+            start_time = time.time()
+
+            for _ in range(readings):
+                we_v, ae_v = afe.sample_raw_wrk_aux(0, gain_index)
+                assert round(we_v, 3) == 0.310 and round(ae_v, 3) == 0.290
+
+                assert round(afe.sample_raw_wrk(0, gain_index), 3) == 0.310
+
+            elapsed = (time.time() - start_time) / (readings * 2)
+            transactions = bus.transactions / (readings * 2)
+
+            print("pipelined:%s oversampling:%d: %0.4f s, %0.1f I2C messages per reading" %
+                  (pipelined, oversampling, elapsed, transactions))
+
+            counts[oversampling] = transactions
+
+        assert counts[4] > counts[1]                                    # the conversions are made in either mode
+
+    # one oversampling knob...
+    try:
+        AFE(None, None, [None], oversampling=4, channel_filter=GasChannelFilter(oversampling=4))
+        assert False
+
+    except ValueError as ex:
+        print("oversampling with channel filter: %s" % repr(ex))
+
+finally:
+    Bus.restore()
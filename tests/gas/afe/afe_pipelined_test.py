@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares sequential and pipelined AFE cycle times.
+"""
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.afe.pt1000_calib import Pt1000Calib
+
+from scs_dfe.gas.afe.ads1115 import ADS1115
+from scs_dfe.gas.afe.afe import AFE
+from scs_dfe.gas.afe.pt1000 import Pt1000
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+cycles = 10
+
+try:
+    I2C.Sensors.open()
+
+    interface = InterfaceConf.load(Host).interface()
+    pt1000 = Pt1000(Pt1000Calib.load(Host))
+    sensors = AFECalib.load(Host).sensors(AFEBaseline.load(Host))
+
+    configurations = (
+        ('sequential', {}),
+        ('pipelined', {'pipelined': True}),
+        ('pipelined x4 @ 64 SPS', {'pipelined': True, 'rate': ADS1115.RATE_64, 'oversampling': 4}),
+    )
+
+    for name, kwargs in configurations:
+        afe = AFE(interface, pt1000, sensors, **kwargs)
+
+        for _ in range(cycles):
+            datum = afe.sample()
+
+        print("%s: %s" % (name, JSONify.dumps(datum)))
+        print("%s: %s" % (name, JSONify.dumps(afe.cycle_stats)))
+        print("-")
+
+finally:
+    I2C.Sensors.close()
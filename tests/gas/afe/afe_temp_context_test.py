@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Back-to-back sample_station() calls, with and without a temperature context tolerance.
+"""
+
+import time
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.afe.pt1000_calib import Pt1000Calib
+
+from scs_dfe.gas.afe.afe import AFE
+from scs_dfe.gas.afe.pt1000 import Pt1000
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+try:
+    I2C.Sensors.open()
+
+    interface = InterfaceConf.load(Host).interface()
+    pt1000 = Pt1000(Pt1000Calib.load(Host))
+    sensors = AFECalib.load(Host).sensors(AFEBaseline.load(Host))
+
+    for temp_tolerance in (0.0, 10.0):
+        afe = AFE(interface, pt1000, sensors, temp_tolerance=temp_tolerance)
+
+        start_time = time.time()
+
+        for sn in range(1, len(sensors) + 1):
+            print("SN%d: %s" % (sn, afe.sample_station(sn)))
+
+        print("temp_tolerance: %0.1f elapsed: %0.3f" % (temp_tolerance, time.time() - start_time))
+        print("temp_context: %s" % afe.temp_context)
+        print("-")
+
+finally:
+    I2C.Sensors.close()
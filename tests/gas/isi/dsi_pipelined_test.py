@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+compares start / wait / read sampling with pipelined convert_and_read() against the in-process simulator: bus time
+and I2C messages per reading - one lock acquisition and three I2C messages per reading, rather than two and four
+"""
+
+import time
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.gas.isi.elc_dsi_t1 import ElcDSIt1
+
+from scs_dfe.sim.sim_dsi import SimDSI
+from scs_dfe.sim.sim_i2c import SimI2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+readings = 10
+interval = 0.2
+
+bus = SimI2C()
+sim = bus.attach(SimDSI(ElcDSIt1.DEFAULT_ADDR, v_wrk=0.310, v_aux=0.300))
+
+Bus.install(sensors=bus)
+
+try:
+    dsi = ElcDSIt1(ElcDSIt1.DEFAULT_ADDR)
+    print(dsi)
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # start / wait / read...
+
+    transactions = bus.transactions
+    busy = 0.0
+
+    for _ in range(readings):
+        start_time = time.time()
+
+        dsi.start_conversion()
+        time.sleep(dsi.CONVERSION_TIME)
+        v_wrk, v_aux = dsi.read_conversion_voltage()
+
+        elapsed = time.time() - start_time
+        busy += elapsed
+
+        time.sleep(max(interval - elapsed, 0))
+
+    sequential = busy / readings
+    sequential_tx = (bus.transactions - transactions) / readings
+
+    print("start / wait / read: %0.3f s, I2C messages: %0.1f per reading" % (sequential, sequential_tx))
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # pipelined...
+
+    voltage, age = dsi.convert_and_read()
+    assert voltage is None and age is None and dsi.conversion_pending
+
+    time.sleep(interval)
+
+    transactions = bus.transactions
+    conversions = sim.conversions
+    busy = 0.0
+    ages = []
+
+    for _ in range(readings):
+        start_time = time.time()
+
+        (v_wrk, v_aux), age = dsi.convert_and_read()
+
+        elapsed = time.time() - start_time
+        busy += elapsed
+        ages.append(age)
+
+        assert (v_wrk, v_aux) == (0.310, 0.300)
+
+        time.sleep(max(interval - elapsed, 0))
+
+    pipelined = busy / readings
+    pipelined_tx = (bus.transactions - transactions) / readings
+
+    print("pipelined: %0.3f s, I2C messages: %0.1f per reading" % (pipelined, pipelined_tx))
+    print("ages: %s" % ages)
+
+    assert sim.conversions - conversions == readings
+    assert pipelined_tx < sequential_tx
+    assert pipelined < sequential - dsi.CONVERSION_TIME * 0.9
+    assert all(0 <= age < interval for age in ages)
+
+finally:
+    Bus.restore()
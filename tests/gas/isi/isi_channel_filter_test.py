@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+samples a noisy, spiking DSI through ISI, with and without a GasChannelFilter: deviation of the raw working electrode
+voltage from its true value, and time per reading
+"""
+
+import statistics
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.climate.sht31 import SHT31
+
+from scs_dfe.gas.gas_channel_filter import GasChannelFilter
+from scs_dfe.gas.isi.elc_dsi_t1_f16k import ElcDSIt1f16K
+from scs_dfe.gas.isi.isi import ISI
+
+from scs_dfe.sim.sim_dsi import SimDSI
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_sht31 import SimSHT31
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def deviations(isi, readings):
+    errors = []
+    start_time = time.time()
+
+    for _ in range(readings):
+        we_v, _ = isi.sample_raw_wrk_aux(0, None)
+        errors.append(we_v - v_wrk)
+
+    elapsed = (time.time() - start_time) / readings
+
+    return statistics.pstdev(errors), max(abs(error) for error in errors), elapsed
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# the filter...
+
+channel_filter = GasChannelFilter(mode=GasChannelFilter.MODE_BOXCAR, length=3)
+
+assert [channel_filter.apply(0, [v]) for v in (1.0, 2.0, 3.0, 4.0)] == [1.0, 1.5, 2.0, 3.0]
+assert channel_filter.apply(1, [(1.0, 2.0), (3.0, 4.0)]) == (2.0, 3.0)
+
+channel_filter = GasChannelFilter(median=3)
+
+assert [channel_filter.apply(0, [v]) for v in (1.0, 9.0, 1.0, 1.0)] == [1.0, 5.0, 1.0, 1.0]
+
+channel_filter = GasChannelFilter(oversampling=2, mode=GasChannelFilter.MODE_BOXCAR, length=3)
+
+assert channel_filter.oversample([(1.0, 2.0), (3.0, 4.0)]) == (2.0, 3.0)
+assert str(channel_filter).endswith("sensors:[]}")                  # oversample() leaves the state unchanged
+
+channel_filter.reset()
+print(channel_filter)
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# ISI...
+
+readings = 20
+v_wrk = 0.310
+
+def afe_calib(*sensor_calibs):
+    jdict = {"serial_number": "00-000000", "type": "ISI", "calibrated_on": "2026-10-18", "dispatched_on": None,
+             "pt1000_v20": 1.0}
+
+    for i in range(len(sensor_calibs)):
+        jdict["sn%d" % (i + 1)] = sensor_calibs[i]
+
+    return AFECalib.construct_from_jdict(jdict)
+
+
+no2_calib = {"serial_number": "212000001", "sensor_type": "NO2A43F", "we_electronic_zero_mv": 300,
+             "we_sensor_zero_mv": 0, "we_total_zero_mv": 300, "ae_electronic_zero_mv": 300, "ae_sensor_zero_mv": 0,
+             "ae_total_zero_mv": 300, "we_sensitivity_na_ppb": 0.3, "we_cross_sensitivity_no2_na_ppb": "n/a",
+             "pcb_gain": -0.7, "we_sensitivity_mv_ppb": 0.2, "we_cross_sensitivity_no2_mv_ppb": "n/a"}
+
+ox_calib = {"serial_number": "214000001", "sensor_type": "OXA431", "we_electronic_zero_mv": 300,
+            "we_sensor_zero_mv": 0, "we_total_zero_mv": 300, "ae_electronic_zero_mv": 300, "ae_sensor_zero_mv": 0,
+            "ae_total_zero_mv": 300, "we_sensitivity_na_ppb": -0.4, "we_cross_sensitivity_no2_na_ppb": -0.3,
+            "pcb_gain": -0.7, "we_sensitivity_mv_ppb": 0.28, "we_cross_sensitivity_no2_mv_ppb": 0.21}
+
+gas_sensors = afe_calib(no2_calib).sensors(AFEBaseline.null_datum())
+
+bus = SimI2C()
+bus.attach(SimSHT31(0x44, temp=22.5, humid=45.0))
+bus.attach(SimDSI(ElcDSIt1f16K.DEFAULT_ADDR, v_wrk=v_wrk, v_aux=0.300, noise=0.004, spike_every=7, spike=0.100,
+                  seed=1))
+
+Bus.install(sensors=bus)
+
+try:
+    sht_datum = SHT31(0x44).sample()
+
+    configurations = (
+        ('unfiltered', None),
+        ('x2, median of 3, exponential 0.5', GasChannelFilter(oversampling=2, median=3,
+                                                              mode=GasChannelFilter.MODE_EXPONENTIAL, alpha=0.5)),
+    )
+
+    results = {}
+
+    for name, channel_filter in configurations:
+        isi = ISI(gas_sensors, channel_filter=channel_filter)
+
+        results[name] = deviations(isi, readings)
+        print("%s: stdev: %0.4f V, max: %0.4f V, %0.3f s per reading" % (name, *results[name]))
+
+        print("%s: %s" % (name, JSONify.dumps(isi.sample(sht_datum))))
+        print(isi.channel_filter)
+        print("-")
+
+    unfiltered, filtered = results.values()
+
+    assert filtered[0] < unfiltered[0] / 2
+    assert filtered[1] < unfiltered[1] / 2
+
+    # the NO2 cross-sensitivity reading for an Ox station does not advance the NO2 filter...
+    bus.attach(SimDSI(ElcDSIt1f16K.DEFAULT_ADDR + 1, v_wrk=0.320, v_aux=0.300))
+
+    ox_gas_sensors = afe_calib(no2_calib, ox_calib).sensors(AFEBaseline.null_datum())
+
+    channel_filter = GasChannelFilter(mode=GasChannelFilter.MODE_BOXCAR, length=3)
+    isi = ISI(ox_gas_sensors, channel_filter=channel_filter)
+
+    for _ in range(3):
+        print("Ox station: %s" % JSONify.dumps(isi.sample_station(2, sht_datum)))
+
+    print(channel_filter)
+
+    assert str(channel_filter).endswith("sensors:[1]}")
+
+finally:
+    Bus.restore()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+samples a three-gas ISI against the in-process simulator - one DSI per sensor, with concurrent conversions
+"""
+
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.climate.sht31 import SHT31
+
+from scs_dfe.gas.isi.elc_dsi_t1_f16k import ElcDSIt1f16K
+from scs_dfe.gas.isi.isi import ISI
+
+from scs_dfe.sim.sim_dsi import SimDSI
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_sht31 import SimSHT31
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def sensor_calib(serial_number, sensor_type, no2_x_sens="n/a"):
+    return {"serial_number": serial_number, "sensor_type": sensor_type, "we_electronic_zero_mv": 300,
+            "we_sensor_zero_mv": 0, "we_total_zero_mv": 300, "ae_electronic_zero_mv": 300, "ae_sensor_zero_mv": 0,
+            "ae_total_zero_mv": 300, "we_sensitivity_na_ppb": 0.3, "we_cross_sensitivity_no2_na_ppb": no2_x_sens,
+            "pcb_gain": -0.7, "we_sensitivity_mv_ppb": 0.2, "we_cross_sensitivity_no2_mv_ppb": no2_x_sens}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+calib = AFECalib.construct_from_jdict({"serial_number": "00-000000", "type": "ISI", "calibrated_on": "2026-10-18",
+                                       "dispatched_on": None, "pt1000_v20": 1.0,
+                                       "sn1": sensor_calib("212000001", "NO2A43F"),
+                                       "sn2": sensor_calib("214000001", "OXA431", no2_x_sens=-0.3),
+                                       "sn3": sensor_calib("132000001", "CO A4")})
+
+gas_sensors = calib.sensors(AFEBaseline.null_datum())
+
+bus = SimI2C()
+bus.attach(SimSHT31(0x44, temp=22.5, humid=45.0))
+
+dsis = [bus.attach(SimDSI(ElcDSIt1f16K.DEFAULT_ADDR + index, v_wrk=0.310 + index * 0.01, v_aux=0.300))
+        for index in range(len(gas_sensors))]
+
+Bus.install(sensors=bus)
+
+try:
+    sht_datum = SHT31(0x44).sample()
+
+    isi = ISI(gas_sensors)
+    print(isi)
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # one conversion per sensor...
+
+    start_time = time.time()
+
+    for sensor_index in range(len(gas_sensors)):
+        isi.sample_raw_wrk_aux(sensor_index, None)
+
+    sequential = time.time() - start_time
+    print("sequential conversions: %0.3f s" % sequential)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # concurrent...
+
+    conversions = [dsi.conversions for dsi in dsis]
+    start_time = time.time()
+
+    datum = isi.sample(sht_datum)
+
+    concurrent = time.time() - start_time
+    print("concurrent cycle: %0.3f s" % concurrent)
+    print(JSONify.dumps(datum))
+
+    assert [dsi.conversions - count for dsi, count in zip(dsis, conversions)] == [1, 1, 1]
+    assert concurrent < sequential - ElcDSIt1f16K.CONVERSION_TIME * (len(dsis) - 1) * 0.9
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # station...
+
+    start_time = time.time()
+    datum = isi.sample_station(2, sht_datum)                    # Ox, with the NO2 cross-sensitivity
+
+    print("station 2: %0.3f s: %s" % (time.time() - start_time, JSONify.dumps(datum)))
+
+finally:
+    Bus.restore()
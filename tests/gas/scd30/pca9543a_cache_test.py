@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+counts PCA9543A selector writes against the in-process simulator: repeated SCD30 operations, with and without
+batching, and a hand-over to the other channel
+"""
+
+from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
+from scs_core.gas.sensor_baseline import SensorBaseline
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.gas.scd30.pca9543a import PCA9543A
+from scs_dfe.gas.scd30.scd30 import SCD30
+
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_pca8574 import SimPCA8574
+from scs_dfe.sim.sim_scd30 import SimSCD30
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def dump(scd30):
+    return scd30.get_serial_no(), scd30.get_firmware_version(), scd30.get_measurement_interval(), \
+           scd30.get_temperature_offset(), scd30.get_altitude(), scd30.get_auto_self_calib()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sensors = SimI2C()
+sensors.attach(SimSCD30(0x61))
+switch = sensors.attach(SimPCA8574(0x70, byte=0x00))
+
+Bus.install(sensors=sensors)
+
+try:
+    selector = PCA9543A()
+    selector.invalidate()                                           # the shadow may outlive a previous run
+    print(selector)
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # selector...
+
+    writes = switch.writes
+
+    for _ in range(10):
+        selector.enable(True, False)
+
+    print("repeated enable: writes: %d" % (switch.writes - writes))
+    assert switch.writes - writes == 1
+
+    writes = switch.writes
+
+    with selector.channel(False, True):
+        with selector.channel(False, True):
+            print("channel: state: 0x%02x" % selector.state)
+
+    print("nested channel: writes: %d state: 0x%02x" % (switch.writes - writes, selector.state))
+    assert switch.writes - writes == 2 and selector.state == 0x01
+
+    other = PCA9543A()
+    print("shared: state: 0x%02x" % other.state)
+    assert other.state == selector.state
+
+    selector.reset()
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # SCD30...
+
+    scd30 = SCD30(SCD30Baseline(SensorBaseline(None, 0)))
+
+    writes = switch.writes
+    print(dump(scd30))
+    print("configuration dump: writes: %d" % (switch.writes - writes))
+    assert switch.writes - writes == 1                              # selected once, released lazily
+
+    writes = switch.writes
+    print(dump(scd30))
+    print("repeated configuration dump: writes: %d" % (switch.writes - writes))
+    assert switch.writes - writes == 0
+
+    writes = switch.writes
+
+    with scd30.transaction():
+        print(dump(scd30))
+
+    print("batched configuration dump: writes: %d" % (switch.writes - writes))
+    assert switch.writes - writes == 0
+
+    # another channel takes over the selector...
+    selector.enable(False, True)
+
+    writes = switch.writes
+    print(dump(scd30))
+    print("after hand-over: writes: %d state: 0x%02x" % (switch.writes - writes, selector.state))
+    assert switch.writes - writes == 1 and selector.state == 0x01
+
+    print("-")
+    print(selector)
+
+finally:
+    Bus.restore()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+streams SCD30 readings from the in-process simulator, reporting data-ready polls and bus transactions per reading
+"""
+
+import time
+
+from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
+from scs_core.gas.sensor_baseline import SensorBaseline
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.gas.scd30.scd30 import SCD30
+
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_pca8574 import SimPCA8574
+from scs_dfe.sim.sim_scd30 import SimSCD30
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+readings = 4
+
+sensors = SimI2C()
+device = sensors.attach(SimSCD30(0x61, interval=2))
+switch = sensors.attach(SimPCA8574(0x70, byte=0x00))                # PCA9543A switch
+
+Bus.install(sensors=sensors)
+
+try:
+    scd30 = SCD30(SCD30Baseline(SensorBaseline(None, 0)))
+
+    scd30.set_measurement_interval(2)
+    print("interval: %s" % scd30.get_measurement_interval())
+    print("-")
+
+    sensors.reset_counts()
+    polls = device.ready_polls
+    writes = switch.writes
+    start_time = time.time()
+
+    for datum in scd30.stream(count=readings):
+        print("%0.3f: %s" % (time.time() - start_time, datum))
+
+    print("-")
+    print("polls per reading: %0.1f" % ((device.ready_polls - polls) / readings))
+    print("transactions per reading: %0.1f" % (sensors.transactions / readings))
+    print("selector writes: %d" % (switch.writes - writes))
+
+    assert switch.writes - writes == 0                              # the channel stays selected between polls
+
+finally:
+    Bus.restore()
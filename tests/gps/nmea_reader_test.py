@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+compares GGA report latency against the simulated receiver: a blocking flush-and-read, as previously, and a lookup
+against the NMEAReader's latest complete epoch
+"""
+
+import time
+
+from scs_core.position.nmea.gpgga import GPGGA
+from scs_core.position.nmea.gpgll import GPGLL
+from scs_core.position.nmea.gpgsv import GPGSV
+from scs_core.position.nmea.nmea_report import NMEAReport
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.gps.nmea_parser import NMEAParser
+from scs_dfe.gps.pam_7q import PAM7Q
+from scs_dfe.gps.sam_m8q import SAMM8Q
+
+from scs_dfe.sim.sim_nmea_receiver import SimNMEAReceiver
+from scs_dfe.sim.sim_serial import SimSerial
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def blocking_report(serial, message_class):
+    serial.flush_input()
+
+    while True:
+        try:
+            sentence = NMEAReport.construct(serial.read_line(eol="\r\n", timeout=5.0))
+
+        except (IndexError, UnicodeDecodeError, ValueError):
+            continue
+
+        if sentence.message_id in message_class.MESSAGE_IDS:
+            return message_class.construct(sentence)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ticks = 5
+receiver = SimNMEAReceiver(interval=1.0)
+
+Bus.install(serial_factory=SimSerial.factory(receiver))
+
+try:
+    gps = SAMM8Q(None, "/dev/sim-gps")
+    gps.open()
+    print(gps)
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # blocking...
+
+    latencies = []
+
+    for _ in range(ticks):
+        time.sleep(0.3)
+
+        start_time = time.time()
+        gga = blocking_report(gps._serial, GPGGA)
+        latencies.append(time.time() - start_time)
+
+    print("blocking: mean latency: %0.3f s, max: %0.3f s" % (sum(latencies) / ticks, max(latencies)))
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # reader...
+
+    start_time = time.time()
+    gga = gps.report(GPGGA)
+    print("reader: first report: %0.3f s: %s" % (time.time() - start_time, gga))
+    assert gga is not None
+
+    latencies = []
+
+    for _ in range(ticks):
+        time.sleep(0.3)
+
+        start_time = time.time()
+        gga = gps.report(GPGGA)
+        latencies.append(time.time() - start_time)
+
+        assert gga is not None and gga.quality == 2
+
+    print("reader: mean latency: %0.6f s, max: %0.6f s" % (sum(latencies) / ticks, max(latencies)))
+    assert max(latencies) < 0.01
+
+    reports = gps.report_all()
+    print("report all: %s" % [report.message_id if report else None for report in reports])
+    assert None not in reports and gps.report(GPGLL) is not None
+
+    print("GSV: %d" % len(gps._reader.reports(GPGSV)))
+    print(gps._reader)
+    print("-")
+
+    gps.close()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # PAM7Q - every report in one epoch...
+
+    gps = PAM7Q(None, "/dev/sim-gps")
+    gps.open()
+
+    time.sleep(0.3)
+    ggas = [gps.report(GPGGA) for _ in range(20)]
+
+    reports = gps.report_all()
+    print("PAM7Q report all: %s" % [report.message_id for report in reports])
+
+    assert None not in ggas
+    assert any(report.message_id.endswith('GLL') for report in reports)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # corrupted sentences...
+
+    parser = NMEAParser()
+    parser.feed(SimNMEAReceiver(corrupt_every=7).burst(0))
+
+    print(parser)
+    assert parser.errors == 1                                       # the GLL is rejected
+
+finally:
+    gps.close()
+    Bus.restore()
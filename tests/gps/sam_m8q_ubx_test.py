@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+compares the simulated SAM M8Q's default NMEA output with UBX NAV-PVT output at 5 Hz: fix rate, serial bandwidth and
+parsing time per fix
+"""
+
+import time
+
+from scs_core.position.gps_datum import GPSDatum
+from scs_core.position.nmea.gpgga import GPGGA
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.gps.nmea_parser import NMEAParser
+from scs_dfe.gps.sam_m8q import SAMM8Q
+from scs_dfe.gps.ubx_message import UBXMessage
+from scs_dfe.gps.ubx_nav_pvt import UBXNavPVT
+from scs_dfe.gps.ubx_parser import UBXParser
+
+from scs_dfe.sim.sim_sam_m8q import SimSAMM8Q
+from scs_dfe.sim.sim_serial import SimSerial
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def fixes(gps, duration):
+    times = set()
+    bytes_read = gps._serial.bytes_read
+    end_time = time.time() + duration
+
+    while time.time() < end_time:
+        gga = gps.report(GPGGA)
+
+        if gga is not None:
+            times.add(gga.time.time)
+
+        time.sleep(0.02)
+
+    return len(times) / duration, (gps._serial.bytes_read - bytes_read) / duration
+
+
+def pvt_latency(gps, count=10):
+    """
+    mean seconds from each NAV-PVT epoch to its report - the simulated iTOW is taken from the system clock
+    """
+    latencies = []
+    itow = None
+
+    while len(latencies) < count:
+        pvt = gps.report(UBXNavPVT)
+
+        if pvt is not None and pvt.itow != itow:
+            if itow is not None:
+                latencies.append((int(time.time() * 1000) % 604800000 - pvt.itow) / 1000)
+
+            itow = pvt.itow
+
+        time.sleep(0.002)
+
+    return sum(latencies) / len(latencies)
+
+
+def parse_time(parser, output, repeats=500):
+    start_time = time.process_time()
+
+    for _ in range(repeats):
+        parser.feed(output)
+
+    return (time.process_time() - start_time) / repeats
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+duration = 3.0
+receiver = SimSAMM8Q()
+
+Bus.install(serial_factory=SimSerial.factory(receiver))
+
+try:
+    # ----------------------------------------------------------------------------------------------------------------
+    # NMEA...
+
+    gps = SAMM8Q(None, "/dev/sim-gps")
+    gps.open()
+    print(gps)
+
+    nmea_rate, nmea_bandwidth = fixes(gps, duration)
+    print("NMEA: fixes: %0.1f /s, serial: %d bytes/s" % (nmea_rate, nmea_bandwidth))
+
+    gps.close()
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # UBX...
+
+    gps = SAMM8Q(None, "/dev/sim-gps", nav_rate=5)
+    gps.open()
+    print(gps)
+    print(receiver)
+
+    pvt = gps.report(UBXNavPVT)
+    print(pvt)
+    assert pvt is not None and pvt.has_fix()
+
+    datum = GPSDatum.construct_from_gga(gps.report(GPGGA))
+    print(datum)
+    assert datum.quality == GPGGA.QUALITY_AUTONOMOUS_GNSS and round(datum.pos.lat, 5) == 50.82336
+
+    ubx_rate, ubx_bandwidth = fixes(gps, duration)
+    print("UBX: fixes: %0.1f /s, serial: %d bytes/s" % (ubx_rate, ubx_bandwidth))
+    assert ubx_rate > nmea_rate * 3
+
+    latency = pvt_latency(gps)
+    print("UBX: NAV-PVT latency: %0.3f s" % latency)
+    assert latency < 0.1                                    # the frame is not held until the next one arrives
+
+    gps.close()
+    print("reverted: %s" % receiver)
+    assert not receiver.nav_pvt
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # parsing...
+
+    nmea_output = receiver._output(0.0)
+    ubx_output = UBXMessage(UBXNavPVT.MSG_CLASS, UBXNavPVT.MSG_ID, UBXNavPVT.payload(
+        0, (2026, 10, 18, 11, 0, 0, 0), UBXNavPVT.FIX_3D, 0x03, 9, 50.8233592, -0.1230755, 69.6, 24.2)).frame()
+
+    nmea_time = parse_time(NMEAParser(), nmea_output)
+    ubx_time = parse_time(UBXParser(), ubx_output)
+
+    print("parse per fix: NMEA: %d bytes %0.1f us, UBX: %d bytes %0.1f us" %
+          (len(nmea_output), nmea_time * 1e6, len(ubx_output), ubx_time * 1e6))
+
+finally:
+    Bus.restore()
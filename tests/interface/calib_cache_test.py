@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+loads the AFE calibration and baseline through CalibCache, from a scratch directory: uncached and cached load times,
+and invalidation when the baseline is saved
+"""
+
+import tempfile
+import time
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.sensor_baseline import SensorBaseline
+
+from scs_core.sys.persistence_manager import FilesystemPersistenceManager
+
+from scs_dfe.interface.calib_cache import CalibCache
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ScratchManager(FilesystemPersistenceManager):
+    """
+    a filesystem persistence manager rooted in a temporary directory
+    """
+
+    root = None
+
+    @classmethod
+    def scs_path(cls):
+        return cls.root
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def sensor_calib(serial_number, sensor_type):
+    return {"serial_number": serial_number, "sensor_type": sensor_type, "we_electronic_zero_mv": 300,
+            "we_sensor_zero_mv": 0, "we_total_zero_mv": 300, "ae_electronic_zero_mv": 300, "ae_sensor_zero_mv": 0,
+            "ae_total_zero_mv": 300, "we_sensitivity_na_ppb": 0.3, "we_cross_sensitivity_no2_na_ppb": "n/a",
+            "pcb_gain": -0.7, "we_sensitivity_mv_ppb": 0.2, "we_cross_sensitivity_no2_mv_ppb": "n/a"}
+
+
+def timed(func, repeats=100):
+    start_time = time.perf_counter()
+
+    for _ in range(repeats):
+        result = func()
+
+    return result, (time.perf_counter() - start_time) / repeats
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+with tempfile.TemporaryDirectory() as root:
+    ScratchManager.root = root
+    manager = ScratchManager()
+
+    assert CalibCache.gas_sensors(manager) == []                # no calibration yet
+
+    AFECalib.construct_from_jdict({"serial_number": "00-000000", "type": "ISI", "calibrated_on": "2026-10-18",
+                                   "dispatched_on": None, "pt1000_v20": 1.0,
+                                   "sn1": sensor_calib("212000001", "NO2A43F"),
+                                   "sn2": sensor_calib("132000001", "CO A4")}).save(manager)
+
+    AFEBaseline.null_datum().save(manager)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # uncached vs cached...
+
+    def uncached():
+        return AFECalib.load(manager).sensors(AFEBaseline.load(manager, skeleton=True))
+
+    _, uncached_time = timed(uncached)
+
+    sensors = CalibCache.gas_sensors(manager)
+    print([sensor.gas_name for sensor in sensors])
+
+    cached_sensors, cached_time = timed(lambda: CalibCache.gas_sensors(manager))
+
+    print("uncached: %0.1f us, cached: %0.1f us, hits: %d, misses: %d" %
+          (uncached_time * 1e6, cached_time * 1e6, CalibCache.hits(), CalibCache.misses()))
+
+    assert [sensor.gas_name for sensor in cached_sensors[:2]] == ['NO2', 'CO']
+    assert cached_time < uncached_time
+    assert CalibCache.misses() == 3                              # the missing calib, then the calib and baseline
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # hot reload...
+
+    afe_baseline = AFEBaseline.null_datum()
+    afe_baseline.set_sensor_baseline(0, SensorBaseline(LocalizedDatetime.now(), 12))
+    afe_baseline.save(manager)
+
+    sensors = CalibCache.gas_sensors(manager)
+    print("reloaded: %s" % sensors[0].baseline)
+
+    assert CalibCache.misses() == 4
+    assert sensors[0].baseline.offset == 12
+
+    CalibCache.clear()
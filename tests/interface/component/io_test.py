@@ -6,10 +6,8 @@ Created on 6 Feb 2017
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import os
-
 from scs_dfe.interface.component.io import IO
-from scs_dfe.interface.component.pca8574 import PCA8574State
+from scs_dfe.interface.component.pca8574 import PCA8574
 
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
@@ -17,7 +15,7 @@ from scs_host.sys.host import Host
 
 # --------------------------------------------------------------------------------------------------------------------
 
-filename = os.path.join(Host.lock_dir(), "dfe_io.json")
+device = PCA8574(IO.ADDR, Host.lock_dir(), IO.filename(Host))
 
 I2C.Sensors.open()
 
@@ -25,7 +23,7 @@ try:
     io = IO(None)
     print(io)
 
-    state = PCA8574State.load(filename)
+    state = device.state
     print(state)
 
     print("led RED was:%s" % io.led_red)
@@ -37,7 +35,7 @@ try:
     print("led RED is:%s" % io.led_red)
     print("led GREEN is:%s" % io.led_green)
 
-    state = PCA8574State.load(filename)
+    state = device.state
     print(state)
 
 finally:
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+animates the IO LEDs against the in-process simulator, with the shared-memory shadow and with the JSON snapshot
+"""
+
+import os
+import time
+
+from scs_core.led.led import LED
+
+from scs_dfe.bus.bus import Bus
+from scs_dfe.bus.register_shadow import RegisterShadow
+
+from scs_dfe.interface.component.io import IO
+from scs_dfe.interface.component.pca8574 import PCA8574, PCA8574State
+
+from scs_dfe.led.io_led import IOLED
+
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_pca8574 import SimPCA8574
+
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+frames = 200
+colours = sorted(LED.STATES.keys())
+
+filename = IO.filename(Host)
+
+sensors = SimI2C()
+expander = sensors.attach(SimPCA8574(IO.ADDR, byte=0xff))
+
+Bus.install(sensors=sensors)
+
+try:
+    if os.path.exists(filename):
+        os.remove(filename)
+
+    device = PCA8574(IO.ADDR, Host.lock_dir(), filename)
+    device.state = 0xff
+    print(device)
+    print(device.state)
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # shadow...
+
+    led = IOLED()
+    writes = expander.writes
+    start_time = time.time()
+
+    for i in range(frames):
+        led.colour = colours[i % len(colours)]
+        assert led.colour == colours[i % len(colours)]
+
+    elapsed = time.time() - start_time
+
+    print("shadow: %0.3f ms per frame, writes per frame: %0.1f, snapshot: %s" %
+          (elapsed * 1000 / frames, (expander.writes - writes) / frames, os.path.exists(filename)))
+    assert not os.path.exists(filename)
+
+    assert PCA8574(IO.ADDR, Host.lock_dir(), filename).byte == expander.byte            # shared by every instance
+
+    io = IO(True)
+    io.gps_power = True
+
+    print("power: snapshot: %s" % os.path.exists(filename))
+    assert PCA8574State.load(filename).byte == expander.byte                            # power states are saved
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # snapshot...
+
+    device = PCA8574(IO.ADDR, Host.lock_dir(), filename, snapshot=True)
+    start_time = time.time()
+
+    for i in range(frames):
+        device.modify(0xc0, i << 6)
+
+    elapsed = time.time() - start_time
+
+    print("snapshot: %0.3f ms per frame, snapshot: %s" % (elapsed * 1000 / frames, os.path.exists(filename)))
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # recovery...
+
+    device.save()
+    RegisterShadow.construct("PCA8574-0x%02x" % IO.ADDR).invalidate()          # as following a reboot
+
+    recovered = PCA8574(IO.ADDR, Host.lock_dir(), filename)
+    print("recovered: %s" % recovered.state)
+    assert recovered.byte == expander.byte
+
+finally:
+    Bus.restore()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+measures the import time of the hardware conf modules with python -X importtime, each in a fresh interpreter, and
+checks that importing a conf - or resolving one model - does not import the drivers of any other model
+"""
+
+import subprocess
+import sys
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def run(statements):
+    """
+    the cumulative import time in microseconds of the first statement, and the scs_dfe modules loaded by all of them
+    """
+    script = "; ".join(statements + ["import sys",
+                                     "print(' '.join(sorted(m for m in sys.modules if m.startswith('scs_dfe.'))))"])
+
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', script], capture_output=True, text=True,
+                             check=True)
+
+    module = statements[0].split()[-1]
+    times = [line for line in process.stderr.splitlines() if line.endswith('| ' + module)]
+
+    cumulative = int(times[-1].split('|')[1]) if times else 0
+
+    return cumulative, set(process.stdout.split())
+
+
+def drivers(modules):
+    names = (module.split('.') for module in modules)
+
+    return sorted('.'.join(name) for name in names
+                  if len(name) > 2 and name[1] in ('gas', 'particulate', 'gps', 'climate') and
+                  not name[-1].endswith('_conf'))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+confs = (
+    'scs_dfe.interface.interface_conf',
+    'scs_dfe.particulate.opc_conf',
+    'scs_dfe.gps.gps_conf',
+    'scs_dfe.climate.pressure_conf'
+)
+
+for conf in confs:
+    cumulative, modules = run(["import " + conf])
+    print("%s: %0.1f ms, drivers: %s" % (conf, cumulative / 1000.0, drivers(modules)))
+
+    assert not drivers(modules)
+
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# resolving one model...
+
+cumulative, modules = run(["import scs_dfe.particulate.opc_conf",
+                           "from scs_dfe.particulate.opc_conf import OPCConf",
+                           "OPCConf.opcs().resolve('S30')"])
+
+print("OPCConf S30: %s" % drivers(modules))
+assert 'scs_dfe.particulate.sps_30.sps_30' in modules and 'scs_dfe.particulate.opc_n3.opc_n3' not in modules
+
+cumulative, modules = run(["import scs_dfe.interface.interface_conf",
+                           "from scs_dfe.interface.interface_conf import InterfaceConf",
+                           "InterfaceConf.classes().resolve('PZHB')",
+                           "InterfaceConf.classes().resolve('PZHBMCUt2f1')"])
+
+print("InterfaceConf PZHBt2: %s" % drivers(modules))
+assert not drivers(modules)
+assert 'scs_dfe.interface.pzhb.pzhb_mcu_t2_f1' in modules and 'scs_dfe.interface.pzhb.pzhb_mcu_t1_f1' not in modules
+assert 'scs_dfe.interface.dfe.dfe' not in modules
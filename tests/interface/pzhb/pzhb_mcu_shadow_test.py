@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+counts PZHB MCU commands against the in-process simulator, with redundant commands suppressed and LED bursts batched,
+and the first command of each instance sent whatever the shadow
+"""
+
+import time
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.interface.pzhb.pzhb import PZHB
+from scs_dfe.interface.pzhb.pzhb_mcu_t2_f1 import PZHBMCUt2f1
+
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_mcu import SimMCU
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sensors = SimI2C()
+device = sensors.attach(SimMCU(PZHBMCUt2f1.DEFAULT_ADDR))
+
+Bus.install(sensors=sensors)
+
+try:
+    mcu = PZHBMCUt2f1(PZHBMCUt2f1.DEFAULT_ADDR)
+    mcu.invalidate()                                                # the shadow may outlive a previous run
+
+    interface = PZHB(mcu)
+    print(interface)
+    print("power states: %s" % interface.power_states())
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # power...
+
+    commands = device.commands
+    start_time = time.time()
+
+    mcu.power_all(True)
+
+    for _ in range(10):
+        interface.power_opc(True)
+
+    elapsed = time.time() - start_time
+
+    print("power: commands: %d elapsed: %0.3f" % (device.commands - commands, elapsed))
+    assert device.commands - commands == 5
+
+    print("power states: %s" % interface.power_states())
+    assert all(interface.power_states().values()) and device.state('po') == 1
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # LED...
+
+    led = interface.led()
+    commands = device.commands
+
+    for colour in ('R', 'A', 'G', '0', '0', '0'):
+        led.colour = colour
+
+    print("LED: commands: %d" % (device.commands - commands))
+    assert device.commands - commands == 4
+
+    with mcu.batch():
+        mcu.led1(True)
+        mcu.led1(False)                                             # no net change
+
+    assert device.commands - commands == 4
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # shared...
+
+    other = PZHBMCUt2f1(PZHBMCUt2f1.DEFAULT_ADDR)
+    print("shared: %s" % other.power_states())
+    assert other.power_states() == interface.power_states()
+
+    other.power_opc(False)
+    assert not interface.power_states()['opc'] and device.state('po') == 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # revalidation...
+
+    commands = device.commands
+
+    fresh = PZHBMCUt2f1(PZHBMCUt2f1.DEFAULT_ADDR)
+    fresh.power_opc(False)                                          # the first command is sent, whatever the shadow
+    fresh.power_opc(False)
+
+    print("revalidation: commands: %d" % (device.commands - commands))
+    assert device.commands - commands == 1
+
+    print("-")
+    print(mcu)
+
+finally:
+    Bus.restore()
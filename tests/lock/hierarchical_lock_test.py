@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+counts cross-process lock acquisitions for ADS1115 conversions, with and without a transaction, against the in-process
+simulator
+"""
+
+import threading
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.bus.bus import Bus
+from scs_dfe.bus.bus_profiler import BusProfiler
+
+from scs_dfe.gas.afe.ads1115 import ADS1115
+
+from scs_dfe.lock.hierarchical_lock import HierarchicalLock
+
+from scs_dfe.sim.sim_ads1115 import SimADS1115
+from scs_dfe.sim.sim_i2c import SimI2C
+
+from scs_host.lock.lock_timeout import LockTimeout
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def convert(adcs, iterations):
+    for _ in range(iterations):
+        for adc in adcs:
+            adc.start_conversion(ADS1115.MUX_A3_GND, ADS1115.GAIN_2p048)
+
+        time.sleep(0.002)
+
+        for adc in adcs:
+            adc.read_conversion()
+
+
+def file_locks(report):
+    return sum(entry.count for _, _, entry in report.entries(operation='lock'))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sensors = SimI2C()
+sensors.attach(SimADS1115(ADS1115.ADDR_WRK))
+sensors.attach(SimADS1115(ADS1115.ADDR_AUX))
+
+Bus.install(sensors=sensors)
+
+try:
+    wrk = ADS1115(ADS1115.ADDR_WRK, ADS1115.RATE_860)
+    aux = ADS1115(ADS1115.ADDR_AUX, ADS1115.RATE_860)
+
+    # per register access...
+    BusProfiler.enable()
+    convert((wrk, aux), 10)
+    print("without transaction: file locks:%d" % file_locks(BusProfiler.disable()))
+
+    # per transaction...
+    BusProfiler.enable()
+
+    with HierarchicalLock.transaction(wrk.lock_name, aux.lock_name, timeout=wrk.lock_timeout):
+        convert((wrk, aux), 10)
+
+    print("with transaction: file locks:%d" % file_locks(BusProfiler.disable()))
+    print("depth after transaction: %d" % HierarchicalLock.depth(wrk.lock_name))
+    print("-")
+
+    # surplus release within a transaction...
+    with HierarchicalLock.transaction(wrk.lock_name, timeout=wrk.lock_timeout):
+        wrk.release_lock()
+        print("depth after surplus release: %d" % HierarchicalLock.depth(wrk.lock_name))
+
+    # release of a name that is not held...
+    HierarchicalLock.release(wrk.lock_name)
+    print("depth after unheld release: %d" % HierarchicalLock.depth(wrk.lock_name))
+
+    print("-")
+
+    # contention between threads...
+    HierarchicalLock.reset_stats()
+
+    def worker():
+        for _ in range(5):
+            with HierarchicalLock.transaction(wrk.lock_name, aux.lock_name, timeout=wrk.lock_timeout):
+                convert((wrk, aux), 1)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    for name, stats in sorted(HierarchicalLock.all_stats().items()):
+        print("%s: %s" % (name, JSONify.dumps(stats)))
+
+    print("-")
+
+    # timeout - a LockTimeout, not an OSError...
+    holding = threading.Event()
+    done = threading.Event()
+
+    def holder():
+        with HierarchicalLock.transaction(wrk.lock_name, timeout=wrk.lock_timeout):
+            holding.set()
+            done.wait()
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    holding.wait()
+
+    try:
+        HierarchicalLock.acquire(wrk.lock_name, 0.05)
+        raise AssertionError("no timeout")
+
+    except LockTimeout as ex:
+        print("timeout: %s" % ex)
+        assert not isinstance(ex, OSError)
+
+    finally:
+        done.set()
+        thread.join()
+
+finally:
+    Bus.restore()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+runs OPC and LED monitoring against the in-process simulator, first as an OPCMonitor and an LEDController, then as
+workers of a single MonitorHost, reporting the processes, RSS and CPU time of each arrangement
+"""
+
+import os
+import time
+
+from scs_core.led.led_state import LEDState
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.interface.component.io import IO
+from scs_dfe.interface.pzhb.pzhb import PZHB
+from scs_dfe.interface.pzhb.pzhb_mcu_t2_f1 import PZHBMCUt2f1
+
+from scs_dfe.led.io_led import IOLED
+from scs_dfe.led.led_controller import LEDController
+from scs_dfe.led.led_worker import LEDWorker
+
+from scs_dfe.monitor.monitor_host import MonitorHost
+
+from scs_dfe.particulate.opc_conf import OPCConf
+from scs_dfe.particulate.opc_monitor import OPCMonitor
+from scs_dfe.particulate.opc_n3.opc_n3 import OPCN3
+from scs_dfe.particulate.opc_worker import OPCWorker
+
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_mcu import SimMCU
+from scs_dfe.sim.sim_opc_n3 import SimOPCN3
+from scs_dfe.sim.sim_pca8574 import SimPCA8574
+from scs_dfe.sim.sim_spi import SimSPI
+
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+RUN_TIME = 5.0                                                      # seconds
+
+
+def descendants(pid):
+    children = {}
+
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+
+        try:
+            with open('/proc/%s/stat' % entry) as f:
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+
+        except (OSError, IndexError, ValueError):
+            continue
+
+        children.setdefault(ppid, []).append(int(entry))
+
+    found = []
+    pending = [pid]
+
+    while pending:
+        for child in children.get(pending.pop(), []):
+            found.append(child)
+            pending.append(child)
+
+    return found
+
+
+def usage(pids):
+    rss = 0                                                         # kB
+    cpu = 0                                                         # clock ticks
+
+    for pid in pids:
+        try:
+            with open('/proc/%d/status' % pid) as f:
+                rss += int([line for line in f if line.startswith('VmRSS:')][0].split()[1])
+
+            with open('/proc/%d/stat' % pid) as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+                cpu += int(fields[11]) + int(fields[12])
+
+        except (OSError, IndexError):
+            continue
+
+    return rss, cpu / os.sysconf('SC_CLK_TCK')
+
+
+def report(title, baseline, sample):
+    time.sleep(RUN_TIME)
+
+    pids = [pid for pid in descendants(os.getpid()) if pid not in baseline]
+    rss, cpu = usage(pids)
+
+    print("%s: processes:%d rss:%d kB cpu:%0.2f s" % (title, len(pids), rss, cpu))
+    print("    %s" % sample())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sensors = SimI2C()
+sensors.attach(SimMCU(PZHBMCUt2f1.DEFAULT_ADDR))
+sensors.attach(SimPCA8574(IO.ADDR, byte=0xff))
+
+Bus.install(sensors=sensors, spi_factory=SimSPI.factory(SimOPCN3()))
+
+try:
+    interface = PZHB(PZHBMCUt2f1(PZHBMCUt2f1.DEFAULT_ADDR))
+    conf = OPCConf(OPCN3.source(), 1, True, False, None)
+    led_state = LEDState('G', '0')
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # separate processes...
+
+    baseline = descendants(os.getpid())
+
+    opc_monitor = OPCMonitor(Host, OPCN3(interface, '/dev/spidev0.0', burst=True), conf)
+    led_controller = LEDController(IOLED())
+
+    opc_monitor.start()
+    led_controller.start()
+    led_controller.set_state(led_state)
+
+    try:
+        report("OPCMonitor + LEDController", baseline, opc_monitor.sample)
+
+    finally:
+        led_controller.stop()
+        opc_monitor.stop()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # one host...
+
+    baseline = descendants(os.getpid())
+
+    host = MonitorHost(OPCWorker(OPCN3(interface, '/dev/spidev0.0', burst=True), conf, Host), LEDWorker(IOLED()))
+    print(host)
+
+    host.start()
+    host.worker(LEDWorker.NAME).set_state(led_state)
+
+    try:
+        report("MonitorHost", baseline, host.worker(OPCWorker.NAME).sample)
+
+    finally:
+        host.stop()
+
+finally:
+    Bus.restore()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+compares byte-at-a-time and burst histogram reads for OPCN3, against a simulated SPI device
+"""
+
+import struct
+import time
+
+from scs_core.data.crc import modbus_crc
+
+from scs_dfe.particulate.opc_n3.opc_n3 import OPCN3
+from scs_dfe.particulate.opc_n3.opc_n3_datum import OPCN3Datum
+
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimulatedOPCN3SPI(object):
+    """
+    an OPC-N3 that responds to the check, histogram and power commands, with a fixed cost per SPI transaction
+    """
+
+    __CMD_CHECK =           0xcf
+    __CMD_READ_HISTOGRAM =  0x30
+
+    __RESPONSE_READY =      0xf3
+
+    __TX_OVERHEAD =         0.000100        # seconds per transaction
+    __BYTE_TIME =           0.000025        # seconds per byte at 326 kHz
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def histogram(cls):
+        bins = struct.pack('<24H', *range(24))
+        body = list(bins) + [1, 2, 3, 4] + list(struct.pack('<HHHH', 1000, 550, 25000, 32000)) + \
+            list(struct.pack('<fff', 1.1, 2.2, 3.3)) + [0] * 12
+
+        return body + list(struct.pack('<H', modbus_crc(body)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, corrupt_bursts=0):
+        self.__corrupt_bursts = corrupt_bursts
+        self.__payload = []
+
+        self.transactions = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        pass
+
+
+    def close(self):
+        pass
+
+
+    def xfer(self, values):
+        self.__transaction(len(values))
+
+        if values[0] == self.__CMD_CHECK:
+            self.__payload = [self.__RESPONSE_READY]
+
+        elif values[0] == self.__CMD_READ_HISTOGRAM:
+            self.__payload = self.histogram()
+
+        return [self.__RESPONSE_READY]
+
+
+    def read_bytes(self, count):
+        self.__transaction(count)
+
+        chars = (self.__payload[:count] + [0] * count)[:count]
+        self.__payload = self.__payload[count:]
+
+        if count > 1 and self.__corrupt_bursts > 0:
+            self.__corrupt_bursts -= 1
+            chars[0] ^= 0xff
+
+        return chars
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __transaction(self, count):
+        self.transactions += 1
+        time.sleep(self.__TX_OVERHEAD + count * self.__BYTE_TIME)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def run(title, opc, spi, iterations=3):
+    opc._spi = spi
+
+    start_time = time.time()
+
+    for _ in range(iterations):
+        datum = opc.sample()
+
+        if datum.bins != list(range(24)):
+            raise ValueError(datum)
+
+    elapsed = (time.time() - start_time) / iterations
+
+    print("%s: elapsed:%0.3f transactions:%d burst:%s" % (title, elapsed, spi.transactions / iterations, opc.burst))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+print("frame: %d bytes" % OPCN3Datum.CHARS)
+print("-")
+
+run("byte-at-a-time", OPCN3(None, Host.opc_spi_dev_path()), SimulatedOPCN3SPI())
+run("burst", OPCN3(None, Host.opc_spi_dev_path(), burst=True), SimulatedOPCN3SPI())
+run("burst 4 chunks", OPCN3(None, Host.opc_spi_dev_path(), burst=True, burst_chunk_size=22), SimulatedOPCN3SPI())
+run("burst fallback", OPCN3(None, Host.opc_spi_dev_path(), burst=True), SimulatedOPCN3SPI(corrupt_bursts=1))
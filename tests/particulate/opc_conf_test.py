@@ -6,6 +6,8 @@ Created on 23 Nov 2019
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
+import json
+
 from scs_core.data.json import JSONify
 
 from scs_dfe.particulate.opc_conf import OPCConf
@@ -22,6 +24,13 @@ print("-")
 print(JSONify.dumps(conf.as_json()))
 print("-")
 
+burst_conf = OPCConf("N3", 10, True, False, None, burst=True, burst_chunk_size=16)
+jstr = JSONify.dumps(burst_conf.as_json())
+print(jstr)
+
+assert OPCConf.construct_from_jdict(json.loads(jstr)) == burst_conf
+print("-")
+
 # conf.save(Host)
 conf = OPCConf.load(Host)
 print(conf)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import random
+import struct
+import time
+
+from scs_core.data.crc import modbus_crc
+from scs_core.data.datum import Decode
+from scs_core.data.json import JSONify
+
+from scs_dfe.particulate.opc_n2.opc_n2_datum import OPCN2Datum
+from scs_dfe.particulate.opc_n3.opc_n3_datum import OPCN3Datum
+from scs_dfe.particulate.opc_r1.opc_r1_datum import OPCR1Datum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def n3_frame():
+    chars = [random.randint(0, 255) for _ in range(52)]
+    chars += list(struct.pack('<4H3f', 450, 550, 26000, 30000, *[random.uniform(0, 20) for _ in range(3)]))
+    chars += [0] * 12
+
+    return chars + list(struct.pack('<H', modbus_crc(chars)))
+
+
+def n3_legacy(chars):
+    bins = [Decode.unsigned_int(chars[i:i + 2], '<') for i in range(0, 48, 2)]
+
+    raw_period = Decode.unsigned_int(chars[52:54], '<')
+    int_sfr = Decode.unsigned_int(chars[54:56], '<')
+    raw_temp = Decode.unsigned_int(chars[56:58], '<')
+    raw_humid = Decode.unsigned_int(chars[58:60], '<')
+
+    pm1 = Decode.float(chars[60:64], '<')
+    pm2p5 = Decode.float(chars[64:68], '<')
+    pm10 = Decode.float(chars[68:72], '<')
+
+    actual = Decode.unsigned_int(chars[84:86], '<')
+
+    return bins + list(chars[48:52]) + [raw_period, int_sfr, raw_temp, raw_humid, pm1, pm2p5, pm10, actual]
+
+
+def timed(func, frames):
+    start_time = time.time()
+
+    for chars in frames:
+        func(chars)
+
+    return (time.time() - start_time) * 1e6 / len(frames)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+frames = [n3_frame() for _ in range(10000)]
+
+print(OPCN3Datum.FRAME)
+print("-")
+
+# equivalence...
+mismatches = [chars for chars in frames if list(OPCN3Datum.FRAME.values(chars)) != n3_legacy(chars)]
+print("mismatches: %d" % len(mismatches))
+
+datum = OPCN3Datum.construct(frames[0])
+print(JSONify.dumps(datum))
+print("-")
+
+# per-frame decode cost...
+print("legacy decode: %0.1f us" % timed(n3_legacy, frames))
+print("frame decode: %0.1f us" % timed(OPCN3Datum.FRAME.values, frames))
+print("construct: %0.1f us" % timed(OPCN3Datum.construct, frames))
+print("-")
+
+# batch...
+start_time = time.time()
+columns = OPCN3Datum.FRAME.columns(frames)
+print("columns: %0.1f us per frame" % ((time.time() - start_time) * 1e6 / len(frames)))
+print("pm1[:3]: %s" % columns['pm1'][:3])
+print("bins[0]: %s" % columns['bins'][0])
+print("-")
+
+# other models: layout sizes...
+print("N2: %s" % OPCN2Datum.FRAME)
+print("R1: %s" % OPCR1Datum.FRAME)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import random
+import time
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_core.particulate.opc_datum import OPCDatum
+
+from scs_dfe.particulate.opc_history import OPCHistory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def datum_at(timestamp):
+    rec = LocalizedDatetime.construct_from_timestamp(timestamp).utc()
+    bins = [random.randint(0, 100) for _ in range(24)]
+
+    return OPCDatum('N3', rec, random.uniform(0, 10), random.uniform(0, 20), random.uniform(0, 40), 9.9, bins,
+                    11, 22, 33, 44, sfr=5.5)
+
+
+def brute_force(data, period):
+    end = data[-1].rec.timestamp()
+    window = [datum for datum in data if datum.rec.timestamp() > end - period]
+
+    return (len(window), sum(datum.pm1 for datum in window) / len(window),
+            min(datum.pm1 for datum in window), max(datum.pm10 for datum in window))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+history = OPCHistory(max_length=100, periods=(60, 300))
+print(history)
+print("-")
+
+t0 = time.time()
+data = [datum_at(t0 + i * 10) for i in range(200)]
+
+for datum in data:
+    history.append(datum)
+
+print(history)
+print("-")
+
+for period in history.periods:
+    report = history.aggregate(period)
+    expected = brute_force(data, period)
+
+    print("%s: %s" % (period, JSONify.dumps(report)))
+    print("expected count:%s pm1 mean:%0.3f pm1 min:%0.3f pm10 max:%0.3f" % expected)
+    print("-")
+
+# late window, back-filled from retained history...
+report = history.aggregate(120)
+print("120: count:%s expected:%s" % (report.count, brute_force(data, 120)[0]))
+print("-")
+
+start = data[-5].rec
+print("data since %s: %s" % (start.as_iso8601(), len(history.data(start=start))))
+print("-")
+
+# timing...
+iterations = 10000
+timing_data = [datum_at(t0 + (len(data) + i) * 10) for i in range(iterations)]
+
+start_time = time.time()
+
+for datum in timing_data:
+    history.append(datum)
+
+print("append: %0.1f us" % ((time.time() - start_time) * 1e6 / iterations))
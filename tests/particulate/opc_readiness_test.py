@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+learning the ready latency of a simulated device
+"""
+
+import json
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.particulate.opc_readiness import OPCReadiness
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimulatedCommand(object):
+    """
+    a command that becomes ready a fixed time after it is issued
+    """
+
+    def __init__(self, latency):
+        self.__latency = latency
+        self.__issued = None
+
+        self.polls = 0
+
+
+    def issue(self):
+        self.__issued = time.time()
+
+
+    def is_ready(self):
+        self.polls += 1
+
+        return time.time() - self.__issued >= self.__latency
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+readiness = OPCReadiness.construct_from_jdict(None)
+print(readiness)
+print("-")
+
+command = SimulatedCommand(0.012)
+
+for i in range(10):
+    command.polls = 0
+    command.issue()
+
+    latency = readiness.wait('0x30', command.is_ready, timeout=1.0)
+
+    print("%d: latency:%0.4f polls:%d typical:%0.4f" % (i, latency, command.polls, readiness.latency('0x30')))
+
+print("-")
+
+print("histogram: %s" % JSONify.dumps(readiness.histogram('0x30')))
+print("-")
+
+jstr = JSONify.dumps(readiness)
+print(jstr)
+print("-")
+
+readiness = OPCReadiness.construct_from_jdict(json.loads(jstr))
+print(readiness)
+print("-")
+
+try:
+    readiness.wait('busy', lambda: False, timeout=0.1)
+
+except TimeoutError as ex:
+    print("timeout: %s" % repr(ex))
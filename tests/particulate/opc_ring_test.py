@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_core.climate.sht_datum import SHTDatum
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_core.particulate.opc_datum import OPCDatum
+
+from scs_dfe.particulate.opc_ring import OPCRing
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ring = OPCRing.create(OPCDatum, capacity=4)
+print(ring)
+print("latest: %s" % ring.latest())
+print("-")
+
+start = LocalizedDatetime.now().utc()
+
+for i in range(6):
+    now = LocalizedDatetime.now().utc()
+    datum = OPCDatum('N3', now, i, 22, 33, 9.1, [1, 2, 3, 4, 5, 6, 7, 8, 9], 11, 22, 33, 44, sfr=5.5,
+                     sht=SHTDatum(50.0, 21.0))
+
+    ring.write(datum)
+    time.sleep(0.1)
+
+print(ring)
+print("-")
+
+# reader...
+reader = OPCRing.attach(ring.name, OPCDatum)
+
+latest = reader.latest()
+print("latest: %s" % JSONify.dumps(latest))
+print("-")
+
+assert latest.bins == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+assert all(isinstance(count, int) for count in latest.bins)
+
+print("history: %s" % [datum.pm1 for datum in reader.history()])
+print("history since start: %s" % [datum.pm1 for datum in reader.history(start=start)])
+print("-")
+
+# timing...
+iterations = 1000
+start_time = time.time()
+
+for _ in range(iterations):
+    reader.latest()
+
+print("latest: %0.1f us" % ((time.time() - start_time) * 1e6 / iterations))
+print("-")
+
+ring.set_status(OPCRing.STATUS_EMPTY)
+print("empty: %s" % reader.latest())
+
+reader.close()
+ring.close()
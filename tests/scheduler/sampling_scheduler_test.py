@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+samples several drivers against the in-process simulator, sequentially and with the SamplingScheduler
+"""
+
+import asyncio
+import time
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.climate.icp10101 import ICP10101
+from scs_dfe.climate.sht31 import SHT31
+
+from scs_dfe.gas.afe.ads1115 import ADS1115
+from scs_dfe.gas.isi.elc_dsi_t1 import ElcDSIt1
+
+from scs_dfe.particulate.opc_n3.opc_n3 import OPCN3
+
+from scs_dfe.scheduler.sampling_scheduler import SamplingScheduler
+
+from scs_dfe.sim.sim_ads1115 import SimADS1115
+from scs_dfe.sim.sim_dsi import SimDSI
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_icp10101 import SimICP10101
+from scs_dfe.sim.sim_opc_n3 import SimOPCN3
+from scs_dfe.sim.sim_sht31 import SimSHT31
+from scs_dfe.sim.sim_spi import SimSPI
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+async def stream(scheduler, count):
+    start_time = time.time()
+
+    async for record in scheduler.run(0.5, count=count):
+        print("%0.3f: %s" % (time.time() - start_time, list(record.keys())))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sensors = SimI2C(bus=1, latency=0.000100, byte_time=0.000025)
+
+sensors.attach(SimADS1115(ADS1115.ADDR_WRK, {ADS1115.MUX_A3_GND: 0.310}))
+sensors.attach(SimSHT31(0x44, temp=22.5, humid=45.0))
+sensors.attach(SimICP10101(ICP10101.DEFAULT_ADDR))
+sensors.attach(SimDSI(ElcDSIt1.DEFAULT_ADDR, v_wrk=0.320, v_aux=0.280))
+
+opc_bus = SimSPI(SimOPCN3(), latency=0.000100, byte_time=0.000025)
+
+Bus.install(sensors=sensors, spi_factory=lambda dev_path, mode, max_speed: opc_bus)
+
+try:
+    sht31 = SHT31(0x44)
+    icp10101 = ICP10101(ICP10101.DEFAULT_ADDR)
+    icp10101.init()
+
+    ads1115 = ADS1115(ADS1115.ADDR_WRK, ADS1115.RATE_8)
+    dsi = ElcDSIt1(ElcDSIt1.DEFAULT_ADDR)
+    opc = OPCN3(None, '/dev/spidev0.0', burst=True)
+
+    def gas(sht_datum):
+        dsi.start_conversion()
+        return sht_datum, dsi.read_conversion_voltage()
+
+    samplers = (('climate', sht31.sample, ()),
+                ('pressure', icp10101.sample, ()),
+                ('pt1000', lambda: ads1115.convert(ADS1115.MUX_A3_GND, ADS1115.GAIN_2p048), ()),
+                ('gas', gas, ('climate', )),
+                ('particulates', opc.sample, ()))
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # sequential...
+
+    start_time = time.time()
+    data = {}
+
+    for name, sampler, depends in samplers:
+        data[name] = sampler(*[data[dependency] for dependency in depends])
+
+    print("sequential: elapsed: %0.3f" % (time.time() - start_time))
+    print("-")
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # scheduler...
+
+    scheduler = SamplingScheduler()
+
+    for name, sampler, depends in samplers:
+        scheduler.add(name, sampler, *depends)
+
+    scheduler.open()
+    print(scheduler)
+
+    try:
+        start_time = time.time()
+        record = scheduler.sample()
+        elapsed = time.time() - start_time
+
+        for name, datum in record.items():
+            print("%s: %s" % (name, datum))
+
+        print("-")
+        print("scheduler: elapsed: %0.3f sum of latencies: %0.3f" % (elapsed, sum(scheduler.latencies.values())))
+        print("latencies: %s" % ', '.join("%s:%0.3f" % item for item in scheduler.latencies.items()))
+        print("-")
+
+        assert not [datum for datum in record.values() if isinstance(datum, Exception)]
+        assert elapsed < sum(scheduler.latencies.values())
+
+        asyncio.run(stream(scheduler, 3))
+
+    finally:
+        scheduler.close()
+
+    print("installed: %s" % Bus.is_installed())
+
+finally:
+    Bus.restore()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+samples each driver against the in-process simulator, reporting latency and bus transactions per sample
+"""
+
+import time
+
+from scs_core.gas.scd30.scd30_baseline import SCD30Baseline
+from scs_core.gas.sensor_baseline import SensorBaseline
+
+from scs_dfe.bus.bus import Bus
+
+from scs_dfe.climate.icp10101 import ICP10101
+from scs_dfe.climate.sht31 import SHT31
+
+from scs_dfe.gas.afe.ads1115 import ADS1115
+from scs_dfe.gas.afe.mcp3425 import MCP3425
+from scs_dfe.gas.isi.elc_dsi_t1 import ElcDSIt1
+from scs_dfe.gas.scd30.scd30 import SCD30
+
+from scs_dfe.particulate.opc_n3.opc_n3 import OPCN3
+from scs_dfe.particulate.sps_30.sps_30 import SPS30
+
+from scs_dfe.sim.sim_ads1115 import SimADS1115
+from scs_dfe.sim.sim_dsi import SimDSI
+from scs_dfe.sim.sim_i2c import SimI2C
+from scs_dfe.sim.sim_icp10101 import SimICP10101
+from scs_dfe.sim.sim_mcp342x import SimMCP342X
+from scs_dfe.sim.sim_opc_n3 import SimOPCN3
+from scs_dfe.sim.sim_pca8574 import SimPCA8574
+from scs_dfe.sim.sim_scd30 import SimSCD30
+from scs_dfe.sim.sim_sht31 import SimSHT31
+from scs_dfe.sim.sim_spi import SimSPI
+from scs_dfe.sim.sim_sps30 import SimSPS30
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def run(title, bus, func, iterations=5):
+    bus.reset_counts()
+    start_time = time.time()
+
+    for _ in range(iterations):
+        result = func()
+
+    elapsed = (time.time() - start_time) / iterations
+
+    print("%s: elapsed:%0.4f transactions:%0.1f bytes:%0.1f" %
+          (title, elapsed, bus.transactions / iterations, bus.bytes / iterations))
+    print("    %s" % str(result))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sensors = SimI2C(bus=1, latency=0.000100, byte_time=0.000025)       # about 100 kHz, with transaction overhead
+
+sensors.attach(SimADS1115(ADS1115.ADDR_WRK, {ADS1115.MUX_A3_GND: 0.310}))
+sensors.attach(SimADS1115(ADS1115.ADDR_AUX, {ADS1115.MUX_A3_GND: 0.290}))
+sensors.attach(SimMCP342X(MCP3425.ADDR, 0.110))
+sensors.attach(SimSHT31(0x44, temp=22.5, humid=45.0))
+sensors.attach(SimICP10101(ICP10101.DEFAULT_ADDR))
+sensors.attach(SimSCD30(0x61, co2=415.0))
+sensors.attach(SimPCA8574(0x70, byte=0x00))                         # PCA9543A switch
+sensors.attach(SimSPS30(SPS30.DEFAULT_ADDR))
+sensors.attach(SimDSI(ElcDSIt1.DEFAULT_ADDR, v_wrk=0.320, v_aux=0.280))
+
+opc_device = SimOPCN3()
+opc_bus = SimSPI(opc_device, latency=0.000100, byte_time=0.000025)
+
+Bus.install(sensors=sensors, spi_factory=lambda dev_path, mode, max_speed: opc_bus)
+print("installed: %s" % Bus.is_installed())
+print(sensors)
+print("-")
+
+try:
+    ads1115 = ADS1115(ADS1115.ADDR_WRK, ADS1115.RATE_860)
+    run("ADS1115", sensors, lambda: ads1115.convert(ADS1115.MUX_A3_GND, ADS1115.GAIN_2p048))
+
+    mcp3425 = MCP3425(MCP3425.GAIN_1, MCP3425.RATE_240)
+    run("MCP3425", sensors, mcp3425.convert)
+
+    sht31 = SHT31(0x44)
+    run("SHT31", sensors, sht31.sample)
+
+    icp10101 = ICP10101(ICP10101.DEFAULT_ADDR)
+    icp10101.init()
+    run("ICP10101", sensors, icp10101.sample)
+
+    scd30 = SCD30(SCD30Baseline(SensorBaseline(None, 0)))
+    run("SCD30", sensors, scd30.sample)
+
+    sps30 = SPS30(None, SPS30.DEFAULT_ADDR)
+    run("SPS30", sensors, sps30.sample)
+
+    dsi = ElcDSIt1(ElcDSIt1.DEFAULT_ADDR)
+    run("ElcDSIt1", sensors, lambda: (dsi.start_conversion(), dsi.read_conversion_voltage())[1])
+
+    opc = OPCN3(None, '/dev/spidev0.0', burst=True)
+    run("OPCN3", opc_bus, opc.sample)
+
+finally:
+    Bus.restore()
+
+print("-")
+print("installed: %s" % Bus.is_installed())